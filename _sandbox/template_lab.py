@@ -4,10 +4,10 @@ from pathlib import Path
 
 import cv2
 import numpy as np
-import pyautogui
 
 from core.paths import IMAGES_DIR, CONFIG_DIR
 from core.bot_offsets import load_areas, apply_offset
+from vision.grabbers import grab_box_rgb, grab_rgb
 
 METHODS = {
     "TM_CCOEFF": cv2.TM_CCOEFF,
@@ -45,14 +45,12 @@ def _color_score(template_rgb: np.ndarray, matched_rgb: np.ndarray) -> float:
 
 
 def _grab_region_rgb(box) -> np.ndarray:
-    x1, y1, x2, y2 = box
-    w, h = x2 - x1, y2 - y1
-    return np.array(pyautogui.screenshot(region=(x1, y1, w, h)))  # RGB
+    return grab_box_rgb(box)  # RGB
 
 
 def _crop_interactive() -> tuple[np.ndarray, dict]:
     # full screenshot -> OpenCV ROI select
-    shot = np.array(pyautogui.screenshot())
+    shot = grab_rgb()
     bgr = cv2.cvtColor(shot, cv2.COLOR_RGB2BGR)
 
     roi = cv2.selectROI("Crop (drag, ENTER=save, ESC=cancel)", bgr, showCrosshair=True, fromCenter=False)
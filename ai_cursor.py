@@ -9,10 +9,14 @@ from __future__ import annotations
 import time
 import random
 from dataclasses import dataclass
-from typing import Optional, Tuple, Literal
+from typing import TYPE_CHECKING, Optional, Tuple, Literal
 
-import pyautogui
-from pynput.mouse import Controller, Button
+from core.lazy_import import lazy_module
+pyautogui = lazy_module("pyautogui")
+mouse = lazy_module("pynput.mouse")  # pas bij de eerste beweging/klik geladen
+
+if TYPE_CHECKING:
+    from pynput.mouse import Controller
 # === END IMPORTS ===
 
 
@@ -89,7 +93,7 @@ def move_cursor(
     Returns:
         Eindpositie (x, y)
     """
-    ctrl = controller or Controller()
+    ctrl = controller or mouse.Controller()
 
     x2, y2 = int(pos[0]), int(pos[1])
     x1, y1 = ctrl.position
@@ -116,13 +120,13 @@ def click(
     controller: Optional[Controller] = None,
 ) -> None:
     """Klikt met left/right muisknop met optionele delay."""
-    ctrl = controller or Controller()
+    ctrl = controller or mouse.Controller()
 
     time.sleep(float(config.delay))
     if config.button == "right":
-        ctrl.click(Button.right, 1)
+        ctrl.click(mouse.Button.right, 1)
     else:
-        ctrl.click(Button.left, 1)
+        ctrl.click(mouse.Button.left, 1)
 # === END CORE LOGIC ===
 
 
@@ -138,7 +142,7 @@ def move_and_click(
     controller: Optional[Controller] = None,
 ) -> Point:
     """Beweeg naar pos en klik. Returns eindpositie."""
-    ctrl = controller or Controller()
+    ctrl = controller or mouse.Controller()
     end_pos = move_cursor(pos, config=motion, controller=ctrl)
     click(config=click_cfg, controller=ctrl)
     return end_pos
@@ -159,7 +163,7 @@ if __name__ == "__main__":
     margin = max(20, min(w, h) // 10)
 
     motion = CursorMotionConfig(duration=0.55, fps=144)
-    ctrl = Controller()
+    ctrl = mouse.Controller()
 
     _log(f"{ICON_ACTION} Scherm: {w}x{h} | margin={margin}")
     for i in range(4):
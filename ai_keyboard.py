@@ -5,9 +5,20 @@
 # =========================
 import random
 import time
-from pynput.keyboard import Controller, Key
 
-keyboard = Controller()
+try:
+    from pynput.keyboard import Controller, Key
+except ImportError:  # headless (geen display): alleen bruikbaar via set_keyboard(), zie core/sim.py
+    Controller = Key = None
+
+keyboard = Controller() if Controller is not None else None
+
+
+def set_keyboard(controller):
+    """Stuur alle toetsen naar controller (bv. core.sim.InputRecorder). Returns de vorige."""
+    global keyboard
+    prev, keyboard = keyboard, controller
+    return prev
 
 # =========================
 # === BASIC KEY ACTIONS ===
@@ -112,6 +123,8 @@ def _make_mistake(ch: str) -> str:
 
 
 def _resolve_key(key):
+    if Key is None:
+        return str(key).lower() if len(str(key)) > 1 else key
     if isinstance(key, Key):
         return key
 
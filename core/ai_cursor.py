@@ -1,18 +1,26 @@
 ﻿# === START BOOTSTRAP ===
 # WAT: Module voor muisbewegingen + klikken (primitives).
 # WAAROM: Houd input-gedrag centraal en herbruikbaar; wrappers combineren primitives.
+from __future__ import annotations
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
 # === END BOOTSTRAP ===
 
 
 # === START IMPORTS ===
-from __future__ import annotations
 import time
 import random
 from dataclasses import dataclass
-from typing import Optional, Tuple, Literal
+from typing import TYPE_CHECKING, Optional, Tuple, Literal
+
+from core import tracing
 
-import pyautogui
-from pynput.mouse import Controller, Button
+if TYPE_CHECKING:
+    from pynput.mouse import Controller
 # === END IMPORTS ===
 
 
@@ -28,6 +36,12 @@ ICON_MOVE = "🧭"
 
 MouseButton = Literal["left", "right"]
 Point = Tuple[int, int]
+
+# set_mouse() override (sim/replay recorder) wint van elke meegegeven controller
+_MOUSE_OVERRIDE = None
+_DEFAULT_MOUSE: Optional[Controller] = None
+# pynput.mouse pas bij de eerste echte muisactie laden; False = niet beschikbaar
+_PYNPUT_MOUSE = None
 # === END CONSTANTS ===
 
 
@@ -70,6 +84,47 @@ def _compute_steps(duration: float, fps: int, min_steps: int) -> int:
 
 def _log(msg: str) -> None:
     print(msg)
+
+
+def _pynput_mouse():
+    """pynput.mouse of None (headless/geen display: alleen bruikbaar via set_mouse(), zie core/sim.py)."""
+    global _PYNPUT_MOUSE
+    if _PYNPUT_MOUSE is None:
+        try:
+            from pynput import mouse
+        except ImportError:
+            mouse = False
+        _PYNPUT_MOUSE = mouse
+    return _PYNPUT_MOUSE or None
+
+
+def _button(name: str):
+    mouse = _pynput_mouse()
+    if mouse is None:
+        return name
+    return mouse.Button.right if name == "right" else mouse.Button.left
+
+
+def set_mouse(controller) -> Optional[object]:
+    """Stuur alle muis output naar controller (bv. core.sim.InputRecorder); None = terug naar pynput. Returns de vorige."""
+    global _MOUSE_OVERRIDE
+    prev, _MOUSE_OVERRIDE = _MOUSE_OVERRIDE, controller
+    return prev
+
+
+def get_mouse(controller: Optional[Controller] = None):
+    """Override (sim) > meegegeven controller > gedeelde pynput Controller."""
+    global _DEFAULT_MOUSE
+    if _MOUSE_OVERRIDE is not None:
+        return _MOUSE_OVERRIDE
+    if controller is not None:
+        return controller
+    if _DEFAULT_MOUSE is None:
+        mouse = _pynput_mouse()
+        if mouse is None:
+            raise RuntimeError("pynput niet beschikbaar (headless?); gebruik core.sim.sim_mode of set_mouse()")
+        _DEFAULT_MOUSE = mouse.Controller()
+    return _DEFAULT_MOUSE
 # === END HELPERS ===
 
 
@@ -89,7 +144,7 @@ def move_cursor(
     Returns:
         Eindpositie (x, y)
     """
-    ctrl = controller or Controller()
+    ctrl = get_mouse(controller)
 
     x2, y2 = int(pos[0]), int(pos[1])
     x1, y1 = ctrl.position
@@ -116,13 +171,10 @@ def click(
     controller: Optional[Controller] = None,
 ) -> None:
     """Klikt met left/right muisknop met optionele delay."""
-    ctrl = controller or Controller()
+    ctrl = get_mouse(controller)
 
     time.sleep(float(config.delay))
-    if config.button == "right":
-        ctrl.click(Button.right, 1)
-    else:
-        ctrl.click(Button.left, 1)
+    ctrl.click(_button(config.button), 1)
 # === END CORE LOGIC ===
 
 
@@ -138,9 +190,11 @@ def move_and_click(
     controller: Optional[Controller] = None,
 ) -> Point:
     """Beweeg naar pos en klik. Returns eindpositie."""
-    ctrl = controller or Controller()
-    end_pos = move_cursor(pos, config=motion, controller=ctrl)
-    click(config=click_cfg, controller=ctrl)
+    ctrl = get_mouse(controller)
+    with tracing.span(tracing.STAGE_MOVE):
+        end_pos = move_cursor(pos, config=motion, controller=ctrl)
+    with tracing.span(tracing.STAGE_CLICK):
+        click(config=click_cfg, controller=ctrl)
     return end_pos
 # === END API ===
 
@@ -150,6 +204,8 @@ def move_and_click(
 # WAAROM: Snel checken of input werkt zonder externe afhankelijkheden.
 
 if __name__ == "__main__":
+    import pyautogui
+
     _log(f"\n🧪 ai_cursor SELF TEST\n{ICON_WARN} Niet bewegen met je muis 🙂\n")
     time.sleep(2)
 
@@ -159,7 +215,7 @@ if __name__ == "__main__":
     margin = max(20, min(w, h) // 10)
 
     motion = CursorMotionConfig(duration=0.55, fps=144)
-    ctrl = Controller()
+    ctrl = get_mouse()
 
     _log(f"{ICON_ACTION} Scherm: {w}x{h} | margin={margin}")
     for i in range(4):
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+# 🔧 BOOTSTRAP: project-root eerst
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.bot_offsets import AREAS_FILE, BOT_OFFSETS, AreasDict, Coords, _flatten_areas, apply_offset
+from core.json_cache import DEFAULT_CHECK_INTERVAL_SEC, JsonFileCache
+from core.paths import CONFIG_DIR
+
+Box = Tuple[int, int, int, int]   # (x1, y1, x2, y2) schermcoördinaten
+Rect = Tuple[int, int, int, int]  # (x, y, w, h)
+
+OFFSETS_FILE = Path(CONFIG_DIR) / "offsets.json"
+
+
+# ============================================================
+# ===== START REGISTRY =======================================
+# ============================================================
+class AreaRegistry:
+    """
+    areas.json 1x parsen en per bot de boxen vooraf uitrekenen.
+
+    - box()/rect(): dict lookup, geen file read / _to_int / apply_offset per call
+    - lookup is eerst exact, daarna case-insensitive via een vooraf gebouwde index
+    - hot reload: areas.json en offsets.json worden (hooguit 1x per interval)
+      op mtime gecheckt; bij wijziging wordt alles opnieuw opgebouwd
+
+    Offsets: BOT_OFFSETS is leidend (zelfde als apply_offset), bots die alleen
+    in config/offsets.json staan worden aangevuld.
+    """
+
+    def __init__(
+        self,
+        areas_file: Path = AREAS_FILE,
+        offsets_file: Path = OFFSETS_FILE,
+        check_interval: float = DEFAULT_CHECK_INTERVAL_SEC,
+    ):
+        # strict: een kapotte areas/offsets file bij start is een fout, geen lege registry
+        self._areas_file = JsonFileCache(areas_file, check_interval, strict=True)
+        self._offsets_file = JsonFileCache(offsets_file, check_interval, strict=True)
+        self.check_interval = float(check_interval)
+        self._lock = threading.Lock()
+        self._built: Tuple[int, int] = (-1, -1)
+        self._next_check = 0.0
+
+        self._areas: AreasDict = {}
+        self._index: Dict[str, str] = {}
+        self._offsets: Dict[int, Tuple[int, int]] = {}
+        self._boxes: Dict[Tuple[str, int], Box] = {}
+        self._rects: Dict[Tuple[str, int], Rect] = {}
+
+    # ---------- build ----------
+    def _ensure(self) -> None:
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        with self._lock:
+            raw_areas = self._areas_file.data()
+            raw_offsets = self._offsets_file.data()
+            stamp = (self._areas_file.version, self._offsets_file.version)
+            if stamp != self._built:
+                self._rebuild(raw_areas, raw_offsets)
+                self._built = stamp
+            self._next_check = now + self.check_interval
+
+    def _rebuild(self, raw_areas: Dict[str, Any], raw_offsets: Dict[str, Any]) -> None:
+        areas = _flatten_areas(raw_areas)
+
+        offsets: Dict[int, Tuple[int, int]] = {}
+        for k, v in raw_offsets.items():
+            try:
+                offsets[int(k)] = (int(v[0]), int(v[1]))
+            except (TypeError, ValueError, IndexError):
+                continue
+        offsets.update(BOT_OFFSETS)
+
+        boxes: Dict[Tuple[str, int], Box] = {}
+        rects: Dict[Tuple[str, int], Rect] = {}
+        for name, (x1, y1, x2, y2) in areas.items():
+            for bot_id, (ox, oy) in offsets.items():
+                boxes[(name, bot_id)] = (x1 + ox, y1 + oy, x2 + ox, y2 + oy)
+                rects[(name, bot_id)] = (x1 + ox, y1 + oy, x2 - x1, y2 - y1)
+
+        index: Dict[str, str] = {}
+        for name in areas:
+            index.setdefault(name.lower(), name)
+
+        # pas na volledige build wisselen zodat lezers nooit een halve staat zien
+        self._areas, self._index, self._offsets = areas, index, offsets
+        self._boxes, self._rects = boxes, rects
+
+    # ---------- lookup ----------
+    def resolve(self, area_name: str) -> Optional[str]:
+        """Echte area key (exact of case-insensitive), None als onbekend."""
+        self._ensure()
+        if area_name in self._areas:
+            return area_name
+        return self._index.get(str(area_name).lower())
+
+    def __contains__(self, area_name: str) -> bool:
+        return self.resolve(area_name) is not None
+
+    def box(self, area_name: str, bot_id: int = 1) -> Box:
+        self._ensure()
+        key = (area_name, int(bot_id))
+        b = self._boxes.get(key)
+        if b is not None:
+            return b
+        return self._box_slow(area_name, int(bot_id))
+
+    def rect(self, area_name: str, bot_id: int = 1) -> Rect:
+        self._ensure()
+        r = self._rects.get((area_name, int(bot_id)))
+        if r is not None:
+            return r
+        x1, y1, x2, y2 = self._box_slow(area_name, int(bot_id))
+        return (x1, y1, x2 - x1, y2 - y1)
+
+    def _box_slow(self, area_name: str, bot_id: int) -> Box:
+        # andere schrijfwijze of onbekende bot (offset 0,0 zoals get_offset)
+        name = self.resolve(area_name)
+        if name is None:
+            raise KeyError(f"Area niet gevonden: {area_name}")
+        b = self._boxes.get((name, bot_id))
+        if b is None:
+            x1, y1, x2, y2 = self._areas[name]
+            ox, oy = self._offsets.get(bot_id, (0, 0))
+            b = (x1 + ox, y1 + oy, x2 + ox, y2 + oy)
+        return b
+
+    def areas(self) -> AreasDict:
+        """Geflatte areas dict (gedeeld, niet muteren)."""
+        self._ensure()
+        return self._areas
+
+    def offsets(self) -> Dict[int, Tuple[int, int]]:
+        self._ensure()
+        return dict(self._offsets)
+
+    def invalidate(self) -> None:
+        """Volgende lookup leest de bestanden gegarandeerd opnieuw (bv. na area_debugger save)."""
+        self._areas_file.invalidate()
+        self._offsets_file.invalidate()
+        self._next_check = 0.0
+# ============================================================
+# ===== END REGISTRY =========================================
+# ============================================================
+
+
+_REGISTRY = AreaRegistry()
+
+
+def get_area_registry() -> AreaRegistry:
+    return _REGISTRY
+
+
+def area_box(area_name: str, bot_id: int = 1, areas: Optional[Dict[str, Coords]] = None) -> Box:
+    """
+    (x1,y1,x2,y2) met bot offset.
+    areas=None => gedeelde registry; een expliciete areas dict gaat via apply_offset (oude pad).
+    """
+    if areas is None:
+        return _REGISTRY.box(area_name, bot_id)
+    if area_name not in areas:
+        raise KeyError(f"Area niet gevonden: {area_name}")
+    x1, y1, x2, y2 = apply_offset(areas[area_name], bot_id)
+    return (x1, y1, x2, y2)
+
+
+if __name__ == "__main__":
+    reg = get_area_registry()
+    names: List[str] = list(reg.areas())
+    print(f"✅ areas: {len(names)} | bots: {sorted(reg.offsets())}")
+    for bot in (1, 2, 3, 4):
+        print(f"bot {bot} Info_Area box={reg.box('Info_Area', bot)} rect={reg.rect('Info_Area', bot)}")
+
+    n = 100_000
+    t0 = time.perf_counter()
+    for _ in range(n):
+        reg.box("Info_Area", 2)
+    print(f"⏱️ box(): {1e9 * (time.perf_counter() - t0) / n:.0f} ns/call")
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: centraal en voorspelbaar, voorkomt verborgen dependencies.
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple, Union
+import asyncio
+import weakref
+
+from core import tracing
+from core.area_registry import area_box
+from core.click_image import click_hit
+from core.template_presets_store import normalize_image_name
+from helpers.random_sleep import async_sleep, random_sleep_async, sleep_custom_async  # noqa: F401 (re-export)
+from vision.frame_capture import Frame, get_capture
+from vision.image_detection import Match, detect_image, detect_many
+from vision.wait_for import Backoff, FrameWaiter
+# === END IMPORTS ===
+
+
+# === START CONSTANTS ===
+# • WAT: executor grootte + default poll plafond.
+# • WAAROM: matchTemplate geeft de GIL vrij, dus een paar threads is genoeg voor tientallen flows.
+VISION_THREADS = 4
+MAX_POLL_SEC = 0.25
+# === END CONSTANTS ===
+
+
+# === START EXECUTORS ===
+# • WAT: thread pool voor vision + één input thread, met trace labels van de aanroeper.
+# • WAAROM: de event loop blokkeert nooit op cv2 of op een muisbeweging van ±0.75 s.
+_VISION: Optional[Executor] = None
+_INPUT: Optional[ThreadPoolExecutor] = None
+
+# per event loop één lock; de ContextVar onthoudt of deze task hem al heeft (input_lock + click erin)
+_INPUT_LOCKS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+_HOLDS_INPUT: ContextVar[bool] = ContextVar("holds_input", default=False)
+
+
+def get_executor() -> Executor:
+    global _VISION
+    if _VISION is None:
+        _VISION = ThreadPoolExecutor(max_workers=VISION_THREADS, thread_name_prefix="bot-vision")
+    return _VISION
+
+
+def set_executor(executor: Optional[Executor]) -> Optional[Executor]:
+    """Eigen executor voor vision werk (None => default thread pool). Returns de vorige."""
+    global _VISION
+    prev, _VISION = _VISION, executor
+    return prev
+
+
+def _input_executor() -> ThreadPoolExecutor:
+    global _INPUT
+    if _INPUT is None:
+        _INPUT = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bot-input")
+    return _INPUT
+
+
+def _with_context(fn: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Callable[[], Any]:
+    ctx = tracing.current_context()
+
+    def _call():
+        with tracing.trace_context(*ctx):
+            return fn(*args, **kwargs)
+
+    return _call
+
+
+async def run_vision(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """await run_vision(detect_many, {...}, bot_id=2): CPU werk in de vision executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), _with_context(fn, args, kwargs))
+
+
+@asynccontextmanager
+async def input_lock() -> AsyncIterator[None]:
+    """
+    async with input_lock():
+        await click_hit_async(hit)
+        await run_input(press_key, "enter")
+
+    Houdt de (enige) cursor vast over meerdere acties; andere flows wachten.
+    """
+    if _HOLDS_INPUT.get():
+        yield
+        return
+    loop = asyncio.get_running_loop()
+    lock = _INPUT_LOCKS.get(loop)
+    if lock is None:
+        lock = _INPUT_LOCKS[loop] = asyncio.Lock()
+    async with lock:
+        token = _HOLDS_INPUT.set(True)
+        try:
+            yield
+        finally:
+            _HOLDS_INPUT.reset(token)
+
+
+async def run_input(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Muis/keyboard actie: onder de input lock, uitgevoerd in de input thread."""
+    loop = asyncio.get_running_loop()
+    async with input_lock():
+        try:
+            return await loop.run_in_executor(_input_executor(), _with_context(fn, args, kwargs))
+        finally:
+            # scherm is na input veranderd: volgende get() gegarandeerd vers frame
+            get_capture().invalidate()
+# === END EXECUTORS ===
+
+
+# === START API ===
+# • WAT: async tegenhangers van detect_image / wait-loops / click_image.
+# • WAAROM: tientallen bot flows in één event loop, met annuleren en timeouts via asyncio.
+async def detect_image_async(
+    image_name: str,
+    area_name: str,
+    bot_id: int = 1,
+    areas: Optional[Dict[str, List[int]]] = None,
+    verbose: str = "short",
+    frame: Optional[Frame] = None,
+) -> Optional[Match]:
+    return await run_vision(detect_image, image_name, area_name, bot_id, areas, verbose, frame)
+
+
+async def detect_many_async(
+    templates: Union[Sequence[str], Dict[str, str]],
+    area_name: Optional[str] = None,
+    bot_id: int = 1,
+    areas: Optional[Dict[str, List[int]]] = None,
+    verbose: str = "off",
+    frame: Optional[Frame] = None,
+) -> Dict[str, Optional[Match]]:
+    return await run_vision(detect_many, templates, area_name, bot_id, areas, verbose, frame)
+
+
+async def wait_for_image(
+    image_name: str,
+    area_name: str,
+    bot_id: int = 1,
+    timeout: float = 10.0,
+    max_poll: float = MAX_POLL_SEC,
+) -> Optional[Match]:
+    """
+    Match zodra het template in de area staat, None na timeout.
+    Matcht alleen opnieuw als de area-pixels veranderen (vision.wait_for.FrameWaiter).
+    """
+    image_name = normalize_image_name(image_name)
+    waiter = FrameWaiter(watch=[area_box(area_name, bot_id)], backoff=Backoff(max_sec=max_poll))
+
+    def _check(frame: Frame) -> Optional[Match]:
+        return detect_image(image_name, area_name, bot_id, verbose="off", frame=frame)
+
+    return await waiter.run_async(_check, timeout=timeout, executor=get_executor())
+
+
+async def click_hit_async(hit: Optional[Match], padding: int = 2) -> Optional[Tuple[int, int]]:
+    if not hit:
+        return None
+    return await run_input(click_hit, hit, padding)
+
+
+async def click_image_async(
+    image_name: str,
+    area_name: str,
+    bot_id: int = 1,
+    padding: int = 2,
+    verbose: str = "short",
+    frame: Optional[Frame] = None,
+) -> Optional[Tuple[int, int]]:
+    """Async click_image(): detectie in de vision executor, klik geserialiseerd via de input lock."""
+    image_name = normalize_image_name(image_name)
+    hit = await detect_image_async(image_name, area_name, bot_id, verbose=verbose, frame=frame)
+    if not hit:
+        return None
+    # trace labels pas in de input thread zetten: de event loop thread delen alle flows
+    return await run_input(_labelled_click, (image_name, area_name, bot_id), hit, padding)
+
+
+def _labelled_click(labels: Tuple[str, str, int], hit: Match, padding: int) -> Optional[Tuple[int, int]]:
+    with tracing.trace_context(*labels):
+        return click_hit(hit, padding)
+
+
+def run_bots(*flows: Callable[[], Any]) -> List[Any]:
+    """
+    Sync ingang voor scripts: run_bots(lambda: assist_login_async(bot_id=1), ...)
+    Returns de resultaten per flow (exceptions worden als waarde teruggegeven).
+    """
+
+    async def _all():
+        return await asyncio.gather(*(f() for f in flows), return_exceptions=True)
+
+    return asyncio.run(_all())
+# === END API ===
+
+
+# === START CLI TEST ===
+# • WAT: veilige handmatige test zonder echt scherm of echte input.
+# • WAAROM: laat zien dat veel flows tegelijk wachten, kliks na elkaar gaan en timeouts annuleren.
+if __name__ == "__main__":
+    import time
+
+    import numpy as np
+
+    from core.bot_offsets import BOT_OFFSETS
+    from core.sim import InputRecorder, ScriptedScreen
+    from core import ai_cursor
+    from vision.compiled_template import get_compiled_template
+    from vision.grabbers import set_grabber
+
+    rng = np.random.default_rng(0)
+    rgb = rng.integers(40, 110, (1080, 1920, 3), dtype=np.uint8)
+    tpl = get_compiled_template("XP.png").rgb
+    bots = sorted(BOT_OFFSETS)
+    for b in bots:
+        x1, y1, _, _ = area_box("Info_Area", b)
+        rgb[y1 + 30:y1 + 30 + tpl.shape[0], x1 + 100:x1 + 100 + tpl.shape[1]] = tpl
+
+    recorder = InputRecorder()
+    prev_grabber = set_grabber(ScriptedScreen({"xp": rgb}, start="xp"))
+    prev_mouse = ai_cursor.set_mouse(recorder)
+
+    async def flow(i: int):
+        bot = bots[i % len(bots)]
+        hit = await wait_for_image("XP.png", "Info_Area", bot_id=bot, timeout=5.0)
+        await sleep_custom_async(0.05, 0.2)
+        # 1 klik per bot (een echte muisbeweging duurt ±0.8 s en gaat per definitie na elkaar)
+        return await click_hit_async(hit) if i < len(bots) else hit
+
+    async def main():
+        t0 = time.perf_counter()
+        targets = await asyncio.gather(*(flow(i) for i in range(40)))
+        sec = time.perf_counter() - t0
+
+        try:
+            await asyncio.wait_for(wait_for_image("Logout_ClickHereToLogout.png", "Inventory_Area", timeout=30), 0.5)
+            cancelled = False
+        except asyncio.TimeoutError:
+            cancelled = True
+        return targets, sec, cancelled
+
+    try:
+        targets, sec, cancelled = asyncio.run(main())
+    finally:
+        ai_cursor.set_mouse(prev_mouse)
+        set_grabber(prev_grabber)
+
+    ok = all(targets) and len(recorder.clicks) == len(bots)
+    print(
+        f"{'🟢' if ok else '🔴'} 40 flows in {sec:.2f}s | clicks={len(recorder.clicks)} (na elkaar via input lock) | "
+        f"timeout geannuleerd={cancelled}"
+    )
+# === END CLI TEST ===
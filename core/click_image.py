@@ -17,8 +17,9 @@ import random
 import time
 from dataclasses import replace
 
-from pynput.mouse import Controller
+from core import tracing
 from core.ai_cursor import move_and_click, CursorMotionConfig, ClickConfig
+from core.template_presets_store import normalize_image_name
 from vision.image_detection import detect_image
 
 # ============================================================
@@ -27,15 +28,9 @@ from vision.image_detection import detect_image
 DEFAULT_MOTION = CursorMotionConfig(duration=0.75, fps=85, min_duration=0.18, min_steps=22)
 DEFAULT_CLICK = ClickConfig(delay=0.09, button="left")
 
-_MOUSE = Controller()
-
 # ============================================================
 # HELPERS
 # ============================================================
-def _normalize_image_name(name: str) -> str:
-    name = (name or "").strip()
-    return name if name.lower().endswith(".png") else f"{name}.png"
-
 def _jitter(v, pct, lo, hi):
     v = v * random.triangular(1 - pct, 1 + pct, 1.0)
     return max(lo, min(hi, v))
@@ -74,14 +69,11 @@ def _center_point(hit):
 # ============================================================
 # API
 # ============================================================
-def click_image(image_name, area_name, bot_id=1, padding=2, verbose="short"):
+def click_hit(hit, padding=2):
     """
-    click_image("xp", "Info_Area", 1)
-    Altijd random klik binnen image bbox.
+    click_hit(hits["XP.png"])
+    Random klik binnen een Match die je al hebt (bv. uit detect_many).
     """
-    image_name = _normalize_image_name(image_name)
-
-    hit = detect_image(image_name=image_name, area_name=area_name, bot_id=bot_id, verbose=verbose)
     if not hit:
         return None
 
@@ -92,31 +84,45 @@ def click_image(image_name, area_name, bot_id=1, padding=2, verbose="short"):
         target,
         motion=_human_motion(DEFAULT_MOTION),
         click_cfg=_human_click(DEFAULT_CLICK),
-        controller=_MOUSE,
     )
     return target
 
 
-def click_image_center(image_name, area_name, bot_id=1, verbose="short"):
+def click_image(image_name, area_name, bot_id=1, padding=2, verbose="short", frame=None):
+    """
+    click_image("xp", "Info_Area", 1)
+    Altijd random klik binnen image bbox.
+    """
+    image_name = normalize_image_name(image_name)
+
+    hit = detect_image(image_name=image_name, area_name=area_name, bot_id=bot_id, verbose=verbose, frame=frame)
+    if not hit:
+        return None
+
+    with tracing.trace_context(image_name, area_name, bot_id):
+        return click_hit(hit, padding)
+
+
+def click_image_center(image_name, area_name, bot_id=1, verbose="short", frame=None):
     """
     click_image_center("login", "Bot_Area", 1)
     Center klik.
     """
-    image_name = _normalize_image_name(image_name)
+    image_name = normalize_image_name(image_name)
 
-    hit = detect_image(image_name=image_name, area_name=area_name, bot_id=bot_id, verbose=verbose)
+    hit = detect_image(image_name=image_name, area_name=area_name, bot_id=bot_id, verbose=verbose, frame=frame)
     if not hit:
         return None
 
     _micro_pause()
     target = _center_point(hit)
 
-    move_and_click(
-        target,
-        motion=_human_motion(DEFAULT_MOTION),
-        click_cfg=_human_click(DEFAULT_CLICK),
-        controller=_MOUSE,
-    )
+    with tracing.trace_context(image_name, area_name, bot_id):
+        move_and_click(
+            target,
+            motion=_human_motion(DEFAULT_MOTION),
+            click_cfg=_human_click(DEFAULT_CLICK),
+        )
     return target
 
 
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: centraal en voorspelbaar, voorkomt verborgen dependencies.
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+import json
+import re
+
+import numpy as np
+# === END IMPORTS ===
+
+
+# === START CONSTANTS ===
+# • WAT: record layout + chunk grootte van het binaire cursor log.
+# • WAAROM: 12 bytes per punt i.p.v. ~75 bytes JSON; vaste buffer => constant geheugen.
+CURSOR_DTYPE = np.dtype([("t", "<f8"), ("x", "<i2"), ("y", "<i2")])
+CHUNK_POINTS = 65536          # ~768 KiB buffer, 1x write per chunk
+HEADER_BYTES = 128            # vaste .npy header; shape wordt bij elke flush overschreven
+META_SUFFIX = ".meta.json"
+
+_NPY_MAGIC = b"\x93NUMPY\x01\x00"
+_I16 = np.iinfo(np.int16)
+# === END CONSTANTS ===
+
+
+# === START HELPERS ===
+# • WAT: .npy header met vaste lengte.
+# • WAAROM: bestand blijft na elke flush een geldige .npy (ook als het proces daarna crasht).
+def _npy_header(points: int) -> bytes:
+    body = f"{{'descr': {CURSOR_DTYPE.descr!r}, 'fortran_order': False, 'shape': ({int(points)},), }}"
+    pad = HEADER_BYTES - len(_NPY_MAGIC) - 2 - len(body) - 1
+    if pad < 0:
+        raise ValueError("cursor log header te lang")
+    return _NPY_MAGIC + (HEADER_BYTES - len(_NPY_MAGIC) - 2).to_bytes(2, "little") + body.encode("latin1") + b" " * pad + b"\n"
+
+
+def meta_path(path: Union[str, Path]) -> Path:
+    p = Path(path)
+    return p.with_name(p.stem + META_SUFFIX)
+# === END HELPERS ===
+
+
+# === START WRITER ===
+# • WAT: streamt punten naar een .npy bestand via een voorgealloceerde chunk buffer.
+# • WAAROM: uren opnemen zonder een Python dict per punt in RAM.
+class CursorLogWriter:
+    """
+    with CursorLogWriter("cursor_log_x.npy", meta={...}) as log:
+        log.append(t, x, y)
+
+    x/y worden geclipt op int16 (±32767 px, ruim genoeg voor multi-monitor).
+    meta (klein, JSON) staat naast het log in <naam>.meta.json.
+    """
+
+    def __init__(self, path: Union[str, Path], meta: Optional[Dict[str, Any]] = None, chunk: int = CHUNK_POINTS):
+        self.path = Path(path)
+        self.meta: Dict[str, Any] = dict(meta or {})
+        # kolom buffers: per punt 3 scalar stores, interleaven gebeurt 1x per chunk
+        size = max(1, int(chunk))
+        self._t = np.empty(size, dtype=np.float64)
+        self._x = np.empty(size, dtype=np.int16)
+        self._y = np.empty(size, dtype=np.int16)
+        self._block = np.empty(size, dtype=CURSOR_DTYPE)
+        self._n = 0
+        self.points = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._f = self.path.open("wb")
+        self._f.write(_npy_header(0))
+
+    def append(self, t: float, x: int, y: int) -> None:
+        n = self._n
+        self._t[n] = t
+        self._x[n] = x if -32768 <= x <= 32767 else min(max(int(x), _I16.min), _I16.max)
+        self._y[n] = y if -32768 <= y <= 32767 else min(max(int(y), _I16.min), _I16.max)
+        self._n = n + 1
+        if self._n == len(self._t):
+            self.flush()
+
+    def __len__(self) -> int:
+        return self.points + self._n
+
+    def extend(self, t: np.ndarray, x: np.ndarray, y: np.ndarray) -> None:
+        """Bulk variant (bv. converter); schrijft direct door zonder per-punt Python werk."""
+        self.flush()
+        block = np.empty(len(t), dtype=CURSOR_DTYPE)
+        block["t"] = t
+        block["x"] = np.clip(x, _I16.min, _I16.max)
+        block["y"] = np.clip(y, _I16.min, _I16.max)
+        self._write(block)
+
+    def _write(self, block: np.ndarray) -> None:
+        if not len(block):
+            return
+        self._f.write(block.tobytes())
+        self.points += len(block)
+        pos = self._f.tell()
+        self._f.seek(0)
+        self._f.write(_npy_header(self.points))
+        self._f.seek(pos)
+
+    def flush(self) -> None:
+        n = self._n
+        block = self._block[:n]
+        block["t"], block["x"], block["y"] = self._t[:n], self._x[:n], self._y[:n]
+        self._write(block)
+        self._n = 0
+        self._f.flush()
+
+    def close(self) -> Path:
+        if self._f.closed:
+            return self.path
+        self.flush()
+        self._f.close()
+        self.meta["points"] = self.points
+        meta_path(self.path).write_text(json.dumps(self.meta, indent=2), encoding="utf-8")
+        return self.path
+
+    def __enter__(self) -> "CursorLogWriter":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+# === END WRITER ===
+
+
+# === START READER ===
+# • WAT: log openen als memory-mapped structured array (t, x, y).
+# • WAAROM: analyse over uren data zonder alles in te lezen; kolommen zijn views (log["x"]).
+def read_cursor_log(path: Union[str, Path], mmap: bool = True) -> np.ndarray:
+    """
+    .npy  => np.memmap (mmap=True) of array in RAM
+    .json => oud formaat, wordt in RAM geparsed (zie convert_json_log voor een blijvende .npy)
+    """
+    p = Path(path)
+    if p.suffix.lower() == ".json":
+        t, x, y = _parse_json_points(p)
+        out = np.empty(len(t), dtype=CURSOR_DTYPE)
+        out["t"], out["x"], out["y"] = t, x, y
+        return out
+    return np.load(p, mmap_mode="r" if mmap else None)
+
+
+def read_meta(path: Union[str, Path]) -> Dict[str, Any]:
+    p = meta_path(path)
+    return json.loads(p.read_text(encoding="utf-8")) if p.exists() else {}
+
+
+def iter_cursor_chunks(
+    path: Union[str, Path],
+    chunk: int = CHUNK_POINTS,
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    (t, x, y) float64 blokken van max `chunk` punten, in volgorde.
+    .npy via mmap, .json regel-voor-regel: geheugen blijft O(chunk), ook bij uren data.
+    """
+    p = Path(path)
+    chunk = max(1, int(chunk))
+    if p.suffix.lower() == ".json":
+        buf = np.empty((chunk, 3), dtype=np.float64)
+        n = 0
+        for pt in _iter_json_points(p):
+            buf[n] = pt
+            n += 1
+            if n == chunk:
+                yield buf[:, 0].copy(), buf[:, 1].copy(), buf[:, 2].copy()
+                n = 0
+        if n:
+            yield buf[:n, 0].copy(), buf[:n, 1].copy(), buf[:n, 2].copy()
+        return
+
+    log = read_cursor_log(p)
+    for i in range(0, len(log), chunk):
+        block = log[i:i + chunk]
+        yield block["t"].astype(np.float64), block["x"].astype(np.float64), block["y"].astype(np.float64)
+# === END READER ===
+
+
+# === START CONVERTER ===
+# • WAT: oude cursor_log_*.json (indent=2, dict per punt) => .npy + meta.
+# • WAAROM: regel-voor-regel parsen: constant geheugen en afgebroken (half geschreven) logs blijven bruikbaar.
+_FIELD = re.compile(r'^\s*"(t|x|y)":\s*(-?[0-9.eE+-]+),?\s*$')
+_META_FIELD = re.compile(r'^\s*"(\w+)":\s*("?)([^",]*)\2,?\s*$')
+
+
+def _iter_json_points(path: Path) -> Iterator[Tuple[float, int, int]]:
+    cur: Dict[str, str] = {}
+    found = 0
+    content = False
+    with path.open("r", encoding="utf-8-sig") as f:
+        for line in f:
+            content = content or bool(line.strip())
+            m = _FIELD.match(line)
+            if m is None:
+                continue
+            cur[m.group(1)] = m.group(2)
+            if len(cur) == 3:
+                found += 1
+                yield float(cur["t"]), int(cur["x"]), int(cur["y"])
+                cur = {}
+    # ander layout (bv. compact/1 regel) matcht geen enkele regel: niet stil een leeg log teruggeven
+    if content and not found:
+        raise ValueError(f"geen cursor punten herkend in {path} (verwacht json.dump indent=2, 1 veld per regel)")
+
+
+def _read_json_meta(path: Path) -> Dict[str, Any]:
+    meta: Dict[str, Any] = {}
+    with path.open("r", encoding="utf-8-sig") as f:
+        in_meta = False
+        for line in f:
+            s = line.strip()
+            if s.startswith('"meta"'):
+                in_meta = True
+                continue
+            if in_meta:
+                if s.startswith("}"):
+                    break
+                m = _META_FIELD.match(line)
+                if m:
+                    key, quoted, val = m.groups()
+                    if quoted:
+                        meta[key] = val
+                    else:
+                        try:
+                            meta[key] = json.loads(val)
+                        except ValueError:
+                            meta[key] = val
+    return meta
+
+
+def _parse_json_points(path: Path) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    pts = np.fromiter((v for p in _iter_json_points(path) for v in p), dtype=np.float64).reshape(-1, 3)
+    return pts[:, 0], pts[:, 1].astype(np.int16), pts[:, 2].astype(np.int16)
+
+
+def convert_json_log(
+    json_path: Union[str, Path],
+    npy_path: Optional[Union[str, Path]] = None,
+    chunk: int = CHUNK_POINTS,
+) -> Tuple[Path, int]:
+    """Returns (npy pad, aantal punten). meta.truncated = True als het JSON bestand niet netjes afgesloten was."""
+    src = Path(json_path)
+    dst = Path(npy_path) if npy_path is not None else src.with_suffix(".npy")
+
+    meta = _read_json_meta(src)
+    declared = meta.get("points")
+    meta["source"] = src.name
+
+    with CursorLogWriter(dst, meta=meta, chunk=chunk) as w:
+        for t, x, y in iter_cursor_chunks(src, chunk):
+            w.extend(t, x, y)
+        w.meta["truncated"] = isinstance(declared, int) and w.points < declared
+    return dst, w.points
+# === END CONVERTER ===
+
+
+# === START CLI TEST ===
+# • WAT: veilige handmatige test.
+# • WAAROM: laat grootte en round-trip zien op een synthetisch log.
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    n = 500_000
+    rng = np.random.default_rng(0)
+    t = np.cumsum(rng.uniform(0.005, 0.012, n))
+    x = rng.integers(0, 1920, n)
+    y = rng.integers(0, 1080, n)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        p = Path(tmp) / "cursor_log_test.npy"
+        t0 = time.perf_counter()
+        tl, xl, yl = t.tolist(), x.tolist(), y.tolist()  # zoals de recorder: Python floats/ints
+        with CursorLogWriter(p, meta={"test": True}) as w:
+            for i in range(n):
+                w.append(tl[i], xl[i], yl[i])
+        ms = (time.perf_counter() - t0) * 1000
+
+        log = read_cursor_log(p)
+        ok = np.array_equal(log["t"], t) and np.array_equal(log["x"], x) and np.array_equal(log["y"], y)
+        print(f"{'🟢' if ok else '🔴'} {n:,} punten | {p.stat().st_size / 1e6:.1f} MB | append {ms / n * 1e6:.0f} ns/punt | meta={read_meta(p)}")
+        del log
+# === END CLI TEST ===
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: centraal en voorspelbaar, voorkomt verborgen dependencies.
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from core.cursor_log import CHUNK_POINTS, iter_cursor_chunks, read_meta
+# === END IMPORTS ===
+
+
+# === START CONSTANTS ===
+# • WAT: wanneer een stap "beweging" is + vaste histogram bins.
+# • WAAROM: vaste bins => constant geheugen en rapporten van verschillende logs zijn vergelijkbaar.
+MOVE_GAP_SEC = 0.05           # stap langer dan dit (of 0 px) telt als pauze, niet als beweging
+MIN_STRAIGHT_PX = 2.0         # kortere moves krijgen geen curvature (deling door ~0)
+
+SPEED_BINS = np.geomspace(1.0, 1e5, 51)          # px/s
+ACCEL_BINS = np.geomspace(10.0, 1e7, 61)         # |px/s²|
+PAUSE_BINS = np.geomspace(1e-3, 100.0, 51)       # s
+STRAIGHT_BINS = np.geomspace(1.0, 10.0, 41)      # padlengte / rechte afstand (1 = kaarsrecht)
+TURN_BINS = np.linspace(0.0, np.pi, 37)          # gemiddelde |hoekverandering| per stap (rad)
+MOVE_SEC_BINS = np.geomspace(1e-3, 10.0, 41)     # duur per move
+MOVE_PX_BINS = np.geomspace(1.0, 1e4, 41)        # padlengte per move
+# === END CONSTANTS ===
+
+
+# === START MODELS ===
+# • WAT: histogram + momenten (count/som/kwadratensom/min/max) met vaste grootte.
+# • WAAROM: elke chunk wordt erin gevouwen en daarna weggegooid.
+class _Dist:
+    def __init__(self, edges: np.ndarray):
+        self.edges = edges
+        self.counts = np.zeros(len(edges) + 1, dtype=np.int64)  # [0] onder, [-1] boven de bins
+        self.n = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.lo = np.inf
+        self.hi = -np.inf
+
+    def add(self, values: np.ndarray) -> None:
+        v = values[np.isfinite(values)]
+        if not v.size:
+            return
+        self.counts += np.bincount(np.searchsorted(self.edges, v, side="right"), minlength=len(self.counts))
+        self.n += int(v.size)
+        self.total += float(v.sum())
+        self.total_sq += float(np.dot(v, v))
+        self.lo = min(self.lo, float(v.min()))
+        self.hi = max(self.hi, float(v.max()))
+
+    def percentile(self, q: float) -> float:
+        """Bovengrens van de bin waar q (0..1) in valt, begrensd op min/max."""
+        if not self.n:
+            return 0.0
+        i = int(np.searchsorted(np.cumsum(self.counts), q * self.n, side="left"))
+        edge = self.edges[min(i, len(self.edges) - 1)]
+        return float(min(max(edge, self.lo), self.hi))
+
+    def summary(self) -> Dict[str, Any]:
+        if not self.n:
+            return {"count": 0}
+        mean = self.total / self.n
+        return {
+            "count": self.n,
+            "mean": round(mean, 4),
+            "std": round(float(np.sqrt(max(self.total_sq / self.n - mean * mean, 0.0))), 4),
+            "min": round(self.lo, 4),
+            "p50": round(self.percentile(0.50), 4),
+            "p90": round(self.percentile(0.90), 4),
+            "p99": round(self.percentile(0.99), 4),
+            "max": round(self.hi, 4),
+            "edges": [round(float(e), 6) for e in self.edges],
+            "counts": self.counts.tolist(),
+        }
+# === END MODELS ===
+
+
+# === START CORE LOGIC ===
+# • WAT: streaming statistiek: per chunk vectorized, runs (moves/pauzes) lopen over chunk grenzen door.
+# • WAAROM: 5 uur data (~2M punten) in seconden, geheugen O(chunk).
+class CursorStats:
+    """
+    update(t, x, y) per blok punten (in volgorde), daarna summary().
+
+    stap      = 2 opeenvolgende punten
+    move      = aaneengesloten stappen met beweging (> 0 px en dt <= MOVE_GAP_SEC)
+    pauze     = aaneengesloten stappen zonder beweging of met een gat > MOVE_GAP_SEC
+    curvature = per move padlengte / rechte afstand start-eind, en gemiddelde |hoekverandering| per stap
+    """
+
+    def __init__(self, move_gap: float = MOVE_GAP_SEC):
+        self.move_gap = float(move_gap)
+        self.points = 0
+        self.t_first: Optional[float] = None
+        self.t_last: Optional[float] = None
+        self.path_px = 0.0
+
+        self.speed = _Dist(SPEED_BINS)
+        self.accel = _Dist(ACCEL_BINS)
+        self.pause = _Dist(PAUSE_BINS)
+        self.straight = _Dist(STRAIGHT_BINS)
+        self.turn = _Dist(TURN_BINS)
+        self.move_sec = _Dist(MOVE_SEC_BINS)
+        self.move_px = _Dist(MOVE_PX_BINS)
+
+        self._carry: Optional[np.ndarray] = None          # laatste 2 punten (t, x, y) van vorige chunk
+        self._open: Optional[Dict[str, Any]] = None        # run die nog over de chunk grens kan lopen
+
+    def update(self, t: np.ndarray, x: np.ndarray, y: np.ndarray) -> None:
+        if not len(t):
+            return
+        self.points += len(t)
+        if self.t_first is None:
+            self.t_first = float(t[0])
+        self.t_last = float(t[-1])
+
+        block = np.stack([np.asarray(t, np.float64), np.asarray(x, np.float64), np.asarray(y, np.float64)], axis=1)
+        ext = block if self._carry is None else np.concatenate([self._carry, block])
+        skip = len(ext) - len(block) - 1 if self._carry is not None else 0  # stappen die vorige chunk al telde
+        self._carry = ext[-2:].copy()
+        if len(ext) < 2:
+            return
+
+        dt = np.diff(ext[:, 0])
+        dx = np.diff(ext[:, 1])
+        dy = np.diff(ext[:, 2])
+        dist = np.hypot(dx, dy)
+        moving = (dist > 0) & (dt > 0) & (dt <= self.move_gap)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            speed = np.where(moving, dist / np.where(dt > 0, dt, 1.0), np.nan)
+
+        # paren van 2 bewegende stappen: versnelling + hoekverandering (ook over de chunk grens)
+        pair = moving[:-1] & moving[1:]
+        if pair.any():
+            mid = (dt[:-1] + dt[1:]) / 2.0
+            self.accel.add(np.abs(np.diff(speed)[pair] / mid[pair]))
+        heading = np.arctan2(dy, dx)
+        turn_in = np.zeros_like(dt)
+        turn_in[1:] = np.where(pair, np.abs(np.angle(np.exp(1j * np.diff(heading)))), 0.0)
+
+        # vanaf hier alleen de nieuwe stappen
+        s = slice(skip, None)
+        dt, dist, moving, speed, turn_in = dt[s], dist[s], moving[s], speed[s], turn_in[s]
+        pts = ext[skip:]
+        if not len(dt):
+            return
+        self.speed.add(speed[moving])
+        self.path_px += float(dist[moving].sum())
+        self._runs(dt, dist, moving, turn_in, pts)
+
+    def _runs(self, dt, dist, moving, turn_in, pts) -> None:
+        starts = np.flatnonzero(np.r_[True, moving[1:] != moving[:-1]])
+        ends = np.r_[starts[1:], len(dt)]  # exclusief
+        runs = {
+            "moving": moving[starts],
+            "n": ends - starts,
+            "dur": np.add.reduceat(dt, starts),
+            "path": np.add.reduceat(np.where(moving, dist, 0.0), starts),
+            "turn": np.add.reduceat(turn_in, starts),
+            "sx": pts[starts, 1], "sy": pts[starts, 2],
+            "ex": pts[ends, 1], "ey": pts[ends, 2],
+        }
+
+        # eerste run plakt aan de open run van de vorige chunk als het type gelijk is
+        o = self._open
+        if o is not None:
+            if bool(runs["moving"][0]) == o["moving"]:
+                runs["n"][0] += o["n"]
+                runs["dur"][0] += o["dur"]
+                runs["path"][0] += o["path"]
+                runs["turn"][0] += o["turn"]
+                runs["sx"][0], runs["sy"][0] = o["sx"], o["sy"]
+            else:
+                self._finish({k: np.array([v]) for k, v in o.items()})
+
+        last = len(starts) - 1
+        self._open = {k: (bool(v[last]) if k == "moving" else v[last].item()) for k, v in runs.items()}
+        if last:
+            self._finish({k: v[:last] for k, v in runs.items()})
+
+    def _finish(self, runs: Dict[str, np.ndarray]) -> None:
+        mv = runs["moving"].astype(bool)
+        self.pause.add(runs["dur"][~mv])
+        if not mv.any():
+            return
+        path = runs["path"][mv]
+        self.move_sec.add(runs["dur"][mv])
+        self.move_px.add(path)
+
+        straight = np.hypot(runs["ex"][mv] - runs["sx"][mv], runs["ey"][mv] - runs["sy"][mv])
+        ok = straight >= MIN_STRAIGHT_PX
+        self.straight.add(path[ok] / straight[ok])
+        n = runs["n"][mv]
+        multi = n > 1
+        self.turn.add(runs["turn"][mv][multi] / (n[multi] - 1))
+
+    def summary(self) -> Dict[str, Any]:
+        if self._open is not None:
+            self._finish({k: np.array([v]) for k, v in self._open.items()})
+            self._open = None
+        span = (self.t_last - self.t_first) if self.t_first is not None else 0.0
+        return {
+            "points": self.points,
+            "duration_s": round(span, 3),
+            "moves": self.move_sec.n,
+            "pauses": self.pause.n,
+            "path_px": round(self.path_px, 1),
+            "speed_px_s": self.speed.summary(),
+            "accel_px_s2": self.accel.summary(),
+            "pause_s": self.pause.summary(),
+            "straightness": self.straight.summary(),
+            "turn_rad_per_step": self.turn.summary(),
+            "move_s": self.move_sec.summary(),
+            "move_px": self.move_px.summary(),
+        }
+# === END CORE LOGIC ===
+
+
+# === START API ===
+# • WAT: 1 log analyseren + tekst rapport.
+# • WAAROM: tools/analyze_cursor_logs.py en losse scripts gebruiken dezelfde cijfers.
+def analyze_cursor_log(path: Union[str, Path], chunk: int = CHUNK_POINTS * 4, move_gap: float = MOVE_GAP_SEC) -> Dict[str, Any]:
+    stats = CursorStats(move_gap=move_gap)
+    for t, x, y in iter_cursor_chunks(path, chunk):
+        stats.update(t, x, y)
+    out = stats.summary()
+    out["file"] = Path(path).name
+    out["meta"] = read_meta(path) if Path(path).suffix.lower() == ".npy" else {}
+    return out
+
+
+def format_report(s: Dict[str, Any]) -> str:
+    rows: List[Tuple[str, str, str]] = [
+        ("snelheid", "speed_px_s", "px/s"),
+        ("versnelling", "accel_px_s2", "px/s²"),
+        ("pauze", "pause_s", "s"),
+        ("move duur", "move_s", "s"),
+        ("move lengte", "move_px", "px"),
+        ("pad/recht", "straightness", "x"),
+        ("draai/stap", "turn_rad_per_step", "rad"),
+    ]
+    lines = [
+        f"📈 {s.get('file', '?')}: {s['points']:,} punten | {s['duration_s'] / 3600:.2f} h | "
+        f"{s['moves']:,} moves | {s['pauses']:,} pauzes | pad {s['path_px'] / 1000:.1f}k px",
+        f"{'':<12} {'mean':>10} {'p50':>10} {'p90':>10} {'p99':>10} {'max':>10}",
+    ]
+    for label, key, unit in rows:
+        d = s[key]
+        if not d.get("count"):
+            lines.append(f"{label:<12} {'-':>10}")
+            continue
+        lines.append(
+            f"{label:<12} {d['mean']:>10.3g} {d['p50']:>10.3g} {d['p90']:>10.3g} {d['p99']:>10.3g} {d['max']:>10.3g}  {unit}"
+        )
+    return "\n".join(lines)
+# === END API ===
+
+
+# === START CLI TEST ===
+# • WAT: veilige handmatige test.
+# • WAAROM: chunked resultaat moet gelijk zijn aan alles-in-1-keer.
+if __name__ == "__main__":
+    rng = np.random.default_rng(1)
+    n = 200_000
+    t = np.cumsum(np.where(rng.random(n) < 0.01, rng.uniform(0.06, 0.2, n), rng.uniform(0.006, 0.012, n)))
+    x = np.cumsum(rng.integers(-3, 4, n)).astype(np.float64) + 900
+    y = np.cumsum(rng.integers(-3, 4, n)).astype(np.float64) + 500
+
+    whole = CursorStats()
+    whole.update(t, x, y)
+    parts = CursorStats()
+    for i in range(0, n, 7777):
+        parts.update(t[i:i + 7777], x[i:i + 7777], y[i:i + 7777])
+
+    a, b = whole.summary(), parts.summary()
+    same = all(a[k] == b[k] for k in a)
+    print(f"{'🟢' if same else '🔴'} chunked == in 1 keer")
+    print(format_report(b))
+# === END CLI TEST ===
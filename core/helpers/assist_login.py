@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-from time import time, sleep
+from time import sleep
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -14,36 +14,135 @@ if str(ROOT) not in sys.path:
 # ============================================================
 # IMPORTS
 # ============================================================
-from core.click_image import click_image
-from vision.image_detection import detect_image
+from core.area_registry import area_box
+from core.click_image import click_hit
+from core.scheduler import STOP
+from vision.image_detection import detect_many
+from vision.wait_for import Backoff, FrameWaiter
+
+# template -> area; 1 grab + 1 batch per iteratie
+LOGIN_TEMPLATES = {
+    "XP.png": "Info_Area",
+    "Login_Screen_Play_Now.png": "Bot_Area",
+    "Login_Screen_Play_Now_Red.png": "Bot_Area_Full",
+}
+
+# poll plafond op statisch scherm (oude vaste sleep)
+MAX_POLL_SEC = 0.25
+
+# login_step: zo vaak kijken of de klik in de input queue al klaar is
+INPUT_POLL_SEC = 0.05
+# na de klik: laadtijd tot het scherm reageert
+CLICK_SETTLE_SEC = 0.9
 
 # ============================================================
 # MAIN
 # ============================================================
 def assist_login(*, bot_id: int = 1, timeout: float = 15.0, verbose: bool = False) -> bool:
-    start = time()
+    if verbose:
+        print(f"🔐 Logging in (bot {bot_id})")
+
+    # alleen opnieuw matchen als een van de login areas veranderd is
+    watch = [area_box(a, bot_id) for a in set(LOGIN_TEMPLATES.values())]
+    waiter = FrameWaiter(watch=watch, backoff=Backoff(max_sec=MAX_POLL_SEC))
+
+    def _step(frame):
+        hits = detect_many(LOGIN_TEMPLATES, bot_id=bot_id, verbose="off", frame=frame)
+
+        if hits["XP.png"]:
+            if verbose:
+                print("✅ We zijn ingelogd!")
+            return True
+
+        if click_hit(hits["Login_Screen_Play_Now.png"]):
+            if verbose:
+                print("🖱️ Play Now (rood) aangeklikt")
+            sleep(CLICK_SETTLE_SEC)
+
+        elif click_hit(hits["Login_Screen_Play_Now_Red.png"]):
+            if verbose:
+                print("🖱️ Play Now aangeklikt")
+            sleep(CLICK_SETTLE_SEC)
+
+        return None
+
+    if waiter.run(_step, timeout=timeout):
+        return True
+
+    if verbose:
+        print("⚠️ Inloggen niet gelukt binnen timeout")
+    return False
+
+
+# ============================================================
+# ASYNC (veel bots in 1 event loop, zie core/async_api.py)
+# ============================================================
+async def assist_login_async(*, bot_id: int = 1, timeout: float = 15.0, verbose: bool = False) -> bool:
+    """await assist_login_async(bot_id=2): zelfde flow, wachten en klikken blokkeren de loop niet."""
+    # hier pas: sync scripts laden asyncio + de executors niet
+    from core.async_api import async_sleep, click_hit_async, detect_many_async, get_executor
 
     if verbose:
         print(f"🔐 Logging in (bot {bot_id})")
 
-    while time() - start < timeout:
-        if detect_image(image_name="xp.png", area_name="Info_Area", bot_id=bot_id, verbose="off"):
+    watch = [area_box(a, bot_id) for a in set(LOGIN_TEMPLATES.values())]
+    waiter = FrameWaiter(watch=watch, backoff=Backoff(max_sec=MAX_POLL_SEC))
+
+    async def _step(frame):
+        hits = await detect_many_async(LOGIN_TEMPLATES, bot_id=bot_id, verbose="off", frame=frame)
+
+        if hits["XP.png"]:
             if verbose:
                 print("✅ We zijn ingelogd!")
             return True
 
-        if click_image("Login_Screen_Play_Now.png", "Bot_Area", bot_id, verbose="off"):
+        if await click_hit_async(hits["Login_Screen_Play_Now.png"]):
             if verbose:
                 print("🖱️ Play Now (rood) aangeklikt")
-            sleep(0.9)
+            await async_sleep(CLICK_SETTLE_SEC)
 
-        elif click_image("Login_Screen_Play_Now_Red.png", "Bot_Area_Full", bot_id, verbose="off"):
+        elif await click_hit_async(hits["Login_Screen_Play_Now_Red.png"]):
             if verbose:
                 print("🖱️ Play Now aangeklikt")
-            sleep(0.9)
+            await async_sleep(CLICK_SETTLE_SEC)
+
+        return None
 
-        sleep(0.25)
+    if await waiter.run_async(_step, timeout=timeout, executor=get_executor()):
+        return True
 
     if verbose:
         print("⚠️ Inloggen niet gelukt binnen timeout")
     return False
+
+
+# ============================================================
+# SCHEDULER STEP (multi-bot, zie core/scheduler.py)
+# ============================================================
+def login_step(ctx):
+    """
+    Niet-blokkerende variant van assist_login voor MultiBotScheduler:
+    gebruikt het gedeelde tick-frame en zet de klik in de input queue.
+
+    Zolang die klik nog wacht of beweegt (andere bots gaan voor) niet opnieuw detecteren:
+    het scherm is dan nog niet veranderd en we zouden Play Now 2x klikken.
+    """
+    pending = ctx.state.get("click")
+    if pending is not None:
+        if not pending.done():
+            return INPUT_POLL_SEC
+        del ctx.state["click"]
+        pending.result()  # fout in click_hit => via scheduler._collect (bot stopt met melding)
+        return CLICK_SETTLE_SEC
+
+    hits = detect_many(LOGIN_TEMPLATES, bot_id=ctx.bot_id, verbose="off", frame=ctx.frame)
+
+    if hits["XP.png"]:
+        return STOP
+
+    hit = hits["Login_Screen_Play_Now.png"] or hits["Login_Screen_Play_Now_Red.png"]
+    if hit:
+        ctx.state["click"] = ctx.input(click_hit, hit)
+        return INPUT_POLL_SEC
+
+    return MAX_POLL_SEC
@@ -5,42 +5,101 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-from time import time, sleep
+from time import sleep
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from core.click_image import click_image
-from vision.image_detection import detect_image
+from core.area_registry import area_box
+from core.click_image import click_hit
+from vision.image_detection import detect_many
+from vision.wait_for import Backoff, FrameWaiter
+
+# template -> area; 1 grab + 1 batch per iteratie
+LOGOUT_TEMPLATES = {
+    "Login_Screen_World.png": "Bot_Area_Full",
+    "Logout_Door.png": "Buttons_Bottom",
+    "Logout_ClickHereToLogout.png": "Inventory_Area",
+}
+
+# poll plafond op statisch scherm (oude vaste sleep)
+MAX_POLL_SEC = 0.3
 
 
 # ============================================================
 # LOGOUT ASSIST
 # ============================================================
 def assist_logout(*, bot_id: int = 1, timeout: float = 15.0, verbose: bool = False) -> bool:
-    start = time()
-
     if verbose:
         print(f"🚪 Logging out (bot {bot_id})")
 
-    while time() - start < timeout:
-        if detect_image("Login_Screen_World.png", "Bot_Area_Full", bot_id=bot_id, verbose="off"):
+    # alleen opnieuw matchen als een van de logout areas veranderd is
+    watch = [area_box(a, bot_id) for a in set(LOGOUT_TEMPLATES.values())]
+    waiter = FrameWaiter(watch=watch, backoff=Backoff(max_sec=MAX_POLL_SEC))
+
+    def _step(frame):
+        hits = detect_many(LOGOUT_TEMPLATES, bot_id=bot_id, verbose="off", frame=frame)
+
+        if hits["Login_Screen_World.png"]:
             if verbose:
                 print("✅ Uitloggen gelukt, login scherm zichtbaar")
             return True
 
-        if click_image("Logout_Door.png", "Buttons_Bottom", bot_id=bot_id, anchor="random", padding=2, verbose="off"):
+        # logout paneel al open => bevestigen, anders eerst de deur (niet terug dichtklikken)
+        if click_hit(hits["Logout_ClickHereToLogout.png"]):
+            if verbose:
+                print("🖱️ Logout bevestigd")
+            sleep(0.8)
+
+        elif click_hit(hits["Logout_Door.png"]):
             if verbose:
                 print("🖱️ Logout knop aangeklikt")
             sleep(0.8)
 
-        if click_image("Logout_ClickHereToLogout.png", "Inventory_Area", bot_id=bot_id, anchor="random", padding=2, verbose="off"):
+        return None
+
+    if waiter.run(_step, timeout=timeout):
+        return True
+
+    if verbose:
+        print("⚠️ Uitloggen niet gelukt binnen timeout")
+    return False
+
+
+async def assist_logout_async(*, bot_id: int = 1, timeout: float = 15.0, verbose: bool = False) -> bool:
+    """await assist_logout_async(bot_id=2): zelfde flow, wachten en klikken blokkeren de loop niet."""
+    # hier pas: sync scripts laden asyncio + de executors niet
+    from core.async_api import async_sleep, click_hit_async, detect_many_async, get_executor
+
+    if verbose:
+        print(f"🚪 Logging out (bot {bot_id})")
+
+    watch = [area_box(a, bot_id) for a in set(LOGOUT_TEMPLATES.values())]
+    waiter = FrameWaiter(watch=watch, backoff=Backoff(max_sec=MAX_POLL_SEC))
+
+    async def _step(frame):
+        hits = await detect_many_async(LOGOUT_TEMPLATES, bot_id=bot_id, verbose="off", frame=frame)
+
+        if hits["Login_Screen_World.png"]:
+            if verbose:
+                print("✅ Uitloggen gelukt, login scherm zichtbaar")
+            return True
+
+        if await click_hit_async(hits["Logout_ClickHereToLogout.png"]):
             if verbose:
                 print("🖱️ Logout bevestigd")
-            sleep(0.8)
+            await async_sleep(0.8)
+
+        elif await click_hit_async(hits["Logout_Door.png"]):
+            if verbose:
+                print("🖱️ Logout knop aangeklikt")
+            await async_sleep(0.8)
+
+        return None
 
-        sleep(0.3)
+    if await waiter.run_async(_step, timeout=timeout, executor=get_executor()):
+        return True
 
     if verbose:
         print("⚠️ Uitloggen niet gelukt binnen timeout")
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# hoe vaak (sec) we maximaal os.stat doen om te kijken of het bestand veranderd is
+DEFAULT_CHECK_INTERVAL_SEC = 1.0
+
+_Stamp = Optional[Tuple[int, int]]  # (mtime_ns, size) of None als bestand ontbreekt
+
+
+def _stamp(path: Path) -> _Stamp:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class JsonFileCache:
+    """
+    Eén JSON bestand, 1x geparsed en in memory gehouden.
+
+    data() doet hooguit elke check_interval seconden een os.stat; alleen als
+    mtime/size veranderd is wordt het bestand opnieuw gelezen. Ontbrekend
+    bestand -> {} (zelfde gedrag als de oude _safe_read_json).
+
+    Kapotte JSON (bv. half opgeslagen tijdens hot reload): de laatste goede
+    data blijft staan, de fout staat in .error en wordt 1x gemeld. Bij de
+    eerste load: strict=True -> ValueError, anders {} + melding.
+
+    version telt op bij elke reload, zodat afgeleide caches (bv. getypte
+    settings per template) weten wanneer ze ongeldig zijn.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        check_interval: float = DEFAULT_CHECK_INTERVAL_SEC,
+        clock: Callable[[], float] = time.monotonic,
+        strict: bool = False,
+    ):
+        self.path = Path(path)
+        self.strict = bool(strict)
+        self.check_interval = float(check_interval)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data: Dict[str, Any] = {}
+        self._stamp: _Stamp = None
+        self._loaded = False
+        self._next_check = 0.0
+        self.version = 0
+        self.error: Optional[ValueError] = None  # laatste parse fout (None = bestand was goed)
+
+    def data(self) -> Dict[str, Any]:
+        """Gedeelde dict: NIET muteren (maak een kopie om te wijzigen)."""
+        now = self._clock()
+        if self._loaded and now < self._next_check:
+            return self._data
+
+        with self._lock:
+            if self._loaded and now < self._next_check:
+                return self._data
+            stamp = _stamp(self.path)
+            if not self._loaded or stamp != self._stamp:
+                try:
+                    data = self._read()
+                except ValueError as e:
+                    if not self._loaded and self.strict:
+                        raise
+                    # laatste goede data houden; pas bij de volgende wijziging opnieuw proberen
+                    self.error = e
+                    print(f"⚠️ {e} (vorige versie blijft actief)" if self._loaded else f"⚠️ {e}")
+                    self._stamp = stamp
+                    self._loaded = True
+                else:
+                    self._data = data
+                    self._stamp = stamp
+                    self._loaded = True
+                    self.error = None
+                    self.version += 1
+            self._next_check = now + self.check_interval
+            return self._data
+
+    def invalidate(self) -> None:
+        """Volgende data() leest het bestand gegarandeerd opnieuw (bv. na eigen write)."""
+        with self._lock:
+            self._loaded = False
+            self._next_check = 0.0
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            text = self.path.read_text(encoding="utf-8-sig")
+        except OSError:
+            return {}
+        try:
+            raw = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON kapot: {self.path} -> {e}") from e
+        return raw if isinstance(raw, dict) else {}
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: bewust alleen stdlib; deze module staat bovenaan elke vision import.
+from types import ModuleType
+import importlib
+import threading
+# === END IMPORTS ===
+
+
+# === START LAZY MODULE ===
+# • WAT: module placeholder die pas bij het eerste attribuut echt importeert.
+# • WAAROM: cv2 + numpy kosten ±100 ms per proces; korte scripts die niet matchen betalen dat niet meer.
+_LOCK = threading.Lock()
+
+
+class LazyModule(ModuleType):
+    """
+    cv2 = lazy_module("cv2")
+    cv2.matchTemplate(...)   # eerste attribuut => import; daarna gewone dict lookup
+
+    Na het laden staat de inhoud van de echte module in deze placeholder en wordt
+    hij een gewone ModuleType: hot loops betalen geen __getattr__ hook meer.
+    """
+
+    def __getattr__(self, attr: str):
+        # alleen voor namen die (nog) niet in __dict__ staan
+        return getattr(self._load(), attr)
+
+    def _load(self) -> ModuleType:
+        mod = self.__dict__.get("_lazy_real")
+        if mod is None:
+            with _LOCK:
+                mod = self.__dict__.get("_lazy_real")
+                if mod is None:
+                    mod = importlib.import_module(self.__name__)
+                    self.__dict__.update(mod.__dict__)
+                    self.__dict__["_lazy_real"] = mod
+                    self.__class__ = ModuleType  # ±200 ns per attribuut minder (geen hook meer)
+        return mod
+
+    def __repr__(self) -> str:
+        return f"<module '{self.__name__}' (lazy)>"
+
+
+def lazy_module(name: str) -> ModuleType:
+    """Echte module als hij al geïmporteerd is, anders een LazyModule placeholder."""
+    mod = sys.modules.get(name)
+    if mod is not None:
+        return mod
+    return LazyModule(name)
+
+
+def is_loaded(name: str) -> bool:
+    """True als de echte module al in dit proces geladen is (handig in CLI tests/benchmarks)."""
+    return name in sys.modules
+
+
+def load(module: ModuleType) -> ModuleType:
+    """Forceer het laden (bv. vooraf in een worker); returns de echte module."""
+    return module._load() if isinstance(module, LazyModule) else module
+# === END LAZY MODULE ===
+
+
+# === START CLI TEST ===
+# • WAT: veilige handmatige test zonder scherm.
+# • WAAROM: laat zien dat import pas bij gebruik gebeurt en wat het daarna nog kost.
+if __name__ == "__main__":
+    import time
+
+    cv2 = lazy_module("cv2")
+    print(f"🔎 voor gebruik: {cv2!r} | cv2 geladen={is_loaded('cv2')}")
+    t0 = time.perf_counter()
+    flag = cv2.COLOR_RGB2GRAY
+    print(f"📦 eerste attribuut: {(time.perf_counter() - t0) * 1000:.1f} ms | {cv2!r} | COLOR_RGB2GRAY={flag}")
+
+    n = 200000
+    t0 = time.perf_counter()
+    for _ in range(n):
+        cv2.cvtColor
+    print(f"⏱️ attribuut na laden: {(time.perf_counter() - t0) / n * 1e9:.0f} ns")
+# === END CLI TEST ===
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: centraal en voorspelbaar, voorkomt verborgen dependencies.
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+import queue
+import threading
+import time
+
+from core import tracing
+from core.lazy_import import lazy_module
+futures = lazy_module("concurrent.futures")  # pas bij run(); helpers importeren alleen STOP
+from core.bot_offsets import BOT_OFFSETS
+from vision.frame_capture import Frame, FrameCapture
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+# === END IMPORTS ===
+
+
+# === START CONSTANTS ===
+# • WAT: tick defaults + stop sentinel voor bot steps.
+# • WAAROM: één desktop-frame per tick, gedeeld door alle bots.
+DEFAULT_TICK_SEC = 0.1
+STOP = object()  # step(ctx) -> STOP => bot is klaar
+# === END CONSTANTS ===
+
+
+# === START INPUT QUEUE ===
+# • WAT: één worker thread die alle muis/keyboard acties na elkaar uitvoert.
+# • WAAROM: er is maar één fysieke cursor; bots mogen elkaars beweging niet onderbreken.
+class InputQueue:
+    def __init__(self, capture: Optional[FrameCapture] = None):
+        self._q: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._capture = capture
+        self._thread = threading.Thread(target=self._run, name="bot-input", daemon=True)
+        self._thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        fut: Future = futures.Future()
+        # trace labels (template/area/bot) van de aanroeper gaan mee naar de input thread
+        self._q.put((fut, fn, args, kwargs, tracing.current_context()))
+        return fut
+
+    def pending(self) -> int:
+        return self._q.qsize()
+
+    def close(self, wait: bool = True) -> None:
+        self._q.put(None)
+        if wait:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._q.get()
+            if item is None:
+                return
+            fut, fn, args, kwargs, ctx = item
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                with tracing.trace_context(*ctx):
+                    fut.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                fut.set_exception(e)
+            finally:
+                # scherm is na input veranderd: volgende tick gegarandeerd vers frame
+                if self._capture is not None:
+                    self._capture.invalidate()
+# === END INPUT QUEUE ===
+
+
+# === START MODELS ===
+# • WAT: per-bot state + de context die een step te zien krijgt.
+# • WAAROM: steps blokkeren niet met time.sleep maar geven terug wanneer ze weer aan de beurt willen.
+@dataclass
+class BotContext:
+    bot_id: int
+    frame: Frame
+    tick: int
+    scheduler: "MultiBotScheduler"
+    state: Dict[str, Any] = field(default_factory=dict)
+
+    def input(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """Zet een input actie (bv. click_hit) in de gedeelde queue; niet blokkerend."""
+        return self.scheduler.inputs.submit(fn, *args, **kwargs)
+
+
+@dataclass
+class _Bot:
+    bot_id: int
+    step: Callable[[BotContext], Any]
+    state: Dict[str, Any] = field(default_factory=dict)
+    next_due: float = 0.0
+    running: Optional[Future] = None
+    done: bool = False
+    steps: int = 0
+# === END MODELS ===
+
+
+# === START CORE LOGIC ===
+# • WAT: tick loop: 1 frame -> alle bots die "due" en niet bezig zijn naar de worker pool.
+# • WAAROM: detectie per kwadrant loopt parallel (OpenCV laat de GIL los), throughput schaalt met bots.
+class MultiBotScheduler:
+    """
+    step(ctx) returnt:
+      None     => volgende tick opnieuw
+      float    => pas na zoveel seconden opnieuw (vervangt time.sleep in flows)
+      STOP     => bot klaar
+    Een bot die nog bezig is met een vorige step wordt overgeslagen; andere bots wachten niet op hem.
+    """
+
+    def __init__(
+        self,
+        tick_sec: float = DEFAULT_TICK_SEC,
+        workers: Optional[int] = None,
+        capture: Optional[FrameCapture] = None,
+        verbose: bool = False,
+    ):
+        self.tick_sec = float(tick_sec)
+        self.capture = capture or FrameCapture(max_age=0.0)
+        self.inputs = InputQueue(self.capture)
+        self.verbose = verbose
+        self._workers = workers
+        self._bots: Dict[int, _Bot] = {}
+        self._stop = threading.Event()
+        self.ticks = 0
+
+    def add(self, bot_id: int, step: Callable[[BotContext], Any]) -> None:
+        if int(bot_id) not in BOT_OFFSETS:
+            raise KeyError(f"Onbekende bot_id: {bot_id} (zie BOT_OFFSETS)")
+        self._bots[int(bot_id)] = _Bot(int(bot_id), step)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def stats(self) -> Dict[int, int]:
+        """Aantal uitgevoerde steps per bot."""
+        return {b.bot_id: b.steps for b in self._bots.values()}
+
+    def run(self, duration: Optional[float] = None) -> Dict[int, int]:
+        """Draait tot alle bots STOP geven, stop() aangeroepen wordt of duration verstreken is."""
+        self._stop.clear()
+        end = time.monotonic() + float(duration) if duration else None
+        pool = futures.ThreadPoolExecutor(max_workers=self._workers or max(1, len(self._bots)), thread_name_prefix="bot")
+
+        next_tick = 0.0
+        try:
+            while not self._stop.is_set():
+                now = time.monotonic()
+                if end is not None and now >= end:
+                    break
+
+                self._collect()
+                if all(b.done for b in self._bots.values()):
+                    break
+
+                idle = [b for b in self._bots.values() if not b.done and b.running is None]
+                due = [b for b in idle if b.next_due <= now] if now >= next_tick else []
+                if due:
+                    frame = self.capture.grab()
+                    self.ticks += 1
+                    next_tick = now + self.tick_sec
+                    for b in due:
+                        ctx = BotContext(b.bot_id, frame, self.ticks, self, b.state)
+                        b.running = pool.submit(self._run_step, b, ctx)
+                    continue
+
+                # niets te doen: wachten tot volgende tick / due bot, of tot een lopende step klaar is
+                wake = max(min((b.next_due for b in idle), default=float("inf")), next_tick)
+                if end is not None:
+                    wake = min(wake, end)
+                timeout = max(0.0, wake - now) if wake != float("inf") else None
+
+                running = [b.running for b in self._bots.values() if b.running is not None]
+                if running:
+                    futures.wait(running, timeout=timeout, return_when=futures.FIRST_COMPLETED)
+                elif timeout:
+                    self._stop.wait(timeout)
+        finally:
+            pool.shutdown(wait=True)
+            self._collect()
+
+        return self.stats()
+
+    @staticmethod
+    def _run_step(b: _Bot, ctx: BotContext) -> Any:
+        with tracing.trace_context(bot=b.bot_id), tracing.span(tracing.STAGE_STEP):
+            return b.step(ctx)
+
+    def _collect(self) -> None:
+        now = time.monotonic()
+        for b in self._bots.values():
+            fut = b.running
+            if fut is None or not fut.done():
+                continue
+            b.running = None
+            b.steps += 1
+
+            try:
+                result = fut.result()
+            except Exception as e:
+                print(f"⚠️ bot {b.bot_id} gestopt: {type(e).__name__}: {e}")
+                b.done = True
+                continue
+
+            if result is STOP:
+                b.done = True
+                if self.verbose:
+                    print(f"✅ bot {b.bot_id} klaar na {b.steps} steps")
+            elif isinstance(result, (int, float)) and not isinstance(result, bool):
+                b.next_due = now + float(result)
+            else:
+                b.next_due = now
+
+    def close(self) -> None:
+        self.inputs.close()
+# === END CORE LOGIC ===
+
+
+# === START CLI TEST ===
+# • WAT: veilige handmatige test zonder klikken.
+# • WAAROM: laat zien dat alle bots per tick hetzelfde frame delen.
+if __name__ == "__main__":
+    seen: Dict[int, set] = {}
+
+    def _probe(ctx: BotContext):
+        seen.setdefault(ctx.bot_id, set()).add(ctx.frame.seq)
+        return STOP if len(seen[ctx.bot_id]) >= 5 else None
+
+    sched = MultiBotScheduler(verbose=True)
+    for bot_id in BOT_OFFSETS:
+        sched.add(bot_id, _probe)
+    print("steps per bot:", sched.run(duration=5.0), "| ticks:", sched.ticks)
+    sched.close()
+# === END CLI TEST ===
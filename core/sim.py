@@ -0,0 +1,423 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: centraal en voorspelbaar, voorkomt verborgen dependencies.
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import sysconfig
+import threading
+import time
+
+import numpy as np
+
+import ai_keyboard
+from core import ai_cursor
+from vision.frame_capture import invalidate_frame
+from vision.grabbers import COLOR_RGB, Grabber, ReplayGrabber, set_grabber
+from vision.roi_tracker import get_roi_tracker
+# === END IMPORTS ===
+
+
+# === START CONSTANTS ===
+# • WAT: welke time functies de virtuele klok overneemt.
+# • WAAROM: perf_counter blijft echt, zodat tracing/benchmarks de echte CPU tijd meten.
+CLOCK_FUNCS = ("sleep", "monotonic", "time")
+
+EVENT_CLICK = "click"
+EVENT_PRESS = "press"
+EVENT_RELEASE = "release"
+EVENT_TYPE = "type"
+
+Box = Tuple[int, int, int, int]  # (x1, y1, x2, y2) schermcoördinaten
+# === END CONSTANTS ===
+
+
+# === START CLOCK ===
+# • WAT: virtuele klok; sleep() verzet alleen een teller.
+# • WAAROM: flows met sleeps/timeouts draaien op volle CPU snelheid, maar zien dezelfde tijdslijn.
+class _TimeShim:
+    """Vervangt de `time` module in project modules; alles behalve CLOCK_FUNCS gaat naar de echte module."""
+
+    def __init__(self, clock: "VirtualClock"):
+        self.sleep = clock.sleep
+        self.monotonic = clock.monotonic
+        self.time = clock.time
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(time, name)
+
+
+_ACTIVE: Optional["VirtualClock"] = None  # klok die nu geïnstalleerd is (zie active_clock())
+
+
+class VirtualClock:
+    """
+    install() vervangt in alle geladen project modules (onder ROOT):
+      - `import time`              => shim met virtuele sleep/monotonic/time
+      - `from time import sleep`   => virtuele sleep (idem monotonic/time)
+    stdlib/third-party blijven op de echte klok (queue/threading timeouts werken normaal).
+    Modules die pas ná install() geïmporteerd worden zijn niet gepatcht: importeer flows eerst.
+
+    Let op: MultiBotScheduler wacht met threading primitives en valt dus buiten de virtuele klok;
+    sim mode is bedoeld voor blokkerende flows (assist_login, assist_logout, scripts).
+    """
+
+    def __init__(self):
+        self._mono0 = time.monotonic()
+        self._wall0 = time.time()
+        self._elapsed = 0.0
+        self._lock = threading.Lock()
+        self._patched: List[Tuple[Any, str, Any]] = []
+        self.sleeps = 0
+
+    @property
+    def elapsed(self) -> float:
+        return self._elapsed
+
+    def monotonic(self) -> float:
+        return self._mono0 + self._elapsed
+
+    def time(self) -> float:
+        return self._wall0 + self._elapsed
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self._elapsed += max(0.0, float(seconds))
+            self.sleeps += 1
+
+    def advance(self, seconds: float) -> None:
+        self.sleep(seconds)
+
+    def install(self) -> None:
+        global _ACTIVE
+        if self._patched:
+            return
+        _ACTIVE = self
+        shim = _TimeShim(self)
+        real = {name: getattr(time, name) for name in CLOCK_FUNCS}
+        for mod in _project_modules():
+            for attr, val in list(vars(mod).items()):
+                if val is time:
+                    new = shim
+                else:
+                    fname = next((n for n, f in real.items() if val is f), None)
+                    if fname is None:
+                        continue
+                    new = getattr(self, fname)
+                self._patched.append((mod, attr, val))
+                setattr(mod, attr, new)
+
+    def uninstall(self) -> None:
+        global _ACTIVE
+        for mod, attr, old in reversed(self._patched):
+            setattr(mod, attr, old)
+        self._patched.clear()
+        if _ACTIVE is self:
+            _ACTIVE = None
+
+
+def active_clock() -> Optional[VirtualClock]:
+    """De geïnstalleerde VirtualClock (binnen sim_mode), anders None."""
+    return _ACTIVE
+
+
+def _third_party_roots() -> List[Path]:
+    """Interpreter/venv prefixes + sysconfig lib dirs: ook als een .venv binnen ROOT staat."""
+    dirs = {sys.prefix, sys.exec_prefix, sys.base_prefix, sys.base_exec_prefix}
+    dirs.update(p for k, p in sysconfig.get_paths().items() if k in ("stdlib", "platstdlib", "purelib", "platlib"))
+    root = ROOT.resolve()
+    # een prefix die ROOT zelf (of een ouder ervan) is, zou alles uitsluiten
+    return [d for d in (Path(x).resolve() for x in dirs if x) if not root.is_relative_to(d)]
+
+
+def _project_modules() -> List[Any]:
+    root, me = ROOT.resolve(), Path(__file__).resolve()
+    skip = _third_party_roots()
+    out = []
+    for mod in list(sys.modules.values()):
+        f = getattr(mod, "__file__", None)
+        if not f:
+            continue
+        p = Path(f).resolve()
+        if p == me or not p.is_relative_to(root):  # hele path componenten: /root/package2 telt niet mee
+            continue
+        if "site-packages" in p.parts or "dist-packages" in p.parts or any(p.is_relative_to(d) for d in skip):
+            continue  # third-party (bv. .venv/) blijft op de echte klok
+        out.append(mod)
+    return out
+# === END CLOCK ===
+
+
+# === START RECORDER ===
+# • WAT: neemt muis + toetsenbord output op i.p.v. pynput.
+# • WAAROM: flows kunnen headless draaien; tests checken wáár er geklikt/getypt is.
+@dataclass(frozen=True)
+class InputEvent:
+    t: float
+    kind: str
+    x: int
+    y: int
+    key: Optional[str] = None
+
+
+def _key_name(key: Any) -> str:
+    name = getattr(key, "name", None)
+    return str(name if name is not None else key)
+
+
+class InputRecorder:
+    """
+    Gedraagt zich als pynput mouse én keyboard Controller (position, click, press, release, type).
+    moves      = aantal cursor updates (bewegingen zelf worden niet opgeslagen, tenzij record_moves)
+    events     = clicks/toetsen in volgorde, met virtuele tijd
+    listeners  = callbacks per event (bv. ScriptedScreen.on_input)
+    """
+
+    def __init__(self, clock: Optional[VirtualClock] = None, start: Tuple[int, int] = (0, 0), record_moves: bool = False):
+        self.clock = clock
+        self._pos = (int(start[0]), int(start[1]))
+        self.record_moves = bool(record_moves)
+        self.moves = 0
+        self.path: List[Tuple[float, int, int]] = []
+        self.events: List[InputEvent] = []
+        self.listeners: List[Callable[[InputEvent], None]] = []
+        self._lock = threading.Lock()
+
+    def _now(self) -> float:
+        return self.clock.elapsed if self.clock is not None else time.monotonic()
+
+    @property
+    def position(self) -> Tuple[int, int]:
+        return self._pos
+
+    @position.setter
+    def position(self, pos: Sequence[int]) -> None:
+        self._pos = (int(pos[0]), int(pos[1]))
+        self.moves += 1
+        if self.record_moves:
+            self.path.append((self._now(), *self._pos))
+
+    def _emit(self, kind: str, key: Optional[str] = None) -> None:
+        ev = InputEvent(self._now(), kind, self._pos[0], self._pos[1], key)
+        with self._lock:
+            self.events.append(ev)
+        for fn in list(self.listeners):
+            fn(ev)
+
+    # --- mouse ---
+    def click(self, button: Any = "left", count: int = 1) -> None:
+        for _ in range(max(1, int(count))):
+            self._emit(EVENT_CLICK, _key_name(button))
+
+    # --- keyboard ---
+    def press(self, key: Any) -> None:
+        self._emit(EVENT_PRESS, _key_name(key))
+
+    def release(self, key: Any) -> None:
+        self._emit(EVENT_RELEASE, _key_name(key))
+
+    def type(self, text: str) -> None:
+        for ch in str(text):
+            self._emit(EVENT_TYPE, ch)
+
+    @property
+    def clicks(self) -> List[InputEvent]:
+        return [e for e in self.events if e.kind == EVENT_CLICK]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.events.clear()
+            self.path.clear()
+            self.moves = 0
+# === END RECORDER ===
+
+
+# === START SCRIPTED SCREEN ===
+# • WAT: state machine van screenshots; klikken/toetsen/tijd bepalen welk scherm zichtbaar is.
+# • WAAROM: login/logout flows end-to-end testen zonder game; reactie op input is deterministisch.
+@dataclass(frozen=True)
+class Transition:
+    """
+    box    => klik binnen (x1, y1, x2, y2) in state `source`
+    key    => toets (naam zoals "enter"/"esc" of één teken) in state `source`
+    geen   => timer: automatisch `after` seconden na binnenkomst in `source`
+    after  => seconden (virtuele klok) tot `target` zichtbaar wordt (laadtijd)
+    """
+
+    source: str
+    target: str
+    box: Optional[Box] = None
+    key: Optional[str] = None
+    after: float = 0.0
+
+
+class ScriptedScreen(Grabber):
+    name = "scripted"
+
+    def __init__(
+        self,
+        screens: Dict[str, Union[str, Path, np.ndarray]],
+        start: str,
+        transitions: Sequence[Transition] = (),
+        clock: Optional[VirtualClock] = None,
+        color: str = COLOR_RGB,
+    ):
+        super().__init__(color)
+        self._screens = {name: ReplayGrabber._load(src)[0] for name, src in screens.items()}
+        if start not in self._screens:
+            raise KeyError(f"Onbekend start scherm: {start}")
+        for t in transitions:
+            if t.source not in self._screens or t.target not in self._screens:
+                raise KeyError(f"Transition naar/van onbekend scherm: {t.source} -> {t.target}")
+        h, w = next(iter(self._screens.values())).shape[:2]
+        self._size = (int(w), int(h))
+        self.transitions = list(transitions)
+        self.clock = clock
+        self.state = start
+        self.visits: Dict[str, int] = {start: 1}
+        self._entered = self._now()
+        self._pending: Optional[Tuple[str, float]] = None
+
+    def _now(self) -> float:
+        return self.clock.monotonic() if self.clock is not None else time.monotonic()
+
+    def _enter(self, state: str, at: float) -> None:
+        self.state = state
+        self._entered = at
+        self._pending = None
+        self.visits[state] = self.visits.get(state, 0) + 1
+
+    def _advance(self) -> None:
+        now = self._now()
+        while True:
+            if self._pending is not None and now >= self._pending[1]:
+                self._enter(*self._pending)
+                continue
+            timer = next((t for t in self.transitions if t.source == self.state and t.box is None and t.key is None), None)
+            if self._pending is None and timer is not None and now >= self._entered + timer.after:
+                self._enter(timer.target, self._entered + timer.after)
+                continue
+            return
+
+    def on_input(self, ev: InputEvent) -> None:
+        with self._lock:
+            self._advance()
+            if self._pending is not None:
+                return
+            for t in self.transitions:
+                if t.source != self.state:
+                    continue
+                if t.box is not None and ev.kind == EVENT_CLICK:
+                    x1, y1, x2, y2 = t.box
+                    hit = x1 <= ev.x < x2 and y1 <= ev.y < y2
+                elif t.key is not None and ev.kind in (EVENT_PRESS, EVENT_TYPE):
+                    hit = ev.key.lower() == t.key.lower()
+                else:
+                    continue
+                if hit:
+                    self._pending = (t.target, self._now() + t.after)
+                    self._advance()
+                    return
+
+    def screen_size(self) -> Tuple[int, int]:
+        return self._size
+
+    def grab(self, region=None, out=None) -> np.ndarray:
+        with self._lock:
+            self._advance()
+            frame = self._screens[self.state]
+        x, y, w, h = self._clip(region)
+        return self._from_rgb(frame[y:y + h, x:x + w], out)
+# === END SCRIPTED SCREEN ===
+
+
+# === START API ===
+# • WAT: alles in één keer aan/uit: grabber, klok, muis, toetsenbord.
+# • WAAROM: flows hoeven niets te weten van sim mode; zelfde code als live.
+@dataclass
+class SimSession:
+    clock: VirtualClock
+    recorder: InputRecorder
+    screen: Grabber
+    info: Dict[str, Any] = field(default_factory=dict)
+
+
+@contextmanager
+def sim_mode(
+    screen: Grabber,
+    clock: Optional[VirtualClock] = None,
+    recorder: Optional[InputRecorder] = None,
+) -> Iterator[SimSession]:
+    """
+    with sim_mode(ScriptedScreen(...)) as sim:
+        assist_login(bot_id=1)
+        print(sim.clock.elapsed, sim.recorder.clicks)
+
+    screen = ScriptedScreen (reageert op input) of ReplayGrabber (opgenomen frames).
+    """
+    clock = clock or VirtualClock()
+    recorder = recorder or InputRecorder(clock)
+    if isinstance(screen, ScriptedScreen):
+        screen.clock = clock
+        screen._entered = clock.monotonic()
+        recorder.listeners.append(screen.on_input)
+
+    prev_grabber = set_grabber(screen)
+    prev_mouse = ai_cursor.set_mouse(recorder)
+    prev_keyboard = ai_keyboard.set_keyboard(recorder)
+    clock.install()
+    invalidate_frame()
+    get_roi_tracker().forget()
+    try:
+        yield SimSession(clock, recorder, screen)
+    finally:
+        clock.uninstall()
+        ai_keyboard.set_keyboard(prev_keyboard)
+        ai_cursor.set_mouse(prev_mouse)
+        set_grabber(prev_grabber)
+        invalidate_frame()
+        get_roi_tracker().forget()
+        if isinstance(screen, ScriptedScreen) and screen.on_input in recorder.listeners:
+            recorder.listeners.remove(screen.on_input)
+# === END API ===
+
+
+# === START CLI TEST ===
+# • WAT: veilige handmatige test zonder scherm of input.
+# • WAAROM: laat zien dat sleeps virtueel zijn en input in de recorder belandt.
+if __name__ == "__main__":
+    from core import sim  # __main__ is een losse kopie; install() patcht alleen modules onder ROOT
+
+    blank = np.zeros((100, 200, 3), dtype=np.uint8)
+    lit = np.full((100, 200, 3), 255, dtype=np.uint8)
+    screen = sim.ScriptedScreen(
+        {"uit": blank, "aan": lit},
+        start="uit",
+        transitions=[sim.Transition("uit", "aan", box=(0, 0, 50, 50), after=1.5), sim.Transition("aan", "uit", after=3.0)],
+    )
+    with sim.sim_mode(screen) as s:
+        t0 = time.perf_counter()
+        ai_cursor.move_and_click((10, 10))
+        ai_keyboard.type_text("ok")
+        s.clock.advance(2.0)
+        on = screen.grab().mean() > 0
+        s.clock.advance(3.0)
+        off = screen.grab().mean() == 0
+        real_ms = (time.perf_counter() - t0) * 1000
+        print(f"{'🟢' if on and off else '🔴'} scherm aan na klik, uit na timer | virtueel {s.clock.elapsed:.2f}s, echt {real_ms:.1f} ms")
+        print(f"🖱️ moves={s.recorder.moves} events={[(e.kind, e.key, e.x, e.y) for e in s.recorder.events]}")
+# === END CLI TEST ===
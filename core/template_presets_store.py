@@ -1,10 +1,16 @@
 import json
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Dict
 
+from core.json_cache import JsonFileCache
 from core.paths import CONFIG_DIR
 
 PRESETS_FILE = Path(CONFIG_DIR) / "templates_presets.json"
 
+# 1x parsen, mtime check hooguit 1x per interval (load_preset zit in polling loops)
+_PRESETS_CACHE = JsonFileCache(PRESETS_FILE)
+
 DEFAULT_PRESET = {
     "method_name": "TM_CCOEFF_NORMED",
     "vorm_drempel": 90.0,
@@ -12,6 +18,20 @@ DEFAULT_PRESET = {
 }
 
 
+@dataclass(frozen=True)
+class TemplatePreset:
+    method_name: str = DEFAULT_PRESET["method_name"]
+    vorm_drempel: float = DEFAULT_PRESET["vorm_drempel"]
+    kleur_drempel: float = DEFAULT_PRESET["kleur_drempel"]
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+_TYPED: Dict[str, TemplatePreset] = {}
+_TYPED_VERSION = -1
+
+
 def normalize_image_name(image_name: str) -> str:
     image_name = (image_name or "").strip()
     if not image_name.lower().endswith(".png"):
@@ -20,26 +40,40 @@ def normalize_image_name(image_name: str) -> str:
 
 
 def load_presets() -> dict:
-    if not PRESETS_FILE.exists():
-        return {}
-    try:
-        return json.loads(PRESETS_FILE.read_text(encoding="utf-8-sig"))
-    except Exception:
-        return {}
+    # kopie: callers (save_preset) muteren het resultaat
+    return dict(_PRESETS_CACHE.data())
 
 
 def save_presets(presets: dict) -> None:
     PRESETS_FILE.parent.mkdir(parents=True, exist_ok=True)
     PRESETS_FILE.write_text(json.dumps(presets, indent=2, ensure_ascii=False), encoding="utf-8")
+    _PRESETS_CACHE.invalidate()
 
 
-def load_preset(image_name: str) -> dict:
+def get_preset(image_name: str) -> TemplatePreset:
+    global _TYPED, _TYPED_VERSION
     name = normalize_image_name(image_name)
-    presets = load_presets()
-    raw = presets.get(name, {})
-    if not isinstance(raw, dict):
-        raw = {}
-    return DEFAULT_PRESET | raw
+    presets = _PRESETS_CACHE.data()
+    if _TYPED_VERSION != _PRESETS_CACHE.version:
+        _TYPED, _TYPED_VERSION = {}, _PRESETS_CACHE.version
+
+    preset = _TYPED.get(name)
+    if preset is None:
+        raw = presets.get(name, {})
+        if not isinstance(raw, dict):
+            raw = {}
+        merged = DEFAULT_PRESET | raw
+        preset = TemplatePreset(
+            method_name=str(merged["method_name"]),
+            vorm_drempel=float(merged["vorm_drempel"]),
+            kleur_drempel=float(merged["kleur_drempel"]),
+        )
+        _TYPED[name] = preset
+    return preset
+
+
+def load_preset(image_name: str) -> dict:
+    return get_preset(image_name).as_dict()
 
 
 def save_preset(image_name: str, method_name: str, vorm_drempel: float, kleur_drempel: float) -> dict:
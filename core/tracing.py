@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: centraal en voorspelbaar; bewust alleen stdlib (wordt overal in de hot path geïmporteerd).
+from typing import Dict, List, Optional, Tuple
+import json
+import os
+import threading
+import time
+
+from core.paths import LOGS_DIR
+# === END IMPORTS ===
+
+
+# === START CONSTANTS ===
+# • WAT: stage namen, env schakelaar en histogram layout.
+# • WAAROM: vaste namen => rapporten van verschillende runs zijn vergelijkbaar.
+TRACE_ENV = "BOT_TRACE"
+TRACE_DIR = LOGS_DIR / "trace"
+
+STAGE_GRAB = "grab"        # scherm lezen (grabber backend)
+STAGE_CONVERT = "convert"  # kleurconversie (BGR->RGB, RGB->GRAY)
+STAGE_MATCH = "match"      # matchTemplate / match_all engine / pyramid
+STAGE_SCORE = "score"      # kleurscore op de gevonden patch
+STAGE_MOVE = "move"        # cursor beweging
+STAGE_CLICK = "click"      # klik (incl. klik delay)
+STAGE_STEP = "step"        # omhullende: één bot step in de scheduler
+
+STAGES = (STAGE_GRAB, STAGE_CONVERT, STAGE_MATCH, STAGE_SCORE, STAGE_MOVE, STAGE_CLICK, STAGE_STEP)
+
+# bucket i = [2**(i-1), 2**i) µs; laatste bucket vangt alles vanaf ~33 s
+HIST_BUCKETS = 26
+
+TRACING = os.getenv(TRACE_ENV, "") not in ("", "0")
+
+TraceKey = Tuple[str, Optional[str], Optional[str], Optional[int]]  # (stage, template, area, bot)
+# === END CONSTANTS ===
+
+
+# === START MODELS ===
+# • WAT: log2 histogram per key (count/total/min/max + buckets).
+# • WAAROM: vaste grootte, O(1) per sample; percentielen zijn goed genoeg om hotspots te zien.
+class Histogram:
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * HIST_BUCKETS
+
+    def add(self, ns: int) -> None:
+        if self.count == 0 or ns < self.min_ns:
+            self.min_ns = ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        self.count += 1
+        self.total_ns += ns
+        self.buckets[min((ns // 1000).bit_length(), HIST_BUCKETS - 1)] += 1
+
+    def merge(self, other: "Histogram") -> None:
+        if other.count == 0:
+            return
+        if self.count == 0 or other.min_ns < self.min_ns:
+            self.min_ns = other.min_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.count += other.count
+        self.total_ns += other.total_ns
+        for i, n in enumerate(other.buckets):
+            self.buckets[i] += n
+
+    def percentile_ms(self, q: float) -> float:
+        """Bovengrens van de bucket waar q (0..1) in valt, begrensd op max."""
+        if self.count == 0:
+            return 0.0
+        need = max(1, int(q * self.count + 0.999999))
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= need:
+                return min((1 << i) / 1000.0, self.max_ns / 1e6)
+        return self.max_ns / 1e6
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ns / 1e6, 3),
+            "mean_ms": round(self.total_ns / 1e6 / self.count, 4) if self.count else 0.0,
+            "min_ms": round(self.min_ns / 1e6, 4),
+            "p50_ms": round(self.percentile_ms(0.50), 4),
+            "p90_ms": round(self.percentile_ms(0.90), 4),
+            "p99_ms": round(self.percentile_ms(0.99), 4),
+            "max_ms": round(self.max_ns / 1e6, 4),
+            "buckets_us_log2": list(self.buckets),
+        }
+# === END MODELS ===
+
+
+# === START CORE LOGIC ===
+# • WAT: spans + context (template/area/bot) per thread, aggregatie in histograms.
+# • WAAROM: uitgeschakeld kost een span één global check + een gedeeld no-op object.
+_HISTS: Dict[TraceKey, Histogram] = {}
+_LOCK = threading.Lock()
+_LOCAL = threading.local()
+_EMPTY_CTX: Tuple[Optional[str], Optional[str], Optional[int]] = (None, None, None)
+
+
+def record(stage: str, ns: int) -> None:
+    """Voeg één meting (nanoseconden) toe onder de huidige context."""
+    key = (stage, *getattr(_LOCAL, "ctx", _EMPTY_CTX))
+    with _LOCK:
+        h = _HISTS.get(key)
+        if h is None:
+            h = _HISTS[key] = Histogram()
+        h.add(int(ns))
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+
+_NULL = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("stage", "t0")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self.t0 = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *_exc):
+        record(self.stage, time.perf_counter_ns() - self.t0)
+        return False
+
+
+class _Context:
+    __slots__ = ("ctx", "prev")
+
+    def __init__(self, ctx: Tuple[Optional[str], Optional[str], Optional[int]]):
+        self.ctx = ctx
+
+    def __enter__(self):
+        self.prev = getattr(_LOCAL, "ctx", _EMPTY_CTX)
+        _LOCAL.ctx = self.ctx
+        return self
+
+    def __exit__(self, *_exc):
+        _LOCAL.ctx = self.prev
+        return False
+
+
+def span(stage: str):
+    """with span(STAGE_MATCH): ...  — no-op als tracing uit staat."""
+    return _Span(stage) if TRACING else _NULL
+
+
+def current_context() -> Tuple[Optional[str], Optional[str], Optional[int]]:
+    """(template, area, bot) van deze thread; bv. om mee te geven aan een input worker."""
+    return getattr(_LOCAL, "ctx", _EMPTY_CTX)
+
+
+def trace_context(template: Optional[str] = None, area: Optional[str] = None, bot: Optional[int] = None):
+    """
+    Zet de labels voor spans binnen het with-blok (per thread, nestbaar).
+    None = erf van de omliggende context.
+    """
+    if not TRACING:
+        return _NULL
+    t, a, b = getattr(_LOCAL, "ctx", _EMPTY_CTX)
+    return _Context((
+        template if template is not None else t,
+        area if area is not None else a,
+        int(bot) if bot is not None else b,
+    ))
+
+
+def enable(on: bool = True) -> None:
+    global TRACING
+    TRACING = bool(on)
+
+
+def is_enabled() -> bool:
+    return TRACING
+
+
+def reset() -> None:
+    with _LOCK:
+        _HISTS.clear()
+
+
+def snapshot() -> Dict[TraceKey, Histogram]:
+    """Kopie van alle histograms (veilig om buiten de lock te lezen)."""
+    out: Dict[TraceKey, Histogram] = {}
+    with _LOCK:
+        for key, h in _HISTS.items():
+            c = out[key] = Histogram()
+            c.merge(h)
+    return out
+
+
+def summary(by: Tuple[str, ...] = ("stage",)) -> Dict[tuple, Histogram]:
+    """
+    Histograms samengevoegd per combinatie van velden uit ("stage", "template", "area", "bot").
+    summary()                      => per stage over alles heen
+    summary(("stage", "template")) => per stage per template
+    """
+    fields = ("stage", "template", "area", "bot")
+    idx = [fields.index(f) for f in by]
+    out: Dict[tuple, Histogram] = {}
+    for key, h in snapshot().items():
+        k = tuple(key[i] for i in idx)
+        agg = out.get(k)
+        if agg is None:
+            agg = out[k] = Histogram()
+        agg.merge(h)
+    return out
+# === END CORE LOGIC ===
+
+
+# === START OUTPUT ===
+# • WAT: tekst rapport + JSON lines dump onder LOGS_DIR.
+# • WAAROM: snel in de terminal kijken, en runs later naast elkaar leggen.
+def report(by: Tuple[str, ...] = ("stage",)) -> str:
+    rows = sorted(summary(by).items(), key=lambda kv: -kv[1].total_ns)
+    work = sum(h.total_ns for k, h in rows if STAGE_STEP not in k) or 1
+
+    label_w = max([len(" / ".join(str(v) for v in k)) for k, _ in rows] + [len(" / ".join(by))])
+    lines = [
+        f"{' / '.join(by):<{label_w}} {'count':>7} {'total ms':>10} {'mean':>8} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8} {'share':>6}"
+    ]
+    for k, h in rows:
+        d = h.to_dict()
+        share = "" if STAGE_STEP in k else f"{h.total_ns / work:6.1%}"
+        lines.append(
+            f"{' / '.join(str(v) for v in k):<{label_w}} {h.count:>7} {d['total_ms']:>10.2f} {d['mean_ms']:>8.3f} "
+            f"{d['p50_ms']:>8.3f} {d['p90_ms']:>8.3f} {d['p99_ms']:>8.3f} {d['max_ms']:>8.3f} {share:>6}"
+        )
+    return "\n".join(lines)
+
+
+def dump_jsonl(path: Optional[Path] = None, reset_after: bool = False) -> Path:
+    """
+    Schrijft 1 regel per (stage, template, area, bot) naar logs/trace/trace_<datum>.jsonl (append).
+    Returns het pad.
+    """
+    path = Path(path) if path is not None else TRACE_DIR / f"trace_{time.strftime('%Y%m%d')}.jsonl"
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    ts = round(time.time(), 3)
+    lines: List[str] = []
+    for (stage, template, area, bot), h in sorted(snapshot().items(), key=lambda kv: tuple(str(v) for v in kv[0])):
+        row = {"ts": ts, "pid": os.getpid(), "stage": stage, "template": template, "area": area, "bot": bot}
+        row.update(h.to_dict())
+        lines.append(json.dumps(row, ensure_ascii=False))
+
+    with path.open("a", encoding="utf-8") as f:
+        for line in lines:
+            f.write(line + "\n")
+
+    if reset_after:
+        reset()
+    return path
+# === END OUTPUT ===
+
+
+# === START CLI TEST ===
+# • WAT: veilige handmatige test zonder klikken.
+# • WAAROM: laat zien waar de tijd van een XP check heen gaat + wat een uitgeschakelde span kost.
+if __name__ == "__main__":
+    from core import tracing as tr  # __main__ is een losse kopie; detectors gebruiken deze
+    from vision.image_detection import detect_image
+
+    n = 200000
+    tr.enable(False)
+    t0 = time.perf_counter()
+    for _ in range(n):
+        with tr.span(STAGE_MATCH):
+            pass
+    print(f"⏱️ span uit: {(time.perf_counter() - t0) / n * 1e9:.0f} ns")
+
+    tr.enable(True)
+    for _ in range(50):
+        detect_image("XP.png", "Info_Area", bot_id=1, verbose="off")
+    print(tr.report(("stage", "template", "area", "bot")))
+    print(f"💾 {tr.dump_jsonl()}")
+# === END CLI TEST ===
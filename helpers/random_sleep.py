@@ -5,6 +5,7 @@
 
 
 # === START IMPORTS ===
+import sys
 import time
 import random
 # === END IMPORTS ===
@@ -23,6 +24,26 @@ DEFAULT_LONG_RANGE = (6.5, 9.0)
 # WAT: Simpele sleep-functies voor scripts.
 # WAAROM: Scripts blijven 1-regel simpel: random_sleep()
 
+def _random_duration(short_mid_chance, short_mid_range, long_range):
+    # Veiligheid: zorg dat ranges kloppen (zonder ingewikkeld te doen)
+    a, b = short_mid_range
+    c, d = long_range
+
+    if a > b:
+        a, b = b, a
+    if c > d:
+        c, d = d, c
+
+    if random.random() < short_mid_chance:
+        return random.uniform(a, b)
+    return random.uniform(c, d)
+
+
+def _custom_duration(min_sec, max_sec):
+    lo, hi = (min_sec, max_sec) if min_sec <= max_sec else (max_sec, min_sec)
+    return random.uniform(lo, hi)
+
+
 def random_sleep(
     short_mid_chance=DEFAULT_SHORT_MID_CHANCE,
     short_mid_range=DEFAULT_SHORT_MID_RANGE,
@@ -40,33 +61,59 @@ def random_sleep(
     - Bedoeld voor scripts en flows (zoals assist_login).
     - Niet bedoeld om automatisch in core primitives te gebruiken.
     """
-    # Veiligheid: zorg dat ranges kloppen (zonder ingewikkeld te doen)
-    a, b = short_mid_range
-    c, d = long_range
-
-    if a > b:
-        a, b = b, a
-    if c > d:
-        c, d = d, c
-
-    if random.random() < short_mid_chance:
-        time.sleep(random.uniform(a, b))
-    else:
-        time.sleep(random.uniform(c, d))
+    time.sleep(_random_duration(short_mid_chance, short_mid_range, long_range))
 
 
 def sleep_custom(min_sec, max_sec):
     """Simpele custom sleep (handig voor scripts)."""
-    lo, hi = (min_sec, max_sec) if min_sec <= max_sec else (max_sec, min_sec)
-    time.sleep(random.uniform(lo, hi))
+    time.sleep(_custom_duration(min_sec, max_sec))
 # === END HELPERS ===
 
 
+# === START ASYNC HELPERS ===
+# WAT: Zelfde sleeps voor asyncio flows (core/async_api.py).
+# WAAROM: await i.p.v. time.sleep => andere bots in dezelfde event loop lopen door.
+
+async def async_sleep(seconds):
+    """
+    await async_sleep(0.9)
+
+    In sim mode (core/sim.py active_clock()) alleen de virtuele klok verzetten
+    en 1x de event loop laten draaien.
+    """
+    import asyncio  # hier pas: sync scripts laden asyncio niet (±40 ms startup)
+
+    sim = sys.modules.get("core.sim")  # niet importeren: zonder core.sim geen sim mode
+    clock = sim.active_clock() if sim is not None else None
+    if clock is None:
+        await asyncio.sleep(max(0.0, seconds))
+    else:
+        clock.sleep(seconds)
+        await asyncio.sleep(0)
+
+
+async def random_sleep_async(
+    short_mid_chance=DEFAULT_SHORT_MID_CHANCE,
+    short_mid_range=DEFAULT_SHORT_MID_RANGE,
+    long_range=DEFAULT_LONG_RANGE,
+):
+    """Async random_sleep(): zelfde verdeling, blokkeert de event loop niet."""
+    await async_sleep(_random_duration(short_mid_chance, short_mid_range, long_range))
+
+
+async def sleep_custom_async(min_sec, max_sec):
+    """Async sleep_custom()."""
+    await async_sleep(_custom_duration(min_sec, max_sec))
+# === END ASYNC HELPERS ===
+
+
 # === START CLI TEST ===
 # WAT: Veilige self-test.
 # WAAROM: Snel checken of het werkt zonder andere modules.
 
 if __name__ == "__main__":
+    import asyncio
+
     print("\n🧪 sleep_utils SELF TEST")
     print("▶ random_sleep() 5x")
     for i in range(5):
@@ -78,5 +125,14 @@ if __name__ == "__main__":
         print(f"  ▶ poging {i+1}/3")
         sleep_custom(0.2, 0.4)
 
+    print("▶ sleep_custom_async(0.2, 0.4) 5x tegelijk")
+    t0 = time.perf_counter()
+
+    async def _five():
+        await asyncio.gather(*(sleep_custom_async(0.2, 0.4) for _ in range(5)))
+
+    asyncio.run(_five())
+    print(f"  ▶ {time.perf_counter() - t0:.2f}s (i.p.v. 5x na elkaar)")
+
     print("✅ klaar\n")
 # === END CLI TEST ===
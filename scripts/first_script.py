@@ -17,6 +17,7 @@ import time
 from pathlib import Path
 from vision.colour_detection import detect_colour
 from vision.image_detection import detect_image
+from vision.frame_capture import capture_frame
 from core.click_image import click_image
 from core.helpers.assist_login import assist_login
 
@@ -30,13 +31,16 @@ BOT_ID = 1
 
 assist_login(bot_id=BOT_ID, timeout=15.0, verbose=VERBOSE)
 
-if detect_image("XP.png", "Info_Area", bot_id=BOT_ID, verbose="short"):
+# 1 screenshot voor alle checks van deze tick
+frame = capture_frame()
+
+if detect_image("XP.png", "Info_Area", bot_id=BOT_ID, verbose="short", frame=frame):
     print ("Image found")
 else: 
     print ("Image not found")
 
 
-if detect_colour("green", "Skilling_Area", 3, bot_id=1, verbose=True):
+if detect_colour("green", "Skilling_Area", 3, bot_id=1, verbose=True, frame=frame):
     print ("Skilling")
 else:
     print ("Not Skilling")
@@ -0,0 +1,48 @@
+# ============================================================
+# BOOTSTRAP (altijd eerst)
+# ============================================================
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# ============================================================
+# IMPORTS
+# ============================================================
+
+from core.bot_offsets import BOT_OFFSETS
+from core.helpers.assist_login import login_step
+from core.scheduler import STOP, MultiBotScheduler
+from states.skilling_status import is_skilling
+from vision.image_detection import detect_image
+
+# ============================================================
+# RUN
+# ============================================================
+
+VERBOSE = True
+
+BOT_IDS = sorted(BOT_OFFSETS)
+
+
+def status_step(ctx):
+    # zelfde checks als first_script, maar op het gedeelde tick-frame
+    xp = detect_image("XP.png", "Info_Area", bot_id=ctx.bot_id, verbose="off", frame=ctx.frame)
+    skilling = is_skilling(ctx.bot_id, verbose=False, frame=ctx.frame)
+    print(f"🤖 bot {ctx.bot_id} | XP {'✅' if xp else '❌'} | skilling {'✅' if skilling else '❌'}")
+    return STOP
+
+
+# 1) alle bots tegelijk inloggen (1 screenshot per tick, kliks via 1 queue)
+sched = MultiBotScheduler(verbose=VERBOSE)
+for bot_id in BOT_IDS:
+    sched.add(bot_id, login_step)
+sched.run(duration=30.0)
+
+# 2) status van alle bots uit 1 frame
+for bot_id in BOT_IDS:
+    sched.add(bot_id, status_step)
+sched.run()
+sched.close()
@@ -10,8 +10,9 @@
 # - soms stoppen
 # - soms mini terug
 #
-# Alles wordt opgeslagen in JSON met "menselijke tijd",
+# Alles wordt opgeslagen in een binair .npy log (t, x, y) met "menselijke tijd",
 # terwijl het script zelf supersnel runt (speedrun).
+# Lezen: core.cursor_log.read_cursor_log(pad) -> memory-mapped array.
 #
 # Doel:
 # - 5 uur menselijk cursor-gedrag
@@ -41,11 +42,12 @@ if str(ROOT) not in sys.path:
 
 import time
 import random
-import json
 from datetime import datetime
 from pynput.mouse import Controller
 import pyautogui
 
+from core.cursor_log import CursorLogWriter
+
 
 # ------------------------------------------------------------
 # RECORDER
@@ -54,37 +56,31 @@ import pyautogui
 # Belangrijk:
 # - time.sleep wordt gespeedrund
 # - maar dt (menselijke tijd) blijft correct
+# - punten gaan direct naar schijf (12 bytes per punt, vast geheugen)
 # ------------------------------------------------------------
 
 class CursorRecorder:
     def __init__(self):
         self.time = 0          # totale menselijke tijd in seconden
-        self.moves = []        # alle cursorpunten
+
+        # automatisch bestand met datum + tijd
+        created = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        self.name = f"cursor_log_{created}.npy"
+        self.moves = CursorLogWriter(self.name, meta={"created": created})
 
     def log(self, x, y, dt):
         # dt = hoeveel tijd dit menselijk zou duren
         self.time += dt
-        self.moves.append({
-            "t": round(self.time, 5),
-            "x": x,
-            "y": y
-        })
+        self.moves.append(self.time, x, y)
 
     def save(self, speedrun):
-        # automatisch bestand met datum + tijd
-        name = datetime.now().strftime("cursor_log_%Y-%m-%d_%H-%M-%S.json")
-
-        with open(name, "w") as f:
-            json.dump({
-                "meta": {
-                    "hours_simulated": round(self.time / 3600, 2),
-                    "speedrun_factor": speedrun,
-                    "points": len(self.moves)
-                },
-                "moves": self.moves
-            }, f, indent=2)
-
-        print(f"\n💾 Log opgeslagen: {name}")
+        self.moves.meta.update(
+            hours_simulated=round(self.time / 3600, 2),
+            speedrun_factor=speedrun,
+        )
+        self.moves.close()
+
+        print(f"\n💾 Log opgeslagen: {self.name}")
         print(f"📍 Punten: {len(self.moves):,}")
 
 
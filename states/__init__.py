@@ -1,38 +1,88 @@
 ﻿from __future__ import annotations
 
 import importlib
-import pkgutil
 from pathlib import Path
 
-__all__ = []
+# status modules worden pas geïmporteerd bij het eerste gebruik (PEP 562 __getattr__ hieronder):
+# `from states import logged_in` laadt alleen logged_in_status, `states.STATES` / `import *` laadt alles.
 _load_errors: dict[str, str] = {}
+_loaded: dict = {}  # module naam -> state functie (of None bij een load error); STATES = naam -> functie
 
 PACKAGE_PATH = Path(__file__).parent
 PACKAGE_NAME = __name__
 
-for m in pkgutil.iter_modules([str(PACKAGE_PATH)]):
-    mod_name = m.name
-    if not mod_name.endswith("_status"):
-        continue
+# gewone directory listing i.p.v. pkgutil.iter_modules (die trekt inspect mee: ±25 ms bij elke start)
+_STATUS_MODULES = sorted(p.stem for p in PACKAGE_PATH.iterdir() if p.name.endswith("_status.py"))
+_ENGINE_EXPORTS = ("FrameMemo", "StateEngine", "StateSnapshot", "evaluate_states", "state")
 
+
+def _load_module(mod_name: str):
+    if mod_name in _loaded:
+        return _loaded[mod_name]
+    _loaded[mod_name] = None
     try:
         mod = importlib.import_module(f"{PACKAGE_NAME}.{mod_name}")
     except Exception as e:
         _load_errors[mod_name] = f"{type(e).__name__}: {e}"
-        continue
+        return None
 
     func_name = mod_name.removesuffix("_status")
     fn = getattr(mod, func_name, None)
 
-    if callable(fn):
-        globals()[func_name] = fn
-        __all__.append(func_name)
-    else:
+    if not callable(fn):
+        # anders genoemde functie (bv. is_skilling in skilling_status) => de @state functie uit die module
+        fn = next((v for v in vars(mod).values() if callable(v) and hasattr(v, "__state_needs__")), None)
+        func_name = getattr(fn, "__name__", func_name)
+
+    if not callable(fn):
         _load_errors[mod_name] = f"Geen callable '{func_name}' gevonden in module"
+        return None
+
+    globals()[func_name] = fn
+    _loaded[mod_name] = fn
+    return fn
+
+
+def _load_all() -> None:
+    if "STATES" in globals():
+        return
+    for mod_name in _STATUS_MODULES:
+        _load_module(mod_name)
+    # vaste volgorde (module namen), los van welke state toevallig eerst gevraagd werd
+    states = {fn.__name__: fn for fn in (_loaded[m] for m in _STATUS_MODULES) if fn is not None}
+    globals()["__all__"] = list(states)
+    globals()["STATES"] = states
+
+
+def __getattr__(name: str):
+    if name in _ENGINE_EXPORTS:
+        from states import engine
+
+        return getattr(engine, name)
+
+    if f"{name}_status" in _STATUS_MODULES:
+        fn = _load_module(f"{name}_status")
+        if fn is not None and fn.__name__ == name:
+            return fn
+
+    if not name.startswith("__") or name == "__all__":
+        _load_all()
+        if name in globals():
+            return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    _load_all()
+    return sorted(set(globals()) | set(_ENGINE_EXPORTS))
+
 
 def debug_states() -> None:
+    _load_all()
     print(" states debug")
     print(" exports:", __all__)
+    for name, fn in STATES.items():
+        print(f"   {name}: areas={fn.__state_needs__.areas if hasattr(fn, '__state_needs__') else '-'}")
     if _load_errors:
         print(" load errors:")
         for k, v in _load_errors.items():
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: centraal en voorspelbaar, voorkomt verborgen dependencies.
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+import inspect
+
+from vision.colour_detection import COLOR_RANGES, _normalize_colour, colour_percentages, judge_colours
+from vision.frame_capture import Frame, capture_frame
+from vision.image_detection import Match, detect_image, detect_many
+# === END IMPORTS ===
+
+
+# === START MODELS ===
+# • WAT: wat een state nodig heeft uit het frame.
+# • WAAROM: de engine haalt alles voor alle states in 1 batch op vóór de eerste state draait.
+@dataclass(frozen=True)
+class StateNeeds:
+    templates: Tuple[Tuple[str, str], ...] = ()   # (template, area)
+    colours: Tuple[Tuple[str, str], ...] = ()     # (area, kleur)
+
+    @property
+    def areas(self) -> List[str]:
+        return sorted({a for _, a in self.templates} | {a for a, _ in self.colours})
+
+    def merge(self, other: "StateNeeds") -> "StateNeeds":
+        return StateNeeds(
+            templates=tuple(dict.fromkeys(self.templates + other.templates)),
+            colours=tuple(dict.fromkeys(self.colours + other.colours)),
+        )
+
+
+def state(
+    templates: Optional[Mapping[str, str]] = None,
+    colours: Optional[Mapping[str, Sequence[str]]] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    @state(templates={"XP.png": "Info_Area"})
+    def logged_in(*, bot_id=1, frame=None, memo=None): ...
+
+    Alleen een declaratie (fn.__state_needs__); de functie zelf blijft los aan te roepen.
+    """
+    needs = StateNeeds(
+        templates=tuple((name, area) for name, area in (templates or {}).items()),
+        colours=tuple((area, _normalize_colour(c)) for area, cs in (colours or {}).items() for c in cs),
+    )
+
+    def _wrap(fn: Callable[..., Any]) -> Callable[..., Any]:
+        fn.__state_needs__ = needs
+        return fn
+
+    return _wrap
+
+
+def needs_of(fn: Callable[..., Any]) -> StateNeeds:
+    return getattr(fn, "__state_needs__", None) or StateNeeds()
+# === END MODELS ===
+
+
+# === START MEMO ===
+# • WAT: detecties op één frame voor één bot, elk hooguit 1x.
+# • WAAROM: tien states die XP/kleur vragen kosten samen 1 capture + de unieke detecties.
+class FrameMemo:
+    """
+    memo.image("XP.png", "Info_Area")            => Match of None
+    memo.colours("Skilling_Area", ["groen"])     => {"groen": 3.1}
+
+    frame=None => elke detectie grabt zelf (zelfde gedrag als zonder engine).
+    """
+
+    def __init__(self, frame: Optional[Frame], bot_id: int = 1):
+        self.frame = frame
+        self.bot_id = int(bot_id)
+        self._images: Dict[Tuple[str, str], Optional[Match]] = {}
+        self._colours: Dict[str, Dict[str, float]] = {}
+        self.detections = 0   # daadwerkelijk uitgevoerde detect/scan calls (stats)
+
+    def image(self, name: str, area: str) -> Optional[Match]:
+        key = (name, area)
+        if key not in self._images:
+            self.detections += 1
+            self._images[key] = detect_image(name, area, bot_id=self.bot_id, verbose="off", frame=self.frame)
+        return self._images[key]
+
+    def prefetch_images(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        """Alle nog onbekende (template, area) paren via detect_many (1 gray conversie over de omhullende)."""
+        missing = [p for p in dict.fromkeys(pairs) if p not in self._images]
+        while missing:
+            # detect_many gebruikt de naam als key: zelfde template in een 2e area => extra batch
+            batch: Dict[str, str] = {}
+            rest: List[Tuple[str, str]] = []
+            for name, area in missing:
+                if name in batch:
+                    rest.append((name, area))
+                else:
+                    batch[name] = area
+            self.detections += 1
+            hits = detect_many(batch, bot_id=self.bot_id, verbose="off", frame=self.frame)
+            for name, area in batch.items():
+                self._images[(name, area)] = hits[name]
+            missing = rest
+
+    def colours(self, area: str, colours: Iterable[str]) -> Dict[str, float]:
+        names = [_normalize_colour(c) for c in colours]
+        have = self._colours.setdefault(area, {})
+        missing = [c for c in dict.fromkeys(names) if c not in have]
+        if missing:
+            self.detections += 1
+            have.update(colour_percentages(area, missing, bot_id=self.bot_id, frame=self.frame))
+        return {c: have[c] for c in names}
+
+    def detect_colours(self, percentages: Mapping[str, float], area: str, verbose: bool = False) -> Dict[str, bool]:
+        """Zelfde resultaat als colour_detection.detect_colours, meting uit de memo."""
+        known = [c for c in percentages if _normalize_colour(c) in COLOR_RANGES]
+        return judge_colours(percentages, self.colours(area, known), area, bot_id=self.bot_id, verbose=verbose)
+
+    def prefetch(self, needs: StateNeeds) -> None:
+        self.prefetch_images(needs.templates)
+        per_area: Dict[str, List[str]] = {}
+        for area, c in needs.colours:
+            per_area.setdefault(area, []).append(c)
+        for area, cs in per_area.items():
+            self.colours(area, cs)
+# === END MEMO ===
+
+
+# === START ENGINE ===
+# • WAT: bindt alle state functies aan één frame per bot en onthoudt de uitkomsten.
+# • WAAROM: flows vragen dezelfde states meerdere keren per tick; alleen de eerste keer kost iets.
+class StateSnapshot:
+    """
+    snap = evaluate_states(bot_id=1)
+    snap.logged_in, snap["is_skilling"], snap.as_dict()
+
+    States worden pas bij de eerste vraag uitgerekend (daarna uit de cache);
+    alle gedeclareerde detecties zijn al in 1 batch gedaan.
+    """
+
+    def __init__(self, engine: "StateEngine", frame: Optional[Frame], bot_id: int, memo: FrameMemo):
+        self._engine = engine
+        self.frame = frame
+        self.bot_id = bot_id
+        self.memo = memo
+        self._values: Dict[str, Any] = {}
+        self.errors: Dict[str, str] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._values:
+            self._values[name] = self._engine._call(name, self)
+        return self._values[name]
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or name not in self._engine.states:
+            raise AttributeError(name)
+        return self[name]  # fouten in de state zelf (bv. KeyError op een area) komen door
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._engine.states
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self[name] if name in self._engine.states else default
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: self[name] for name in self._engine.states}
+
+    def __repr__(self) -> str:
+        vals = ", ".join(f"{k}={v!r}" for k, v in self._values.items())
+        return f"StateSnapshot(bot={self.bot_id}, seq={getattr(self.frame, 'seq', None)}, {vals})"
+
+
+class StateEngine:
+    """
+    engine = StateEngine()                       # alle states uit het states package
+    snap = engine.evaluate(bot_id=1)             # 1 capture + 1 batch voor alle gedeclareerde detecties
+    snap2 = engine.evaluate(bot_id=1, frame=f)   # zelfde frame + bot => zelfde snapshot (memo)
+
+    State functies krijgen (voor zover ze die parameters hebben): bot_id, frame, memo, verbose=False.
+    """
+
+    def __init__(self, states: Optional[Mapping[str, Callable[..., Any]]] = None):
+        if states is None:
+            from states import STATES  # pas hier: states/__init__ importeert de *_status modules (die deze module importeren)
+
+            states = STATES
+        self.states: Dict[str, Callable[..., Any]] = dict(states)
+        self._params = {name: set(inspect.signature(fn).parameters) for name, fn in self.states.items()}
+        self.needs = StateNeeds()
+        for fn in self.states.values():
+            self.needs = self.needs.merge(needs_of(fn))
+        self._last: Dict[int, StateSnapshot] = {}
+
+    def evaluate(self, bot_id: int = 1, frame: Optional[Frame] = None, prefetch: bool = True) -> StateSnapshot:
+        frame = frame if frame is not None else capture_frame()
+
+        snap = self._last.get(bot_id)
+        if snap is not None and snap.frame is frame:
+            return snap
+
+        memo = FrameMemo(frame, bot_id)
+        if prefetch:
+            memo.prefetch(self.needs)
+        snap = self._last[bot_id] = StateSnapshot(self, frame, bot_id, memo)
+        return snap
+
+    def _call(self, name: str, snap: StateSnapshot) -> Any:
+        fn = self.states[name]  # KeyError = onbekende state
+        params = self._params[name]
+        kwargs: Dict[str, Any] = {}
+        if "bot_id" in params:
+            kwargs["bot_id"] = snap.bot_id
+        if "frame" in params:
+            kwargs["frame"] = snap.frame
+        if "memo" in params:
+            kwargs["memo"] = snap.memo
+        if "verbose" in params:
+            kwargs["verbose"] = False
+        try:
+            return fn(**kwargs)
+        except Exception as e:
+            # niet als None teruggeven: dat is niet te onderscheiden van "niet ingelogd"
+            snap.errors[name] = f"{type(e).__name__}: {e}"
+            raise
+
+
+_ENGINE: Optional[StateEngine] = None
+# === END ENGINE ===
+
+
+# === START API ===
+# • WAT: gedeelde engine over alle ontdekte states.
+# • WAAROM: flows hoeven geen StateEngine te beheren.
+def get_state_engine() -> StateEngine:
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = StateEngine()
+    return _ENGINE
+
+
+def evaluate_states(bot_id: int = 1, frame: Optional[Frame] = None) -> StateSnapshot:
+    return get_state_engine().evaluate(bot_id, frame)
+# === END API ===
+
+
+# === START CLI TEST ===
+# • WAT: veilige handmatige test op een gescript scherm.
+# • WAAROM: 10 state-vragen los (elk eigen grab + detectie) vs 1 snapshot.
+if __name__ == "__main__":
+    import time
+
+    import numpy as np
+
+    from core import tracing
+    from core.area_registry import area_box
+    from core.sim import ScriptedScreen
+    from vision.compiled_template import get_compiled_template
+    from vision.grabbers import set_grabber
+
+    import states
+
+    rng = np.random.default_rng(0)
+    rgb = rng.integers(40, 110, (1080, 1920, 3), dtype=np.uint8)
+    tpl = get_compiled_template("XP.png").rgb
+    x1, y1, _, _ = area_box("Info_Area", 1)
+    rgb[y1 + 30:y1 + 30 + tpl.shape[0], x1 + 100:x1 + 100 + tpl.shape[1]] = tpl
+    prev = set_grabber(ScriptedScreen({"world": rgb}, start="world"))
+
+    asks = ["logged_in"] * 5 + ["is_skilling"] * 5
+    tracing.enable(True)
+    try:
+        tracing.reset()
+        t0 = time.perf_counter()
+        loose = [getattr(states, name)(bot_id=1, **({"verbose": False} if name == "is_skilling" else {})) for name in asks]
+        loose_ms = (time.perf_counter() - t0) * 1000
+        loose_grabs = tracing.summary().get(("grab",), tracing.Histogram()).count
+
+        tracing.reset()
+        t0 = time.perf_counter()
+        snap = evaluate_states(bot_id=1)
+        engine_vals = [snap[name] for name in asks]
+        engine_ms = (time.perf_counter() - t0) * 1000
+        engine_grabs = tracing.summary().get(("grab",), tracing.Histogram()).count
+    finally:
+        tracing.enable(False)
+        set_grabber(prev)
+
+    ok = loose == engine_vals and not snap.errors
+    print(f"{'🟢' if ok else '🔴'} {snap}")
+    print(f"   los:      {len(asks)} vragen | grabs={loose_grabs} | {loose_ms:.1f} ms")
+    print(f"   snapshot: {len(asks)} vragen | grabs={engine_grabs} | detecties={snap.memo.detections} | {engine_ms:.1f} ms")
+    if snap.errors:
+        print(f"   ⚠️ {snap.errors}")
+# === END CLI TEST ===
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from vision.image_detection import detect_image
-
-def logged_in(*, bot_id: int = 1, area: str = "Info_Area", image: str = "xp.png") -> bool:
-    return detect_image(image, area, bot_id=bot_id, verbose="off") is not None
+from states.engine import FrameMemo, state
 
+@state(templates={"XP.png": "Info_Area"})
+def logged_in(*, bot_id: int = 1, area: str = "Info_Area", image: str = "XP.png", frame=None, memo: FrameMemo = None) -> bool:
+    # memo (states engine) => detectie gedeeld met andere states op hetzelfde frame
+    return (memo or FrameMemo(frame, bot_id)).image(image, area) is not None
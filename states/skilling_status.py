@@ -1,9 +1,7 @@
-from vision.colour_detection import detect_colour
+from states.engine import FrameMemo, state
 
-def is_skilling(bot_id, verbose=True):
-    if detect_colour("green", "Skilling_Area", 2, bot_id=bot_id, verbose=verbose):
-        return True
-
-    # fallback: check rood en toon dat ook netjes
-    detect_colour("red", "Skilling_Area", 2, bot_id=bot_id, verbose=verbose)
-    return False
+@state(colours={"Skilling_Area": ("green", "red")})
+def is_skilling(bot_id=1, verbose=True, frame=None, memo=None):
+    # groen + rood in 1 grab / 1 HSV pass (rood wordt alleen getoond, beslist niets)
+    found = (memo or FrameMemo(frame, bot_id)).detect_colours({"green": 2, "red": 2}, "Skilling_Area", verbose=verbose)
+    return found["groen"]
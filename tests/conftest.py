@@ -0,0 +1,10 @@
+# === START BOOTSTRAP ===
+# • WAT: project-root op sys.path voor de tests.
+# • WAAROM: `pytest` werkt dan ook als je hem buiten de project-root start.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
@@ -0,0 +1,52 @@
+"""core.click_images.find_all_hits: hits blijven op dezelfde schermplek als de area aan de frame-rand geclipt wordt."""
+import time
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pynput")  # core.click_images -> core.ai_cursor
+
+from core.area_registry import area_box
+from core.click_images import find_all_hits
+from vision.compiled_template import get_compiled_template
+from vision.frame_capture import Frame
+from vision.image_detection import detect_image
+
+
+def _screen():
+    rng = np.random.default_rng(0)
+    rgb = rng.integers(40, 110, (1080, 1920, 3), dtype=np.uint8)
+    tpl = get_compiled_template("XP.png").rgb
+    x1, y1, _, _ = area_box("Info_Area", 1)
+    x, y = x1 + 100, y1 + 30
+    rgb[y:y + tpl.shape[0], x:x + tpl.shape[1]] = tpl
+    return rgb, (x, y)
+
+
+def _screen_hits(frame):
+    (ax, ay, _, _), hits = find_all_hits("XP.png", "Info_Area", frame=frame)
+    return [(ax + hx1, ay + hy1) for hx1, hy1, _, _, _ in hits]
+
+
+def test_view_origin_follows_clipping():
+    frame = Frame(rgb=np.zeros((100, 200, 3), np.uint8), ts=0.0, seq=1, origin=(50, 20))
+    assert frame.view_origin((60, 30, 90, 40)) == (60, 30)
+    assert frame.view_origin((0, 0, 90, 40)) == (50, 20)
+    assert frame.view_origin((400, 300, 500, 400)) == (250, 120)
+    assert frame.view((0, 0, 90, 40)).shape[:2] == (20, 40)
+
+
+def test_clipped_area_same_screen_hits():
+    rgb, (x, y) = _screen()
+    full = Frame(rgb=rgb, ts=time.monotonic(), seq=1)
+    # frame begint midden in Info_Area: links/boven wordt de area geclipt
+    ox, oy = area_box("Info_Area", 1)[0] + 40, area_box("Info_Area", 1)[1] + 10
+    clipped = Frame(rgb=rgb[oy:, ox:], ts=time.monotonic(), seq=2, origin=(ox, oy))
+
+    assert _screen_hits(full) == [(x, y)]
+    assert _screen_hits(clipped) == [(x, y)]
+
+    hit_full = detect_image("XP.png", "Info_Area", frame=full, verbose="off")
+    hit_clipped = detect_image("XP.png", "Info_Area", frame=clipped, verbose="off")
+    assert hit_full is not None and hit_clipped is not None
+    assert hit_clipped.x == hit_full.x and hit_clipped.y == hit_full.y
@@ -0,0 +1,96 @@
+"""core.helpers.assist_login.login_step: via MultiBotScheduler precies 1 Play Now klik per bot."""
+import threading
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pynput")  # core.ai_cursor (echte muis alleen buiten de test)
+
+from core import ai_cursor
+from core.area_registry import get_area_registry
+from core.bot_offsets import BOT_OFFSETS
+from core.helpers.assist_login import login_step
+from core.scheduler import MultiBotScheduler
+from core.sim import InputRecorder, ScriptedScreen, Transition
+from vision.compiled_template import get_compiled_template
+from vision.frame_capture import FrameCapture
+from vision.grabbers import Grabber, set_grabber
+
+SCREEN_SIZE = (1920, 1080)
+LOAD_SEC = 0.3  # login -> world na de klik (korter dan de 0.9 s wachttijd van de flow)
+
+
+def _paste(rgb, name, area, bot, dx, dy):
+    tpl = get_compiled_template(name).rgb
+    x1, y1, _, _ = get_area_registry().box(area, bot)
+    x, y = x1 + dx, y1 + dy
+    rgb[y:y + tpl.shape[0], x:x + tpl.shape[1]] = tpl
+    return x, y, x + tpl.shape[1], y + tpl.shape[0]
+
+
+class _PerBotScreens(Grabber):
+    """Eén ScriptedScreen per bot; elk frame neemt per bot de pixels over die van de achtergrond afwijken."""
+
+    name = "per_bot"
+
+    def __init__(self, base, screens):
+        super().__init__()
+        self._base = base
+        self.screens = screens
+        self._lock = threading.Lock()
+
+    def screen_size(self):
+        return SCREEN_SIZE
+
+    def grab(self, region=None, out=None):
+        with self._lock:
+            rgb = self._base.copy()
+            for screen in self.screens.values():
+                img = screen.grab()
+                diff = (img != self._base).any(axis=2)
+                rgb[diff] = img[diff]
+        x, y, w, h = self._clip(region)
+        return self._from_rgb(rgb[y:y + h, x:x + w], out)
+
+
+def _login_screens():
+    rng = np.random.default_rng(0)
+    base = rng.integers(40, 110, (SCREEN_SIZE[1], SCREEN_SIZE[0], 3), dtype=np.uint8)
+    screens, play = {}, {}
+    for bot in sorted(BOT_OFFSETS):
+        login, world = base.copy(), base.copy()
+        play[bot] = _paste(login, "Login_Screen_Play_Now.png", "Bot_Area", bot, 120, 120)
+        _paste(world, "XP.png", "Info_Area", bot, 100, 30)
+        screens[bot] = ScriptedScreen(
+            {"login": login, "world": world},
+            start="login",
+            transitions=[Transition("login", "world", box=play[bot], after=LOAD_SEC)],
+        )
+    return _PerBotScreens(base, screens), play
+
+
+def test_one_click_per_bot():
+    grabber, play = _login_screens()
+    recorder = InputRecorder()
+    for screen in grabber.screens.values():
+        recorder.listeners.append(screen.on_input)
+
+    prev_grabber = set_grabber(grabber)
+    prev_mouse = ai_cursor.set_mouse(recorder)
+    sched = MultiBotScheduler(capture=FrameCapture(max_age=0.0))
+    try:
+        for bot in play:
+            sched.add(bot, login_step)
+        sched.run(duration=30.0)
+    finally:
+        sched.close()
+        ai_cursor.set_mouse(prev_mouse)
+        set_grabber(prev_grabber)
+
+    # kliks lopen na elkaar via de input queue (±0.8 s per muisbeweging): de laatste bot wacht > 0.9 s
+    per_bot = {bot: 0 for bot in play}
+    for ev in recorder.clicks:
+        bot = next(b for b, (x1, y1, x2, y2) in play.items() if x1 <= ev.x < x2 and y1 <= ev.y < y2)
+        per_bot[bot] += 1
+    assert per_bot == {bot: 1 for bot in play}
+    assert all(s.state == "world" for s in grabber.screens.values())
@@ -0,0 +1,84 @@
+"""vision.match_all: afgeleide "ALL" maps moeten gelijk zijn aan cv2.matchTemplate."""
+import cv2
+import numpy as np
+import pytest
+
+from vision.match_all import ALL_METHODS, MODE_DERIVED, MODE_SEQUENTIAL, MODE_THREADS, match_all_methods
+
+
+def _scene(seed: int = 0):
+    rng = np.random.default_rng(seed)
+    img = cv2.GaussianBlur(rng.integers(0, 255, (240, 320), dtype=np.uint8), (5, 5), 0)
+    return img, img[100:126, 150:180].copy()
+
+
+def _best(res: np.ndarray, method: str):
+    _, _, min_loc, max_loc = cv2.minMaxLoc(res.astype(np.float32))
+    return min_loc if method.startswith("TM_SQDIFF") else max_loc
+
+
+@pytest.mark.parametrize("method", ALL_METHODS)
+def test_derived_map_matches_opencv(method):
+    img, tpl = _scene()
+    ref = cv2.matchTemplate(img, tpl, getattr(cv2, method)).astype(np.float64)
+    got = match_all_methods(img, tpl, methods=[method], mode=MODE_DERIVED)[method]
+
+    assert got.shape == ref.shape
+    # float32 (OpenCV) vs float64 (afgeleid): tolerantie relatief aan het bereik van de map
+    scale = max(1.0, float(np.abs(ref).max()))
+    np.testing.assert_allclose(got, ref, rtol=0, atol=1e-4 * scale)
+    assert _best(got, method) == _best(ref, method)
+    if method != "TM_CCORR":  # ongenormaliseerde correlatie piekt op heldere zones, niet op het template
+        assert _best(got, method) == (150, 100)
+
+
+def test_derived_with_template_stats():
+    img, tpl = _scene(1)
+    t = tpl.astype(np.float64)
+    plain = match_all_methods(img, tpl, mode=MODE_DERIVED)
+    stats = match_all_methods(img, tpl, mode=MODE_DERIVED, tpl_stats=(float(t.sum()), float((t * t).sum())))
+    for m in ALL_METHODS:
+        np.testing.assert_allclose(stats[m], plain[m], rtol=1e-9, atol=1e-6)
+
+
+def test_flat_template_and_window():
+    # vlak template + vlakke zone: genormaliseerde methodes mogen niet ontploffen (geen NaN/inf)
+    img, _ = _scene(2)
+    img[:60, :80] = 90
+    tpl = np.full((20, 24), 90, dtype=np.uint8)
+    got = match_all_methods(img, tpl, mode=MODE_DERIVED)
+    for m in ALL_METHODS:
+        assert np.isfinite(got[m]).all(), m
+    ref = cv2.matchTemplate(img, tpl, cv2.TM_SQDIFF)
+    np.testing.assert_allclose(got["TM_SQDIFF"], ref, rtol=0, atol=1e-4 * max(1.0, float(ref.max())))
+
+
+def test_modes_agree_and_keep_order():
+    img, tpl = _scene(3)
+    seq = match_all_methods(img, tpl, mode=MODE_SEQUENTIAL)
+    thr = match_all_methods(img, tpl, mode=MODE_THREADS)
+    assert list(seq) == list(thr) == list(ALL_METHODS)
+    for m in ALL_METHODS:
+        np.testing.assert_array_equal(seq[m], thr[m])
+
+
+def test_methods_as_generator():
+    img, tpl = _scene()
+    got = match_all_methods(img, tpl, methods=(m for m in ("TM_SQDIFF", "TM_CCOEFF_NORMED")))
+    assert list(got) == ["TM_CCOEFF_NORMED", "TM_SQDIFF"]
+
+
+def test_all_picks_first_method_on_equal_shape_score():
+    # baseline selectie: hoogste vormscore, bij gelijkspel (min-max piek = 100) de eerste in METHODS volgorde
+    from vision.image_detection import METHODS, _best_match_in_shot
+
+    img, tpl = _scene()
+    rgb, tpl_rgb = cv2.cvtColor(img, cv2.COLOR_GRAY2RGB), cv2.cvtColor(tpl, cv2.COLOR_GRAY2RGB)
+    loc, vorm, _, used = _best_match_in_shot(rgb, tpl_rgb, tpl, "ALL")
+    assert (loc, vorm, used) == ((150, 100), 100.0, METHODS[0])
+
+
+def test_unknown_mode():
+    img, tpl = _scene()
+    with pytest.raises(KeyError):
+        match_all_methods(img, tpl, mode="bestaat_niet")
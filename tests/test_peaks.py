@@ -0,0 +1,123 @@
+"""vision.peaks: grid NMS moet dezelfde hits geven als de oude greedy loops (user-011)."""
+import numpy as np
+import pytest
+
+from vision.peaks import local_maxima, peaks_iou, peaks_radius
+
+
+# === referenties: de oude implementaties (click_images._nms, image_debugger radius loop) ===
+def _old_nms(boxes, scores, iou_thr):
+    boxes = np.array(boxes, dtype=np.float32)
+    scores = np.array(scores, dtype=np.float32)
+    x1, y1, x2, y2 = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+    areas = (x2 - x1 + 1) * (y2 - y1 + 1)
+    order = scores.argsort()[::-1]
+    keep = []
+    while order.size > 0:
+        i = order[0]
+        keep.append(int(i))
+        xx1 = np.maximum(x1[i], x1[order[1:]])
+        yy1 = np.maximum(y1[i], y1[order[1:]])
+        xx2 = np.minimum(x2[i], x2[order[1:]])
+        yy2 = np.minimum(y2[i], y2[order[1:]])
+        w = np.maximum(0.0, xx2 - xx1 + 1)
+        h = np.maximum(0.0, yy2 - yy1 + 1)
+        inter = w * h
+        iou = inter / (areas[i] + areas[order[1:]] - inter + 1e-9)
+        order = order[np.where(iou <= iou_thr)[0] + 1]
+    return keep
+
+
+def _old_iou_hits(res, threshold, tw, th, iou_thr):
+    ys, xs = np.where(res >= threshold)
+    boxes = [[x, y, x + tw, y + th] for x, y in zip(xs, ys)]
+    scores = [float(res[y, x]) for x, y in zip(xs, ys)]
+    if not boxes:
+        return []
+    return [(int(boxes[i][0]), int(boxes[i][1])) for i in _old_nms(boxes, scores, iou_thr)]
+
+
+def _old_radius_hits(scores, min_score, radius, max_hits):
+    ys, xs = np.where(scores >= min_score)
+    values = scores[ys, xs]
+    picked = []
+    for idx in np.argsort(values)[::-1]:
+        x, y = int(xs[idx]), int(ys[idx])
+        if any((x - px) ** 2 + (y - py) ** 2 <= radius * radius for px, py in picked):
+            continue
+        picked.append((x, y))
+        if len(picked) >= max_hits:
+            break
+    return picked
+
+
+def _inventory_map(seed: int, tied_tops: bool = False):
+    """
+    4x7 slots met brede ruisige pieken (zoals een volle inventory) op lage ruis.
+    tied_tops: alle slot-toppen exact 0.99 (gelijke scores; de oude argsort volgorde daarvan is willekeurig).
+    """
+    rng = np.random.default_rng(seed)
+    slot_w, slot_h = 42, 36
+    res = (rng.random((7 * slot_h, 4 * slot_w)) * 0.6).astype(np.float32)
+    for row in range(7):
+        for col in range(4):
+            cx, cy = col * slot_w + 6, row * slot_h + 5
+            blob = 0.85 + rng.random((5, 5)).astype(np.float32) * 0.1
+            res[cy - 2:cy + 3, cx - 2:cx + 3] = np.maximum(res[cy - 2:cy + 3, cx - 2:cx + 3], blob)
+            res[cy, cx] = 0.99 if tied_tops else 0.96 + 0.001 * (row * 4 + col)
+    return res
+
+
+# === equivalentie ===
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("iou_thr", [0.0, 0.25, 0.5])
+def test_peaks_iou_equals_old_nms(seed, iou_thr):
+    res = _inventory_map(seed)
+    got = peaks_iou(res, 0.8, 30, 26, iou_thr=iou_thr, peak_radius=0)
+    assert [(x, y) for x, y, _ in got] == _old_iou_hits(res, 0.8, 30, 26, iou_thr)
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("radius,max_hits", [(5, 100), (13, 100), (13, 10), (40, 100)])
+def test_peaks_radius_equals_old_loop(seed, radius, max_hits):
+    res = _inventory_map(seed)
+    got = peaks_radius(res, 0.8, radius=radius, max_hits=max_hits, peak_radius=0)
+    assert [(x, y) for x, y, _ in got] == _old_radius_hits(res, 0.8, radius, max_hits)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_dense_random_map_equals_old_nms(seed):
+    # veel overlappende kandidaten zonder structuur: grid-buurcellen moeten alle conflicten vinden
+    res = np.random.default_rng(100 + seed).random((60, 90)).astype(np.float32)
+    got = peaks_iou(res, 0.7, 9, 7, iou_thr=0.1, peak_radius=0)
+    assert [(x, y) for x, y, _ in got] == _old_iou_hits(res, 0.7, 9, 7, 0.1)
+
+
+def test_tied_scores_same_hits():
+    # gelijke scores: zelfde hits, volgorde binnen de tie mag verschillen
+    res = _inventory_map(0, tied_tops=True)
+    got = peaks_iou(res, 0.8, 30, 26, iou_thr=0.25, peak_radius=0)
+    assert sorted((x, y) for x, y, _ in got) == sorted(_old_iou_hits(res, 0.8, 30, 26, 0.25))
+    got = peaks_radius(res, 0.8, radius=13, max_hits=100, peak_radius=0)
+    assert sorted((x, y) for x, y, _ in got) == sorted(_old_radius_hits(res, 0.8, 13, 100))
+
+
+# === default peak_radius ===
+def test_default_peak_radius_one_hit_per_slot():
+    res = _inventory_map(0)
+    assert len(peaks_iou(res, 0.8, 30, 26, iou_thr=0.25)) == 28
+    assert len(peaks_radius(res, 0.8, radius=13)) == 28
+
+
+def test_local_maxima_sorted_and_above_threshold():
+    res = _inventory_map(1)
+    xs, ys, values = local_maxima(res, 0.8)
+    assert len(xs) > 0
+    assert (values >= 0.8).all()
+    assert (np.diff(values) <= 0).all()
+    np.testing.assert_array_equal(res[ys, xs], values)
+
+
+def test_empty_inputs():
+    assert peaks_iou(np.zeros((0, 0), np.float32), 0.5, 4, 4, 0.25) == []
+    assert peaks_radius(np.zeros((10, 10), np.float32), 0.5, radius=3) == []
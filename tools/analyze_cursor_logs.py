@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+# =========================
+# BOOTSTRAP (ALTIJD EERST)
+# =========================
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# =========================
+# IMPORTS
+# =========================
+import argparse
+import json
+import time
+import tracemalloc
+from typing import List
+
+from core.cursor_log import CHUNK_POINTS
+from core.cursor_stats import MOVE_GAP_SEC, analyze_cursor_log, format_report
+from core.paths import LOGS_DIR
+
+# =========================
+# RUN
+# =========================
+def _default_logs() -> List[Path]:
+    """Alle cursor logs in de project root; .npy wint van een .json met dezelfde naam."""
+    npy = sorted(PROJECT_ROOT.glob("cursor_log_*.npy"))
+    have = {p.stem for p in npy}
+    return npy + [p for p in sorted(PROJECT_ROOT.glob("cursor_log_*.json")) if p.stem not in have and not p.name.endswith(".meta.json")]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Streaming statistiek over cursor logs (.npy of oude .json), constant geheugen")
+    ap.add_argument("paths", nargs="*", type=Path, help="default: alle cursor_log_* in de project root")
+    ap.add_argument("--chunk", type=int, default=CHUNK_POINTS * 4, help="punten per blok")
+    ap.add_argument("--move-gap", type=float, default=MOVE_GAP_SEC, help="stap langer dan dit = pauze (s)")
+    ap.add_argument("--out", type=Path, default=None, help="map voor <naam>_summary.json (default: logs/cursor)")
+    args = ap.parse_args()
+
+    paths = args.paths or _default_logs()
+    if not paths:
+        print("⚠️ geen cursor logs gevonden")
+        return 1
+
+    out_dir = args.out or Path(LOGS_DIR) / "cursor"
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    for p in paths:
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        summary = analyze_cursor_log(p, chunk=args.chunk, move_gap=args.move_gap)
+        sec = time.perf_counter() - t0
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        summary["analysis"] = {"seconds": round(sec, 3), "peak_mib": round(peak / 2**20, 1), "chunk": args.chunk}
+        dst = out_dir / f"{p.stem}_summary.json"
+        dst.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+        print(format_report(summary))
+        print(f"⏱️ {sec:.2f}s | piek {peak / 2**20:.1f} MiB | 💾 {dst}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
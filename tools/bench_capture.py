@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+# =========================
+# BOOTSTRAP (ALTIJD EERST)
+# =========================
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# =========================
+# IMPORTS
+# =========================
+import argparse
+import threading
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from core.area_registry import area_box
+from vision.compiled_template import get_compiled_template
+from vision.frame_capture import start_capture_thread, stop_capture_thread
+from vision.grabbers import Grabber, Region, set_grabber
+from vision.image_detection import detect_image_timeout
+
+# =========================
+# CONFIG
+# =========================
+SCREEN_SIZE = (1920, 1080)
+TEMPLATE = "XP.png"
+AREA = "Info_Area"
+
+# =========================
+# GRABBER
+# =========================
+class SwitchScreen(Grabber):
+    """Statisch scherm dat op switch_at (monotonic) wisselt naar `after`; elke grab kost grab_sec."""
+
+    name = "switch"
+
+    def __init__(self, before: np.ndarray, after: np.ndarray, grab_sec: float):
+        super().__init__()
+        self.before, self.after = before, after
+        self.grab_sec = float(grab_sec)
+        self.switch_at = float("inf")
+
+    def screen_size(self):
+        return SCREEN_SIZE
+
+    def grab(self, region: Optional[Region] = None, out: Optional[np.ndarray] = None) -> np.ndarray:
+        # pixels van het begin van de grab, kosten erna (zoals een echte capture)
+        src = self.after if time.monotonic() >= self.switch_at else self.before
+        time.sleep(self.grab_sec)
+        x, y, w, h = self._clip(region)
+        return self._from_rgb(src[y:y + h, x:x + w], out)
+
+
+def _screens(seed: int):
+    rng = np.random.default_rng(seed)
+    before = rng.integers(40, 110, (SCREEN_SIZE[1], SCREEN_SIZE[0], 3), dtype=np.uint8)
+    after = before.copy()
+    tpl = get_compiled_template(TEMPLATE).rgb
+    x1, y1, _, _ = area_box(AREA, 1)
+    after[y1 + 30:y1 + 30 + tpl.shape[0], x1 + 100:x1 + 100 + tpl.shape[1]] = tpl
+    return before, after
+
+# =========================
+# BENCH
+# =========================
+def _trial(screen: SwitchScreen, delay: float) -> float:
+    """ms tussen de schermwissel en de return van detect_image_timeout."""
+    def _switch():
+        time.sleep(delay)
+        screen.switch_at = time.monotonic()
+
+    screen.switch_at = float("inf")
+    t = threading.Thread(target=_switch, daemon=True)
+    t.start()
+    hit = detect_image_timeout(TEMPLATE, AREA, timeout_sec=delay + 3.0, verbose="off")
+    done = time.monotonic()
+    t.join()
+    if not hit:
+        return float("nan")
+    return (done - screen.switch_at) * 1000
+
+
+def _run(screen: SwitchScreen, trials: int, rng: np.random.Generator) -> List[float]:
+    return [_trial(screen, float(rng.uniform(0.2, 0.5))) for _ in range(trials)]
+
+
+def _fmt(name: str, ms: List[float]) -> str:
+    a = np.array(ms)
+    miss = int(np.isnan(a).sum())
+    a = np.sort(a[~np.isnan(a)])
+    if not len(a):
+        return f"{name:<22} geen hits"
+    p = lambda q: a[min(len(a) - 1, int(q * len(a)))]
+    return f"{name:<22} p50 {p(0.5):6.1f} ms | p95 {p(0.95):6.1f} ms | max {a[-1]:6.1f} ms | miss {miss}"
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Reactie-latency van een pollende detector: eigen grabs vs capture thread")
+    ap.add_argument("--trials", type=int, default=20)
+    ap.add_argument("--grab-ms", type=float, default=25.0, help="kunstmatige kosten per grab")
+    ap.add_argument("--fps", type=float, default=30.0, help="capture thread fps")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    before, after = _screens(args.seed)
+    screen = SwitchScreen(before, after, args.grab_ms / 1000)
+    previous = set_grabber(screen)
+    try:
+        sync = _run(screen, args.trials, np.random.default_rng(args.seed))
+        start_capture_thread(fps=args.fps)
+        try:
+            threaded = _run(screen, args.trials, np.random.default_rng(args.seed))
+        finally:
+            stop_capture_thread()
+    finally:
+        set_grabber(previous)
+
+    print(f"📸 grab {args.grab_ms:.0f} ms | {args.trials} wissels | thread @ {args.fps:.0f} fps (periode {1000 / args.fps:.0f} ms)")
+    print(_fmt("sync (eigen grabs)", sync))
+    print(_fmt("capture thread", threaded))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,476 @@
+from __future__ import annotations
+
+# =========================
+# BOOTSTRAP (ALTIJD EERST)
+# =========================
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# =========================
+# IMPORTS
+# =========================
+import argparse
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from core.area_registry import get_area_registry
+from core.bot_offsets import BOT_OFFSETS
+from core.paths import LOGS_DIR
+from vision import roi_tracker
+from vision.colour_detection import detect_colour
+from vision.compiled_template import get_compiled_template
+from vision.debug_analysis import METHODS, analyze_method
+from vision.grabbers import ReplayGrabber, set_grabber
+from vision.image_detection import detect_image
+from vision.roi_tracker import get_roi_tracker
+from vision.template_meta import get_template_settings
+
+# =========================
+# CONFIG
+# =========================
+LABELS_FILE = "labels.json"
+LABELS_VERSION = 1
+DEFAULT_REPEAT = 20
+DEFAULT_TOLERANCE_PX = 2
+DEFAULT_MAX_SLOWDOWN = 1.25      # compare: p50 mag max 25% trager worden
+SCREEN_SIZE = (1920, 1080)
+
+SUITES = ("detect_image", "detect_colour", "click_hits", "debug_analysis")
+
+# synthetische corpus: (template, area) paren die per frame wel/niet geplakt worden.
+# Bewust een smalle set: 1 vaste "thuis" area per template (zoals de flows ze zoeken).
+# --all-areas meet dezelfde templates in elke area uit de AreaRegistry (label afgeleid van de plak-positie).
+CORPUS_IMAGES = (
+    ("XP.png", "Info_Area"),
+    ("Logout_Door.png", "Buttons_Bottom"),
+    ("Inventory_Selected.png", "Buttons_Top"),
+    ("Login_Screen_Play_Now.png", "Bot_Area"),
+    ("Login_Screen_Ok.png", "Bot_Area_Full"),
+)
+CORPUS_COLOUR = ("green", "Skilling_Area", 2.0)
+CORPUS_HITS = ("Raw_Trout.png", "Inventory_Area", 0.90)
+CORPUS_HITS_GRID = (4, 7)  # kolommen x rijen: vakken waarin de kopieën geplakt worden (overlappen nooit)
+
+# =========================
+# CORPUS
+# =========================
+def _background(rng: np.random.Generator) -> np.ndarray:
+    """
+    Egale grijze vlakken met lichte ruis (geen echt scherm nodig).
+    Lage saturatie: de achtergrond mag zelf geen kleur-detectie triggeren.
+    """
+    h, w = SCREEN_SIZE[1], SCREEN_SIZE[0]
+    gray = rng.integers(40, 110, (h // 40 + 1, w // 40 + 1, 1), dtype=np.int16)
+    tint = rng.integers(-3, 4, (h // 40 + 1, w // 40 + 1, 3), dtype=np.int16)
+    img = cv2.resize(np.clip(gray + tint, 0, 255).astype(np.uint8), (w, h), interpolation=cv2.INTER_NEAREST)
+    noise = rng.integers(-3, 4, img.shape, dtype=np.int16)
+    return np.clip(img.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+
+def _paste(rgb: np.ndarray, tpl_rgb: np.ndarray, x: int, y: int) -> None:
+    th, tw = tpl_rgb.shape[:2]
+    rgb[y:y + th, x:x + tw] = tpl_rgb
+
+
+def make_corpus(out_dir: Path, frames: int, seed: int) -> Path:
+    """Schrijft frames + labels.json met bekende posities; labels volgen exact wat er geplakt is."""
+    rng = np.random.default_rng(seed)
+    registry = get_area_registry()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    labels: Dict[str, Any] = {"version": LABELS_VERSION, "frames": {}}
+
+    for i in range(frames):
+        bot = int(rng.choice(sorted(BOT_OFFSETS)))
+        rgb = _background(rng)
+        entry: Dict[str, Any] = {"bot": bot, "detect_image": [], "detect_colour": [], "click_hits": []}
+
+        for name, area in CORPUS_IMAGES:
+            tpl = get_compiled_template(name).rgb
+            x1, y1, x2, y2 = registry.box(area, bot)
+            th, tw = tpl.shape[:2]
+            xy = None
+            if rng.random() < 0.6 and x2 - x1 >= tw + 4 and y2 - y1 >= th + 4:
+                x = int(rng.integers(x1 + 2, x2 - tw - 1))
+                y = int(rng.integers(y1 + 2, y2 - th - 1))
+                _paste(rgb, tpl, x, y)
+                xy = [x, y]
+            entry["detect_image"].append({"template": name, "area": area, "xy": xy})
+
+        colour, area, pct = CORPUS_COLOUR
+        x1, y1, x2, y2 = registry.box(area, bot)
+        present = bool(rng.random() < 0.5)
+        if present:
+            # ~10% van de area in puur groen (HSV 60,255,200)
+            pw, ph = (x2 - x1) // 3, (y2 - y1) // 3
+            rgb[y1 + 2:y1 + 2 + ph, x1 + 2:x1 + 2 + pw] = (0, 200, 0)
+        entry["detect_colour"].append({"colour": colour, "area": area, "percentage": pct, "expect": present})
+
+        name, area, thr = CORPUS_HITS
+        tpl = get_compiled_template(name).rgb
+        x1, y1, x2, y2 = registry.box(area, bot)
+        cols, rows = CORPUS_HITS_GRID
+        cell_w, cell_h = (x2 - x1) // cols, (y2 - y1) // rows
+        slots = rng.permutation(cols * rows)[: int(rng.integers(0, 12))]
+        th, tw = tpl.shape[:2]
+        for s in slots.tolist():
+            sx = x1 + (s % cols) * cell_w + (cell_w - tw) // 2
+            sy = y1 + (s // cols) * cell_h + (cell_h - th) // 2
+            _paste(rgb, tpl, sx, sy)
+        entry["click_hits"].append({"template": name, "area": area, "threshold": thr, "count": len(slots)})
+
+        fname = f"frame_{i:03d}.png"
+        cv2.imwrite(str(out_dir / fname), cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR))
+        labels["frames"][fname] = entry
+
+    (out_dir / LABELS_FILE).write_text(json.dumps(labels, indent=1), encoding="utf-8")
+    return out_dir
+
+
+def load_corpus(corpus: Path) -> List[Tuple[str, np.ndarray, Dict[str, Any]]]:
+    """[(naam, rgb, labels)]; frames zonder labels krijgen alleen latency cases."""
+    labels_path = corpus / LABELS_FILE
+    labels = json.loads(labels_path.read_text(encoding="utf-8")) if labels_path.exists() else {"frames": {}}
+    out = []
+    for p in sorted(corpus.glob("*.png")):
+        bgr = cv2.imread(str(p), cv2.IMREAD_COLOR)
+        if bgr is None:
+            continue
+        out.append((p.name, cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB), labels["frames"].get(p.name) or {}))
+    return out
+
+
+def _all_area_cases(cases: List[Dict[str, Any]], bot: int) -> List[Dict[str, Any]]:
+    """
+    detect_image cases uitgebreid naar elke area in de AreaRegistry.
+    Verwachting per area: de geplakte positie als het template daar volledig in valt, anders None.
+    """
+    registry = get_area_registry()
+    out = []
+    for c in cases:
+        tpl = get_compiled_template(c["template"])
+        xy = c.get("xy", "n/a")
+        for area in registry.areas():
+            x1, y1, x2, y2 = registry.box(area, bot)
+            case = {"template": c["template"], "area": area}
+            if xy is None:
+                case["xy"] = None
+            elif xy != "n/a":
+                inside = x1 <= xy[0] and y1 <= xy[1] and xy[0] + tpl.width <= x2 and xy[1] + tpl.height <= y2
+                case["xy"] = xy if inside else None
+            out.append(case)
+    return out
+
+
+def _unlabelled_cases(bot: int) -> Dict[str, Any]:
+    """Zelfde cases als de synthetische corpus, maar zonder verwachting (accuracy = n.v.t.)."""
+    return {
+        "bot": bot,
+        "detect_image": [{"template": n, "area": a} for n, a in CORPUS_IMAGES],
+        "detect_colour": [{"colour": CORPUS_COLOUR[0], "area": CORPUS_COLOUR[1], "percentage": CORPUS_COLOUR[2]}],
+        "click_hits": [{"template": CORPUS_HITS[0], "area": CORPUS_HITS[1], "threshold": CORPUS_HITS[2]}],
+    }
+
+# =========================
+# MEASURE
+# =========================
+def _time_calls(fn: Callable[[], Any], repeat: int) -> Tuple[Any, List[float]]:
+    result = None
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return result, samples
+
+
+def _alloc_peak_kib(fn: Callable[[], Any]) -> float:
+    """Piek Python/numpy allocaties van 1 call (tracemalloc apart, zodat timing niet vertekent)."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(max(0, peak - base) / 1024.0, 1)
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    a = np.asarray(samples, dtype=np.float64)
+    if a.size == 0:
+        return {}
+    p50, p90, p99 = np.percentile(a, [50, 90, 99])
+    return {
+        "p50_ms": round(float(p50), 4),
+        "p90_ms": round(float(p90), 4),
+        "p99_ms": round(float(p99), 4),
+        "max_ms": round(float(a.max()), 4),
+        "mean_ms": round(float(a.mean()), 4),
+    }
+
+
+def _near(got: Optional[Tuple[int, int]], want: Optional[List[int]], tol: int) -> bool:
+    if want is None or got is None:
+        return want is None and got is None
+    return abs(got[0] - want[0]) <= tol and abs(got[1] - want[1]) <= tol
+
+
+def _case(
+    suite: str,
+    case: str,
+    frame: str,
+    fn: Callable[[], Any],
+    check: Optional[Callable[[Any], bool]],
+    repeat: int,
+    reset: Callable[[], None],
+) -> Dict[str, Any]:
+    reset()
+    result, samples = _time_calls(fn, repeat)
+    reset()
+    row: Dict[str, Any] = {"suite": suite, "case": case, "frame": frame, "n": len(samples)}
+    row.update(_percentiles(samples))
+    row["alloc_peak_kib"] = _alloc_peak_kib(fn)
+    row["correct"] = None if check is None else bool(check(result))
+    row["_samples"] = samples
+    return row
+
+
+def run_frame(
+    name: str,
+    rgb: np.ndarray,
+    labels: Dict[str, Any],
+    repeat: int,
+    tol: int,
+    suites: List[str],
+    all_areas: bool = False,
+) -> List[Dict[str, Any]]:
+    bot = int(labels.get("bot", 1))
+    if not any(labels.get(s) for s in SUITES):
+        labels = _unlabelled_cases(bot)
+    if all_areas:
+        labels = dict(labels, detect_image=_all_area_cases(labels.get("detect_image", []), bot))
+
+    set_grabber(ReplayGrabber([rgb], loop=True))
+    registry = get_area_registry()
+    tracker = get_roi_tracker()
+    rows: List[Dict[str, Any]] = []
+
+    def _forget():
+        tracker.forget()
+
+    if "detect_image" in suites:
+        for c in labels.get("detect_image", []):
+            tpl, area = c["template"], c["area"]
+            x1, y1, x2, y2 = registry.box(area, bot)
+            t = get_compiled_template(tpl)
+            if t.width > x2 - x1 or t.height > y2 - y1:
+                continue
+            want = c.get("xy", "n/a")
+            check = None if want == "n/a" else (lambda m, w=want: _near((m.x, m.y) if m else None, w, tol))
+            rows.append(_case(
+                "detect_image", f"{tpl}@{area}", name,
+                lambda tpl=tpl, area=area: detect_image(tpl, area, bot_id=bot, verbose="off"),
+                check, repeat, _forget,
+            ))
+
+    if "detect_colour" in suites:
+        for c in labels.get("detect_colour", []):
+            colour, area, pct = c["colour"], c["area"], float(c["percentage"])
+            want = c.get("expect")
+            check = None if want is None else (lambda got, w=want: bool(got) == bool(w))
+            rows.append(_case(
+                "detect_colour", f"{colour}>={pct}%@{area}", name,
+                lambda colour=colour, area=area, pct=pct: detect_colour(colour, area, pct, bot_id=bot),
+                check, repeat, _forget,
+            ))
+
+    if "click_hits" in suites:
+        try:
+            from core.click_images import find_all_hits
+        except Exception as e:  # pynput/ai_cursor niet beschikbaar => suite overslaan, niet crashen
+            print(f"⚠️ click_hits overgeslagen: {type(e).__name__}: {e}")
+            find_all_hits = None
+        for c in labels.get("click_hits", []) if find_all_hits else []:
+            tpl, area, thr = c["template"], c["area"], float(c.get("threshold", 0.9))
+            want = c.get("count")
+            check = None if want is None else (lambda got, w=want: len(got[1]) == int(w))
+            rows.append(_case(
+                "click_hits", f"{tpl}@{area}", name,
+                lambda tpl=tpl, area=area, thr=thr: find_all_hits(tpl, area, bot, thr),
+                check, repeat, _forget,
+            ))
+
+    if "debug_analysis" in suites:
+        for c in labels.get("detect_image", []):
+            tpl, area = c["template"], c["area"]
+            x1, y1, x2, y2 = registry.box(area, bot)
+            t = get_compiled_template(tpl)
+            if t.width > x2 - x1 or t.height > y2 - y1:
+                continue
+            shot = rgb[y1:y2, x1:x2]
+            gray = cv2.cvtColor(shot, cv2.COLOR_RGB2GRAY)
+            cfg = get_template_settings(tpl)
+            methods = list(METHODS) if cfg.method == "ALL" else [cfg.method]
+            want = c.get("xy", "n/a")
+            for m in methods:
+                # goed = er is een "ok" hit op de gelabelde plek (of geen ok hits als het icoon er niet is)
+                def check(res, w=want):
+                    oks = [(x + x1, y + y1) for x, y, _, _, ok in res["rows"] if ok]
+                    if w is None:
+                        return not oks
+                    return any(_near(p, w, tol) for p in oks)
+
+                rows.append(_case(
+                    "debug_analysis", f"{tpl}@{area}:{m}", name,
+                    lambda shot=shot, gray=gray, t=t, m=m: analyze_method(
+                        shot, gray, t.rgb, t.gray, m, cfg.min_shape, cfg.min_color
+                    ),
+                    None if want == "n/a" else check, repeat, _forget,
+                ))
+
+    return rows
+
+# =========================
+# REPORT
+# =========================
+def summarize(rows: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    out: Dict[str, Dict[str, Any]] = {}
+    for suite in SUITES:
+        rs = [r for r in rows if r["suite"] == suite]
+        if not rs:
+            continue
+        samples = [s for r in rs for s in r["_samples"]]
+        labelled = [r for r in rs if r["correct"] is not None]
+        s: Dict[str, Any] = {"cases": len(rs)}
+        s.update(_percentiles(samples))
+        s["alloc_peak_kib_max"] = max(r["alloc_peak_kib"] for r in rs)
+        s["labelled"] = len(labelled)
+        s["accuracy"] = round(sum(r["correct"] for r in labelled) / len(labelled), 4) if labelled else None
+        out[suite] = s
+    return out
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=10
+        ).stdout.strip() or "unknown"
+    except Exception:
+        return "unknown"
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], max_slowdown: float) -> int:
+    """Print per suite p50/p99 + accuracy t.o.v. baseline; returns aantal regressies."""
+    bad = 0
+    print(f"\n📊 vergelijking met {baseline.get('meta', {}).get('commit', '?')}")
+    print(f"{'suite':<15} {'p50 oud':>9} {'p50 nieuw':>10} {'x':>6} {'p99 oud':>9} {'p99 nieuw':>10}  accuracy")
+    for suite, cur in current["summary"].items():
+        old = baseline.get("summary", {}).get(suite)
+        if not old:
+            print(f"{suite:<15} (nieuw)")
+            continue
+        ratio = cur["p50_ms"] / old["p50_ms"] if old.get("p50_ms") else 1.0
+        slow = ratio > max_slowdown
+        acc_drop = old.get("accuracy") is not None and cur.get("accuracy") is not None and cur["accuracy"] < old["accuracy"]
+        bad += int(slow) + int(acc_drop)
+        icon = "🔴" if (slow or acc_drop) else "🟢"
+        print(
+            f"{suite:<15} {old['p50_ms']:>9.3f} {cur['p50_ms']:>10.3f} {ratio:>6.2f} "
+            f"{old['p99_ms']:>9.3f} {cur['p99_ms']:>10.3f}  {old.get('accuracy')} -> {cur.get('accuracy')} {icon}"
+        )
+    return bad
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Detectie benchmark op opgeslagen screenshots (geen scherm nodig)")
+    ap.add_argument("--corpus", type=Path, default=None, help="map met screenshots (+ optioneel labels.json)")
+    ap.add_argument("--make-corpus", type=Path, default=None, help="schrijf een synthetische gelabelde corpus naar deze map")
+    ap.add_argument("--frames", type=int, default=8, help="aantal frames voor --make-corpus")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--suites", nargs="*", default=list(SUITES), choices=SUITES)
+    ap.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="calls per case voor de percentielen")
+    ap.add_argument("--tolerance", type=int, default=DEFAULT_TOLERANCE_PX, help="px afwijking t.o.v. label")
+    ap.add_argument("--no-roi", action="store_true", help="ROI tracking uit (elke call full area)")
+    ap.add_argument("--all-areas", action="store_true", help="detect_image/debug_analysis in elke registry area i.p.v. alleen de thuis area")
+    ap.add_argument("--json", type=Path, default=None, help="default: logs/bench/detection_<tijd>_<commit>.json")
+    ap.add_argument("--compare", type=Path, default=None, help="eerder JSON resultaat als baseline")
+    ap.add_argument("--max-slowdown", type=float, default=DEFAULT_MAX_SLOWDOWN)
+    args = ap.parse_args()
+
+    if args.make_corpus:
+        make_corpus(args.make_corpus, args.frames, args.seed)
+        print(f"🧪 synthetische corpus: {args.frames} frames -> {args.make_corpus}")
+        if args.corpus is None:
+            args.corpus = args.make_corpus
+    if args.corpus is None:
+        ap.error("--corpus of --make-corpus is verplicht")
+
+    frames = load_corpus(args.corpus)
+    if not frames:
+        print(f"⚠️ geen screenshots in {args.corpus}")
+        return 1
+
+    roi_tracker.ROI_TRACKING = not args.no_roi
+    rows: List[Dict[str, Any]] = []
+    t0 = time.perf_counter()
+    try:
+        for name, rgb, labels in frames:
+            rows.extend(run_frame(name, rgb, labels, args.repeat, args.tolerance, args.suites, args.all_areas))
+    finally:
+        set_grabber(None)
+
+    commit = _git_commit()
+    result = {
+        "meta": {
+            "commit": commit,
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "opencv": cv2.__version__,
+            "platform": platform.platform(),
+            "corpus": str(args.corpus),
+            "frames": len(frames),
+            "repeat": args.repeat,
+            "roi": not args.no_roi,
+            "all_areas": args.all_areas,
+            "seconds": round(time.perf_counter() - t0, 2),
+        },
+        "summary": summarize(rows),
+        "cases": [{k: v for k, v in r.items() if k != "_samples"} for r in rows],
+    }
+
+    print(f"\n{'suite':<15} {'cases':>5} {'p50':>8} {'p90':>8} {'p99':>8} {'alloc KiB':>10}  accuracy")
+    for suite, s in result["summary"].items():
+        acc = "n.v.t." if s["accuracy"] is None else f"{s['accuracy'] * 100:.1f}% ({s['labelled']})"
+        print(f"{suite:<15} {s['cases']:>5} {s['p50_ms']:>8.3f} {s['p90_ms']:>8.3f} {s['p99_ms']:>8.3f} {s['alloc_peak_kib_max']:>10.1f}  {acc}")
+
+    wrong = [r for r in rows if r["correct"] is False]
+    for r in wrong[:20]:
+        print(f"🔴 fout: {r['suite']} {r['case']} in {r['frame']}")
+
+    out = args.json or Path(LOGS_DIR) / "bench" / f"detection_{datetime.now():%Y%m%d_%H%M%S}_{commit}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    print(f"\n💾 opgeslagen: {out}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        return 1 if compare(result, baseline, args.max_slowdown) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
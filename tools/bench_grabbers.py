@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+# =========================
+# BOOTSTRAP (ALTIJD EERST)
+# =========================
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# =========================
+# IMPORTS
+# =========================
+import argparse
+import json
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.bot_offsets import apply_offset, load_areas
+from vision.grabbers import BACKENDS, create_grabber
+
+# =========================
+# CONFIG
+# =========================
+DEFAULT_SECONDS = 2.0
+FULLSCREEN = "FullScreen"
+
+# =========================
+# BENCH
+# =========================
+def _regions(area_names: List[str], bot_id: int) -> Dict[str, Optional[Tuple[int, int, int, int]]]:
+    areas = load_areas()
+    out: Dict[str, Optional[Tuple[int, int, int, int]]] = {}
+    for name in area_names:
+        if name == FULLSCREEN:
+            out[name] = None
+            continue
+        if name not in areas:
+            raise KeyError(f"Area niet gevonden: {name}")
+        x1, y1, x2, y2 = apply_offset(areas[name], bot_id)
+        out[name] = (x1, y1, x2 - x1, y2 - y1)
+    return out
+
+
+def bench_backend(name: str, regions: dict, seconds: float, reuse_buffer: bool) -> List[dict]:
+    grabber = create_grabber(name)
+    rows = []
+    try:
+        for area, region in regions.items():
+            first = grabber.grab(region)  # warm-up + buffer shape
+            out = np.empty_like(first) if reuse_buffer else None
+
+            n = 0
+            t0 = time.perf_counter()
+            deadline = t0 + seconds
+            while True:
+                grabber.grab(region, out)
+                n += 1
+                if time.perf_counter() >= deadline:
+                    break
+            elapsed = time.perf_counter() - t0
+
+            rows.append({
+                "backend": name,
+                "area": area,
+                "size": f"{first.shape[1]}x{first.shape[0]}",
+                "grabs": n,
+                "grabs_per_sec": round(n / elapsed, 1),
+                "ms_per_grab": round(1000.0 * elapsed / n, 3),
+            })
+    finally:
+        grabber.close()
+    return rows
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Micro-benchmark: grabs/sec per backend en region grootte")
+    ap.add_argument("--backends", nargs="*", default=list(BACKENDS), help="default: alle backends")
+    ap.add_argument("--areas", nargs="*", default=["Info_Area", "Inventory_Area", "Bot_Area_Full", FULLSCREEN])
+    ap.add_argument("--bot", type=int, default=1)
+    ap.add_argument("--seconds", type=float, default=DEFAULT_SECONDS, help="meetduur per backend/area")
+    ap.add_argument("--no-reuse", action="store_true", help="geen voorgealloceerde out buffer")
+    ap.add_argument("--json", type=Path, default=None, help="schrijf resultaten ook als JSON")
+    args = ap.parse_args()
+
+    regions = _regions(args.areas, args.bot)
+    rows: List[dict] = []
+
+    for name in args.backends:
+        try:
+            rows.extend(bench_backend(name, regions, args.seconds, reuse_buffer=not args.no_reuse))
+        except Exception as e:
+            print(f"⚠️ {name} overgeslagen: {type(e).__name__}: {e}")
+
+    print(f"\n{'backend':<10} {'area':<16} {'size':>10} {'grabs/s':>10} {'ms/grab':>9}")
+    for r in rows:
+        print(f"{r['backend']:<10} {r['area']:<16} {r['size']:>10} {r['grabs_per_sec']:>10.1f} {r['ms_per_grab']:>9.3f}")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        print(f"\n💾 opgeslagen: {args.json}")
+
+    return 0 if rows else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+# =========================
+# BOOTSTRAP (ALTIJD EERST)
+# =========================
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# =========================
+# IMPORTS
+# =========================
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from core.paths import LOGS_DIR
+
+# =========================
+# CONFIG
+# =========================
+# entry point -> budget in ms (alleen de imports; interpreter start + site tellen niet mee).
+# .py paden: alleen de top-level imports van het script worden uitgevoerd (het script zelf klikt).
+BUDGETS_MS: Dict[str, float] = {
+    "scripts/first_script.py": 120.0,
+    "scripts/multi_bot_script.py": 120.0,
+    "modules/test_logout.py": 120.0,
+    "modules/test_detect_image.py": 100.0,
+    "core.click_image": 100.0,
+    "core.helpers.assist_login": 120.0,
+    "states": 30.0,
+}
+# horen niet bij import te laden: pas bij het eerste gebruik (core/lazy_import.py)
+HEAVY = ("cv2", "numpy", "asyncio", "pynput", "pyautogui", "multiprocessing", "concurrent.futures")
+
+DEFAULT_RUNS = 5
+IMPORTTIME_DIR = LOGS_DIR / "importtime"
+_MARKER = "--bench-imports-start--"
+
+# =========================
+# MEASURE
+# =========================
+@dataclass(frozen=True)
+class ImportRow:
+    self_us: int
+    cumulative_us: int
+    depth: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ImportRun:
+    total_ms: float
+    rows: Tuple[ImportRow, ...]
+    raw: str
+
+
+def _import_code(target: str) -> str:
+    """Python code die alleen de imports van `target` (module of script pad) uitvoert."""
+    path = PROJECT_ROOT / target
+    if not target.endswith(".py"):
+        return f"import {target}"
+    tree = ast.parse(path.read_text(encoding="utf-8-sig"), filename=str(path))
+    lines = []
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module == "__future__":
+            continue
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            lines.append(ast.unparse(node))
+    return "\n".join(lines) or "pass"
+
+
+def _parse(stderr: str) -> List[ImportRow]:
+    """-X importtime regels na de marker => rows (self/cumulatief in µs, nesting diepte)."""
+    _, _, tail = stderr.partition(_MARKER)
+    rows = []
+    for line in tail.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_us, cum_us, name = line.split("|", 3) if line.count("|") == 3 else ("",) + tuple(line[12:].split("|", 2))
+        rows.append(ImportRow(int(self_us), int(cum_us), (len(name) - len(name.lstrip()) - 1) // 2, name.strip()))
+    return rows
+
+
+def measure(target: str, python: str = sys.executable) -> ImportRun:
+    """Eén vers proces: `python -X importtime -c <imports van target>`."""
+    code = f"import sys; sys.stderr.write({_MARKER!r} + '\\n')\n" + _import_code(target)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(PROJECT_ROOT), env.get("PYTHONPATH", "")) if p)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)  # .pyc cache hoort bij een normale start
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", code],
+        cwd=str(PROJECT_ROOT), env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        err = proc.stderr.strip().splitlines()
+        raise RuntimeError(err[-1] if err else f"exit {proc.returncode}")
+    rows = _parse(proc.stderr)
+    return ImportRun(sum(r.self_us for r in rows) / 1000, tuple(rows), proc.stderr)
+
+
+def _save(target: str, run: ImportRun) -> Path:
+    """Ruwe -X importtime output (leesbaar met o.a. tuna) onder logs/importtime/."""
+    IMPORTTIME_DIR.mkdir(parents=True, exist_ok=True)
+    name = target.replace("/", "_").replace("\\", "_").removesuffix(".py")
+    path = IMPORTTIME_DIR / f"{name}.txt"
+    path.write_text(run.raw, encoding="utf-8")
+    return path
+
+
+def _heaviest(run: ImportRun, target: str, n: int) -> List[ImportRow]:
+    """Duurste imports op de eerste twee niveaus onder de entry point (cumulatief)."""
+    top = min((r.depth for r in run.rows), default=0)
+    direct = [r for r in run.rows if r.depth <= top + 1 and r.name != target]
+    return sorted(direct, key=lambda r: r.cumulative_us, reverse=True)[:n]
+
+
+def _loaded_heavy(run: ImportRun) -> List[str]:
+    names = {r.name for r in run.rows}
+    return [m for m in HEAVY if m in names]
+
+# =========================
+# RUN
+# =========================
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Import-tijd per entry point (-X importtime) tegen een budget")
+    ap.add_argument("targets", nargs="*", help="modules of script paden (default: alle uit BUDGETS_MS)")
+    ap.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="verse processen per entry point (mediaan telt)")
+    ap.add_argument("--budget", type=float, default=None, help="budget in ms voor alle targets (overschrijft BUDGETS_MS)")
+    ap.add_argument("--scale", type=float, default=1.0, help="vermenigvuldig alle budgetten (tragere machine)")
+    ap.add_argument("--top", type=int, default=5, help="toon de N duurste imports per entry point")
+    ap.add_argument("--strict-heavy", action="store_true", help="faal ook als een HEAVY module bij import laadt")
+    ap.add_argument("--no-save", action="store_true", help="ruwe importtime output niet wegschrijven")
+    args = ap.parse_args()
+
+    targets = args.targets or list(BUDGETS_MS)
+    failed = 0
+    print(f"⏱️ import budget | {args.runs} runs per entry point | {Path(sys.executable).name} {sys.version.split()[0]}")
+
+    for target in targets:
+        budget = (args.budget if args.budget is not None else BUDGETS_MS.get(target, 100.0)) * args.scale
+        try:
+            runs = [measure(target) for _ in range(max(1, args.runs))]
+        except RuntimeError as e:
+            failed += 1
+            print(f"🔴 {target:<30} import faalt: {e}")
+            continue
+
+        totals = [r.total_ms for r in runs]
+        med = statistics.median(totals)
+        run = min(runs, key=lambda r: abs(r.total_ms - med))
+        heavy = _loaded_heavy(run)
+        bad = med > budget or (args.strict_heavy and heavy)
+        failed += bool(bad)
+
+        print(
+            f"{'🔴' if bad else '🟢'} {target:<30} {med:7.1f} ms (min {min(totals):6.1f}) | budget {budget:6.1f} ms"
+            + (f" | zwaar bij import: {', '.join(heavy)}" if heavy else "")
+        )
+        for r in _heaviest(run, target, args.top):
+            print(f"      {r.cumulative_us / 1000:7.1f} ms  {r.name}")
+        if not args.no_save:
+            print(f"      💾 {_save(target, run).relative_to(PROJECT_ROOT)}")
+
+    print(f"{'🔴' if failed else '🟢'} {len(targets) - failed}/{len(targets)} binnen budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+# =========================
+# BOOTSTRAP (ALTIJD EERST)
+# =========================
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# =========================
+# IMPORTS
+# =========================
+import argparse
+import json
+import time
+from typing import Dict, List
+
+import cv2
+
+from core.bot_offsets import apply_offset, load_areas
+from vision.grabbers import ReplayGrabber, get_grabber
+from vision.image_detection import _locate_in_result, _read_template
+from vision.match_all import ALL_METHODS, MODE_DERIVED, MODE_SEQUENTIAL, MODE_THREADS, match_all_methods
+from vision.template_meta import META_FILE, load_template_meta
+
+# =========================
+# CONFIG
+# =========================
+DEFAULT_AREA = "Bot_Area_Full"
+MODES = (MODE_SEQUENTIAL, MODE_THREADS, MODE_DERIVED)
+
+# =========================
+# BENCH
+# =========================
+def _all_templates() -> List[str]:
+    meta = load_template_meta()
+    return [name for name, d in meta.items() if isinstance(d, dict) and d.get("method") == "ALL"]
+
+
+def bench_template(template: str, gray, repeat: int) -> List[dict]:
+    _, _, tpl_gray = _read_template(template)
+    ref = match_all_methods(gray, tpl_gray, mode=MODE_SEQUENTIAL)
+    ref_locs = {m: _locate_in_result(ref[m], m)[0] for m in ALL_METHODS}
+
+    rows = []
+    base_ms = None
+    for mode in MODES:
+        match_all_methods(gray, tpl_gray, mode=mode)  # warm-up (thread pool, caches)
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            maps = match_all_methods(gray, tpl_gray, mode=mode)
+        ms = 1000.0 * (time.perf_counter() - t0) / repeat
+        base_ms = ms if base_ms is None else base_ms
+
+        locs: Dict[str, tuple] = {m: _locate_in_result(maps[m], m)[0] for m in ALL_METHODS}
+        mismatch = [m for m in ALL_METHODS if locs[m] != ref_locs[m]]
+        rows.append({
+            "template": template,
+            "mode": mode,
+            "ms": round(ms, 3),
+            "speedup": round(base_ms / ms, 2) if ms > 0 else None,
+            "same_locations": not mismatch,
+            "mismatch": mismatch,
+        })
+    return rows
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Vergelijk 'ALL' engines: sequential loop vs threads vs derived")
+    ap.add_argument("--templates", nargs="*", default=None, help="default: alle templates met method ALL")
+    ap.add_argument("--area", default=DEFAULT_AREA)
+    ap.add_argument("--bot", type=int, default=1)
+    ap.add_argument("--replay", type=Path, default=None, help="map/bestand met screenshots i.p.v. live scherm")
+    ap.add_argument("--repeat", type=int, default=20, help="herhalingen voor timing")
+    ap.add_argument("--json", type=Path, default=None)
+    args = ap.parse_args()
+
+    templates = args.templates or _all_templates()
+    if not templates:
+        print("⚠️ geen templates met method ALL in", META_FILE)
+        return 1
+
+    areas = load_areas()
+    if args.area not in areas:
+        raise KeyError(f"Area niet gevonden: {args.area}")
+    x1, y1, x2, y2 = apply_offset(areas[args.area], args.bot)
+
+    grabber = ReplayGrabber(args.replay, loop=False) if args.replay else get_grabber()
+    rgb = grabber.grab((x1, y1, x2 - x1, y2 - y1))
+    gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
+
+    rows: List[dict] = []
+    for t in templates:
+        rows.extend(bench_template(t, gray, args.repeat))
+
+    bad = 0
+    print(f"\n{'template':<28} {'mode':<11} {'ms':>9} {'speedup':>8}  locaties")
+    for r in rows:
+        bad += 0 if r["same_locations"] else 1
+        loc = "🟢 gelijk" if r["same_locations"] else f"🔴 anders: {', '.join(r['mismatch'])}"
+        print(f"{r['template']:<28} {r['mode']:<11} {r['ms']:>9.3f} {'x' + str(r['speedup']):>8}  {loc}")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        print(f"\n💾 opgeslagen: {args.json}")
+
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
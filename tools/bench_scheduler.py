@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+# =========================
+# BOOTSTRAP (ALTIJD EERST)
+# =========================
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# =========================
+# IMPORTS
+# =========================
+import argparse
+import json
+import time
+from typing import List
+
+from core.bot_offsets import BOT_OFFSETS
+from core.scheduler import MultiBotScheduler
+from vision.grabbers import ReplayGrabber, set_grabber
+from vision.image_detection import detect_many
+from vision.vision_pool import start_vision_pool, stop_vision_pool
+
+# =========================
+# CONFIG
+# =========================
+DEFAULT_SECONDS = 5.0
+# zelfde werk als assist_login per tick, zonder kliks
+BENCH_TEMPLATES = {
+    "XP.png": "Info_Area",
+    "Login_Screen_Play_Now.png": "Bot_Area",
+    "Login_Screen_Play_Now_Red.png": "Bot_Area_Full",
+}
+
+# =========================
+# BENCH
+# =========================
+def _detect_step(ctx):
+    detect_many(BENCH_TEMPLATES, bot_id=ctx.bot_id, verbose="off", frame=ctx.frame)
+    return None
+
+
+def _sequential(bot_ids: List[int], seconds: float) -> int:
+    """Oude manier: bots na elkaar, elk met een eigen screenshot."""
+    n = 0
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        for bot_id in bot_ids:
+            detect_many(BENCH_TEMPLATES, bot_id=bot_id, verbose="off")
+            n += 1
+    return n
+
+
+def _scheduled(bot_ids: List[int], seconds: float, tick_sec: float):
+    sched = MultiBotScheduler(tick_sec=tick_sec)
+    for bot_id in bot_ids:
+        sched.add(bot_id, _detect_step)
+    steps = sum(sched.run(duration=seconds).values())
+    sched.close()
+    return steps, sched.ticks
+
+
+def bench(n_bots: int, seconds: float, tick_sec: float, pool_workers: int = 0) -> List[dict]:
+    bot_ids = sorted(BOT_OFFSETS)[:n_bots]
+
+    seq = _sequential(bot_ids, seconds)
+
+    steps, ticks = _scheduled(bot_ids, seconds, tick_sec)
+
+    rows = [
+        {"bots": n_bots, "mode": "sequential", "steps_per_sec": round(seq / seconds, 1)},
+        {"bots": n_bots, "mode": "scheduler", "steps_per_sec": round(steps / seconds, 1), "ticks": ticks},
+    ]
+
+    if pool_workers > 0:
+        # zelfde scheduler, matching in worker processen (vision.vision_pool)
+        start_vision_pool(pool_workers, preload=list(BENCH_TEMPLATES))
+        try:
+            steps, ticks = _scheduled(bot_ids, seconds, tick_sec)
+        finally:
+            stop_vision_pool()
+        rows.append({"bots": n_bots, "mode": f"pool x{pool_workers}", "steps_per_sec": round(steps / seconds, 1), "ticks": ticks})
+    return rows
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Multi-bot throughput: sequentieel vs MultiBotScheduler (vs vision pool)")
+    ap.add_argument("--bots", type=int, nargs="*", default=[1, 2, 4], help="aantallen bots om te meten")
+    ap.add_argument("--seconds", type=float, default=DEFAULT_SECONDS)
+    ap.add_argument("--tick", type=float, default=0.0, help="tick interval (0 = zo snel mogelijk)")
+    ap.add_argument("--replay", type=Path, default=None, help="map/bestand met screenshots i.p.v. live scherm")
+    ap.add_argument("--pool", type=int, default=0, help="ook meten met N vision worker processen (0 = uit)")
+    ap.add_argument("--json", type=Path, default=None)
+    args = ap.parse_args()
+
+    if args.replay:
+        set_grabber(ReplayGrabber(args.replay, loop=True))
+
+    rows: List[dict] = []
+    for n in args.bots:
+        rows.extend(bench(n, args.seconds, args.tick, args.pool))
+
+    print(f"\n{'bots':>4} {'mode':<11} {'steps/s':>9}")
+    for r in rows:
+        print(f"{r['bots']:>4} {r['mode']:<11} {r['steps_per_sec']:>9.1f}")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        print(f"\n💾 opgeslagen: {args.json}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
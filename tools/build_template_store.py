@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+# =========================
+# BOOTSTRAP (ALTIJD EERST)
+# =========================
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# =========================
+# IMPORTS
+# =========================
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from core.paths import IMAGES_DIR
+from vision.template_store import STORE_BLOB, STORE_INDEX, TemplateStore, build_template_store
+
+# =========================
+# BUILD
+# =========================
+def _verify(images_dir: Path) -> int:
+    """Store vs PNG decode: zelfde pixels + cold load timing (verse store, geen cache)."""
+    pngs = sorted(images_dir.glob("*.png"))
+
+    t0 = time.perf_counter()
+    decoded = {}
+    for p in pngs:
+        bgr = cv2.imread(str(p), cv2.IMREAD_COLOR)
+        decoded[p.name] = (bgr, cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB), cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY))
+    png_ms = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    store = TemplateStore(images_dir=images_dir)
+    stored = {p.name: store.get(p.name) for p in pngs}
+    store_ms = (time.perf_counter() - t0) * 1000
+
+    bad = 0
+    for name, (bgr, rgb, gray) in decoded.items():
+        s = stored[name]
+        ok = s is not None and all(np.array_equal(a, b) for a, b in ((bgr, s.bgr), (rgb, s.rgb), (gray, s.gray)))
+        bad += 0 if ok else 1
+        if not ok:
+            print(f"🔴 {name}: {'niet in store / gewijzigd' if s is None else 'pixels wijken af'}")
+
+    print(f"⏱️ cold load {len(pngs)} templates: png decode {png_ms:.1f} ms | store {store_ms:.1f} ms")
+    print("🟢 store gelijk aan PNGs" if not bad else f"🔴 {bad} afwijkend")
+    return 1 if bad else 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Bouw de gecompileerde template store (mmap blob + index)")
+    ap.add_argument("--images", type=Path, default=Path(IMAGES_DIR))
+    ap.add_argument("--blob", type=Path, default=STORE_BLOB)
+    ap.add_argument("--index", type=Path, default=STORE_INDEX)
+    ap.add_argument("--verify", action="store_true", help="vergelijk met PNG decode + toon cold load timing")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    info = build_template_store(args.images, args.blob, args.index)
+    ms = (time.perf_counter() - t0) * 1000
+    state = "opnieuw gebouwd" if info["rebuilt"] else "ongewijzigd (hashes gelijk)"
+    print(f"📦 {info['templates']} templates, {info['bytes'] / 1024:.1f} KiB -> {args.blob} ({state}, {ms:.1f} ms)")
+
+    if args.verify:
+        return _verify(args.images)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
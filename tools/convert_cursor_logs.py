@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+# =========================
+# BOOTSTRAP (ALTIJD EERST)
+# =========================
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# =========================
+# IMPORTS
+# =========================
+import argparse
+import json
+import time
+
+import numpy as np
+
+from core.cursor_log import convert_json_log, meta_path, read_cursor_log, read_meta
+
+# =========================
+# CONVERT
+# =========================
+def _verify(src: Path, dst: Path) -> bool:
+    """
+    Zelfde punten als de JSON (t op 5 decimalen zoals het oude formaat schreef).
+    Referentie is json.load; alleen afgebroken JSON (niet te laden) via de regel parser.
+    """
+    new = read_cursor_log(dst)
+    if read_meta(dst).get("truncated"):
+        old = read_cursor_log(src)
+        return len(old) == len(new) and all(np.array_equal(old[k], new[k]) for k in ("t", "x", "y"))
+
+    with src.open("r", encoding="utf-8-sig") as f:
+        moves = json.load(f).get("moves", [])
+    return len(moves) == len(new) and all(
+        np.array_equal(np.array([m[k] for m in moves], dtype=np.float64), new[k].astype(np.float64))
+        for k in ("t", "x", "y")
+    )
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Zet oude cursor_log_*.json om naar het binaire .npy formaat (core.cursor_log)")
+    ap.add_argument("paths", nargs="*", type=Path, help="default: alle cursor_log_*.json in de project root")
+    ap.add_argument("--out", type=Path, default=None, help="doelmap (default: naast het JSON bestand)")
+    ap.add_argument("--verify", action="store_true", help="lees beide terug en vergelijk alle punten")
+    args = ap.parse_args()
+
+    paths = args.paths or sorted(PROJECT_ROOT.glob("cursor_log_*.json"))
+    if not paths:
+        print("⚠️ geen cursor_log_*.json gevonden")
+        return 1
+
+    bad = 0
+    for src in paths:
+        dst = (args.out / src.with_suffix(".npy").name) if args.out else None
+        t0 = time.perf_counter()
+        dst, points = convert_json_log(src, dst)
+        ms = (time.perf_counter() - t0) * 1000
+
+        size_old = src.stat().st_size
+        size_new = dst.stat().st_size + meta_path(dst).stat().st_size
+        meta = read_meta(dst)
+        note = " ⚠️ afgebroken JSON, punten tot de breuk bewaard" if meta.get("truncated") else ""
+        print(
+            f"📦 {src.name}: {points:,} punten | {size_old / 1e6:.2f} MB -> {size_new / 1e6:.2f} MB "
+            f"({size_old / max(size_new, 1):.1f}x kleiner, {ms:.0f} ms){note}"
+        )
+
+        if args.verify:
+            ok = _verify(src, dst)
+            bad += 0 if ok else 1
+            print(f"   {'🟢 gelijk' if ok else '🔴 wijkt af'}")
+
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
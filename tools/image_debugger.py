@@ -30,18 +30,9 @@ from PIL import Image, ImageTk
 
 from core.paths import CONFIG_DIR, IMAGES_DIR, AREAS_FILE
 from core.bot_offsets import apply_offset, load_areas
-
-# =========================
-# OPENCV METHODS
-# =========================
-METHODS = {
-    "TM_CCOEFF": cv2.TM_CCOEFF,
-    "TM_CCOEFF_NORMED": cv2.TM_CCOEFF_NORMED,
-    "TM_CCORR": cv2.TM_CCORR,
-    "TM_CCORR_NORMED": cv2.TM_CCORR_NORMED,
-    "TM_SQDIFF": cv2.TM_SQDIFF,
-    "TM_SQDIFF_NORMED": cv2.TM_SQDIFF_NORMED,
-}
+from vision.grabbers import grab_box_rgb
+from vision.debug_analysis import METHODS, analyze_method
+from vision.template_store import get_template_store
 
 META_FILE = Path(CONFIG_DIR) / "templates_meta.json"
 
@@ -89,7 +80,8 @@ def load_all_metadata() -> dict:
 
 def save_template_metadata(template_name: str, settings_dict: dict):
     meta = _safe_read_json(META_FILE)
-    meta[template_name] = settings_dict
+    # merge: extra keys (bv. pyramid_levels) blijven bewaard
+    meta[template_name] = {**meta.get(template_name, {}), **settings_dict}
     _safe_write_json(META_FILE, meta)
 
 
@@ -100,7 +92,19 @@ def delete_template_metadata(template_name: str):
         _safe_write_json(META_FILE, meta)
 
 
+def _stored_template(path: Path):
+    """Gevalideerde entry uit de template store (alleen voor PNGs direct in IMAGES_DIR)."""
+    p = Path(path)
+    if p.parent.resolve() != Path(IMAGES_DIR).resolve():
+        return None
+    return get_template_store().get(p.name)
+
+
 def read_template_rgb_gray(path: Path):
+    stored = _stored_template(path)
+    if stored is not None:
+        return stored.rgb, stored.gray
+
     bgr = cv2.imread(str(path), cv2.IMREAD_COLOR)
     if bgr is None:
         raise FileNotFoundError(f"Template niet gevonden of niet leesbaar: {path}")
@@ -110,67 +114,7 @@ def read_template_rgb_gray(path: Path):
 
 
 def grab_region_rgb(box_xyxy):
-    x1, y1, x2, y2 = box_xyxy
-    w, h = x2 - x1, y2 - y1
-    img = pyautogui.screenshot(region=(x1, y1, w, h))
-    return np.array(img)  # RGB
-
-
-def color_score_0_100(template_rgb: np.ndarray, patch_rgb: np.ndarray) -> float:
-    if patch_rgb.shape[:2] != template_rgb.shape[:2]:
-        patch_rgb = cv2.resize(patch_rgb, (template_rgb.shape[1], template_rgb.shape[0]))
-    diff = cv2.absdiff(template_rgb, patch_rgb)
-    mae = float(np.mean(diff))
-    return float(np.clip(100.0 - mae, 0.0, 100.0))
-
-
-def scoremap_0_1(match_result: np.ndarray, method_name: str) -> np.ndarray:
-    normalized = cv2.normalize(match_result, None, 0.0, 1.0, cv2.NORM_MINMAX)
-    if method_name in ("TM_SQDIFF", "TM_SQDIFF_NORMED"):
-        normalized = 1.0 - normalized
-    return normalized
-
-
-def find_all_matches_with_nms(
-    scores_0_1: np.ndarray,
-    template_width: int,
-    template_height: int,
-    minimum_score_0_1: float,
-    maximum_hits: int = 50,
-    nms_radius_pixels: int | None = None,
-):
-    if nms_radius_pixels is None:
-        nms_radius_pixels = max(5, int(min(template_width, template_height) * 0.50))
-
-    ys, xs = np.where(scores_0_1 >= float(minimum_score_0_1))
-    if len(xs) == 0:
-        return []
-
-    values = scores_0_1[ys, xs]
-    order = np.argsort(values)[::-1]
-
-    picked = []
-    for idx in order:
-        x = int(xs[idx])
-        y = int(ys[idx])
-        score = float(values[idx])
-
-        too_close = False
-        for px, py, _ in picked:
-            dx = x - px
-            dy = y - py
-            if (dx * dx + dy * dy) <= (nms_radius_pixels * nms_radius_pixels):
-                too_close = True
-                break
-
-        if too_close:
-            continue
-
-        picked.append((x, y, score))
-        if len(picked) >= int(maximum_hits):
-            break
-
-    return picked
+    return grab_box_rgb(box_xyxy)  # RGB
 
 
 def _crop_rgb(img_rgb: np.ndarray, x1: int, y1: int, x2: int, y2: int) -> np.ndarray:
@@ -511,7 +455,8 @@ class ImageDebugger(tk.Tk):
             return
         try:
             path = resolve_template_path(name)
-            img = Image.open(path)
+            stored = _stored_template(path)
+            img = Image.fromarray(np.array(stored.rgb)) if stored is not None else Image.open(path)
             img.thumbnail((260, 260))
             imgtk = ImageTk.PhotoImage(img)
             self._template_preview_cache["main"] = imgtk
@@ -609,7 +554,7 @@ class ImageDebugger(tk.Tk):
 
             old_meta = (self.template_metadata or {}).get(current)
             if old_meta:
-                save_template_metadata(new, TemplateSettings.from_dict(old_meta).to_dict())
+                save_template_metadata(new, {**old_meta, **TemplateSettings.from_dict(old_meta).to_dict()})
                 meta = _safe_read_json(META_FILE)
                 if current in meta:
                     meta.pop(current, None)
@@ -723,7 +668,6 @@ class ImageDebugger(tk.Tk):
         selected_method = str(self.method_var.get() or "ALL").strip()
         method_names = list(METHODS.keys()) if selected_method == "ALL" else [selected_method]
 
-        minimum_score_0_1 = float(min_shape) / 100.0
         nms_radius_pixels = None if nms_radius == 0 else nms_radius
 
         self._last_analysis.clear()
@@ -739,43 +683,22 @@ class ImageDebugger(tk.Tk):
             if method_name not in METHODS:
                 continue
 
-            method = METHODS[method_name]
-            match_result = cv2.matchTemplate(screenshot_gray, template_gray, method)
-            scores_0_1 = scoremap_0_1(match_result, method_name)
-
-            hits = find_all_matches_with_nms(
-                scores_0_1=scores_0_1,
-                template_width=tw,
-                template_height=th,
-                minimum_score_0_1=minimum_score_0_1,
-                maximum_hits=max_hits,
-                nms_radius_pixels=nms_radius_pixels,
+            # analyse zelf staat in vision/debug_analysis.py (ook gebruikt door tools/bench_detection.py)
+            result = analyze_method(
+                screenshot_rgb, screenshot_gray, template_rgb, template_gray,
+                method_name, min_shape, min_colour, max_hits, nms_radius_pixels,
             )
+            hits = result["hits"]
+            ok_count = result["ok"]
+            best_shape_local = result["best_shape"]
+            best_colour_local = result["best_colour"]
+            best_xy = result["best_xy"]
 
             visual = screenshot_rgb.copy()
-            ok_count = 0
-
-            best_shape_local = 0.0
-            best_colour_local = 0.0
-            best_xy = None
-
-            for x, y, score_0_1 in hits:
-                shape = float(score_0_1 * 100.0)
-                patch = screenshot_rgb[y:y + th, x:x + tw]
-                colour = color_score_0_100(template_rgb, patch) if patch.shape[:2] == template_rgb.shape[:2] else 0.0
-
-                is_ok = (shape >= min_shape) and (colour >= min_colour)
-                if is_ok:
-                    ok_count += 1
-
+            for x, y, _, _, is_ok in result["rows"]:
                 rect_color = (0, 255, 0) if is_ok else (255, 0, 0)
                 cv2.rectangle(visual, (x, y), (x + tw, y + th), rect_color, 2)
 
-                if shape > best_shape_local:
-                    best_shape_local = shape
-                    best_colour_local = colour
-                    best_xy = (x, y)
-
             hit_bool = len(hits) > 0
             self._add_result_row(method_name, hit_bool, best_shape_local, best_colour_local, len(hits), ok_count)
 
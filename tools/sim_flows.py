@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+# =========================
+# BOOTSTRAP (ALTIJD EERST)
+# =========================
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# =========================
+# IMPORTS
+# =========================
+import argparse
+import asyncio
+import runpy
+import time
+from typing import Dict, List, Tuple
+
+import cv2
+import numpy as np
+
+from core import tracing
+from core.area_registry import get_area_registry
+from core.helpers.assist_login import assist_login, assist_login_async
+from core.helpers.assist_logout import assist_logout, assist_logout_async
+from core.sim import ScriptedScreen, Transition, sim_mode
+from vision.compiled_template import get_compiled_template
+from vision.grabbers import ReplayGrabber
+
+# =========================
+# CONFIG
+# =========================
+SCREEN_SIZE = (1920, 1080)
+
+# scherm -> [(template, area, (dx, dy) binnen de area)]
+LOGIN_SCREENS: Dict[str, List[Tuple[str, str, Tuple[int, int]]]] = {
+    "login": [
+        ("Login_Screen_Play_Now.png", "Bot_Area", (120, 120)),
+        ("Login_Screen_World.png", "Bot_Area_Full", (40, 30)),
+    ],
+    "world": [
+        ("XP.png", "Info_Area", (100, 30)),
+        ("Logout_Door.png", "Buttons_Bottom", (95, 12)),
+    ],
+    "logout_panel": [
+        ("XP.png", "Info_Area", (100, 30)),
+        ("Logout_Door.png", "Buttons_Bottom", (95, 12)),
+        ("Logout_ClickHereToLogout.png", "Inventory_Area", (30, 80)),
+    ],
+}
+
+# (van, naar, klik-template, laadtijd in seconden)
+LOGIN_TRANSITIONS = (
+    ("login", "world", "Login_Screen_Play_Now.png", 2.0),
+    ("world", "logout_panel", "Logout_Door.png", 0.3),
+    ("logout_panel", "login", "Logout_ClickHereToLogout.png", 1.5),
+)
+
+# =========================
+# SCREENS
+# =========================
+def _background(rng: np.random.Generator) -> np.ndarray:
+    h, w = SCREEN_SIZE[1], SCREEN_SIZE[0]
+    gray = rng.integers(40, 110, (h // 40 + 1, w // 40 + 1, 1), dtype=np.int16)
+    img = cv2.resize(np.repeat(gray, 3, axis=2).astype(np.uint8), (w, h), interpolation=cv2.INTER_NEAREST)
+    noise = rng.integers(-3, 4, img.shape, dtype=np.int16)
+    return np.clip(img.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+
+def login_screen_script(bot_id: int = 1, seed: int = 0) -> ScriptedScreen:
+    """login -> (Play Now) -> world -> (deur) -> logout_panel -> (Click here) -> login"""
+    rng = np.random.default_rng(seed)
+    registry = get_area_registry()
+    base = _background(rng)
+
+    screens: Dict[str, np.ndarray] = {}
+    boxes: Dict[Tuple[str, str], Tuple[int, int, int, int]] = {}
+    for state, items in LOGIN_SCREENS.items():
+        rgb = base.copy()
+        for name, area, (dx, dy) in items:
+            tpl = get_compiled_template(name).rgb
+            x1, y1, _, _ = registry.box(area, bot_id)
+            x, y = x1 + dx, y1 + dy
+            rgb[y:y + tpl.shape[0], x:x + tpl.shape[1]] = tpl
+            boxes[(state, name)] = (x, y, x + tpl.shape[1], y + tpl.shape[0])
+        screens[state] = rgb
+
+    transitions = [Transition(src, dst, box=boxes[(src, name)], after=after) for src, dst, name, after in LOGIN_TRANSITIONS]
+    return ScriptedScreen(screens, start="login", transitions=transitions)
+
+# =========================
+# RUN
+# =========================
+async def _round_async(bot_id: int) -> Tuple[bool, bool]:
+    return (
+        await assist_login_async(bot_id=bot_id, timeout=15.0),
+        await assist_logout_async(bot_id=bot_id, timeout=15.0),
+    )
+
+
+def run_login_logout(screen: ScriptedScreen, iterations: int, bot_id: int, use_async: bool = False) -> Dict[str, float]:
+    ok_in = ok_out = 0
+    per_iter: List[float] = []
+    with sim_mode(screen) as sim:
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            t = time.perf_counter()
+            if use_async:
+                ok = asyncio.run(_round_async(bot_id))
+            else:
+                ok = (assist_login(bot_id=bot_id, timeout=15.0), assist_logout(bot_id=bot_id, timeout=15.0))
+            ok_in += ok[0]
+            ok_out += ok[1]
+            per_iter.append((time.perf_counter() - t) * 1000)
+        real = time.perf_counter() - t0
+        clicks = len(sim.recorder.clicks)
+        virtual = sim.clock.elapsed
+
+    per_iter.sort()
+    return {
+        "iterations": iterations,
+        "login_ok": ok_in,
+        "logout_ok": ok_out,
+        "clicks": clicks,
+        "real_s": real,
+        "virtual_s": virtual,
+        "iter_p50_ms": per_iter[len(per_iter) // 2] if per_iter else 0.0,
+        "iter_max_ms": per_iter[-1] if per_iter else 0.0,
+    }
+
+
+def run_script(path: Path, screen, bot_id: int) -> None:
+    with sim_mode(screen) as sim:
+        t0 = time.perf_counter()
+        runpy.run_path(str(path), run_name="__main__")
+        real = time.perf_counter() - t0
+        print(f"🎬 {path.name}: virtueel {sim.clock.elapsed:.1f}s in {real:.2f}s echt | clicks={len(sim.recorder.clicks)}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Flows headless draaien tegen een gescript of opgenomen scherm (virtuele klok)")
+    ap.add_argument("--iterations", type=int, default=100, help="aantal login+logout rondes")
+    ap.add_argument("--bot", type=int, default=1)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--replay", type=Path, default=None, help="opgenomen frames (map/video) i.p.v. het login script")
+    ap.add_argument("--script", type=Path, default=None, help="draai dit script 1x in sim mode (bv. scripts/first_script.py)")
+    ap.add_argument("--save-screens", type=Path, default=None, help="schrijf de gescripte schermen als png")
+    ap.add_argument("--trace", action="store_true", help="toon per-stage timing (core.tracing)")
+    ap.add_argument("--async", dest="use_async", action="store_true", help="assist_login_async/assist_logout_async i.p.v. de blokkerende flows")
+    args = ap.parse_args()
+
+    if args.trace:
+        tracing.enable(True)
+
+    screen = ReplayGrabber(args.replay) if args.replay else login_screen_script(args.bot, args.seed)
+
+    if args.save_screens and isinstance(screen, ScriptedScreen):
+        args.save_screens.mkdir(parents=True, exist_ok=True)
+        for state, rgb in screen._screens.items():
+            cv2.imwrite(str(args.save_screens / f"{state}.png"), cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR))
+        print(f"💾 schermen -> {args.save_screens}")
+
+    if args.script:
+        run_script(args.script, screen, args.bot)
+    else:
+        if not isinstance(screen, ScriptedScreen):
+            ap.error("login/logout rondes hebben het gescripte scherm nodig; gebruik --script met --replay")
+        r = run_login_logout(screen, args.iterations, args.bot, args.use_async)
+        print(
+            f"🔁 {r['iterations']} rondes | login ok={r['login_ok']} logout ok={r['logout_ok']} | clicks={r['clicks']}\n"
+            f"⏱️ echt {r['real_s']:.2f}s (p50 {r['iter_p50_ms']:.1f} ms/ronde, max {r['iter_max_ms']:.1f}) | "
+            f"virtueel {r['virtual_s']:.1f}s => {r['virtual_s'] / max(r['real_s'], 1e-9):.0f}x realtime"
+        )
+        print(f"🗺️ bezocht: {screen.visits}")
+        if r["login_ok"] != r["iterations"] or r["logout_ok"] != r["iterations"]:
+            return 1
+
+    if args.trace:
+        print(tracing.report())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+# =========================
+# BOOTSTRAP (ALTIJD EERST)
+# =========================
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# =========================
+# IMPORTS
+# =========================
+import argparse
+import json
+import time
+from typing import List, Optional
+
+import cv2
+
+from core.bot_offsets import apply_offset, load_areas
+from vision.grabbers import ReplayGrabber, get_grabber
+from vision.image_detection import (
+    META_FILE,
+    _exhaustive_locate,
+    _load_template_settings,
+    _pyramid_locate,
+    _read_template,
+)
+from vision.template_meta import load_template_meta
+
+# =========================
+# CONFIG
+# =========================
+DEFAULT_AREA = "Bot_Area_Full"
+DEFAULT_TOLERANCE_PX = 1
+SCORE_EPS = 1e-3  # relatief: gelijke piek elders (bv. 2x hetzelfde icoon) telt als ok
+
+# =========================
+# VALIDATE
+# =========================
+def _pyramid_templates() -> List[str]:
+    meta = load_template_meta()
+    return [name for name, d in meta.items() if isinstance(d, dict) and int(d.get("pyramid_levels", 0)) > 0]
+
+
+def validate(
+    template: str,
+    gray,
+    levels: Optional[int],
+    candidates: Optional[int],
+    tolerance: int,
+    repeat: int,
+) -> List[dict]:
+    cfg = _load_template_settings(template)
+    levels = cfg.pyramid_levels if levels is None else levels
+    candidates = cfg.pyramid_candidates if candidates is None else candidates
+    methods = [cfg.method] if cfg.method != "ALL" else ["TM_CCOEFF", "TM_CCOEFF_NORMED", "TM_SQDIFF_NORMED"]
+    _, _, tpl_gray = _read_template(template)
+
+    rows = []
+    for m in methods:
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            ex_loc, ex_score = _exhaustive_locate(gray, tpl_gray, m)
+        t_ex = (time.perf_counter() - t0) / repeat
+
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            located = _pyramid_locate(gray, tpl_gray, m, levels, candidates)
+        t_py = (time.perf_counter() - t0) / repeat
+
+        if located is None:
+            rows.append({"template": template, "method": m, "levels": levels, "ok": False, "reason": "template te klein voor levels"})
+            continue
+
+        py_loc, py_score = located
+        dx, dy = abs(py_loc[0] - ex_loc[0]), abs(py_loc[1] - ex_loc[1])
+        same_loc = dx <= tolerance and dy <= tolerance
+
+        raw = cv2.matchTemplate(gray, tpl_gray, getattr(cv2, m))
+        ex_raw = float(raw[ex_loc[1], ex_loc[0]])
+        py_raw = float(raw[py_loc[1], py_loc[0]])
+        same_peak = abs(ex_raw - py_raw) <= SCORE_EPS * max(1.0, abs(ex_raw))
+
+        rows.append({
+            "template": template,
+            "method": m,
+            "levels": levels,
+            "candidates": candidates,
+            "exhaustive_xy": list(ex_loc),
+            "pyramid_xy": list(py_loc),
+            "ok": same_loc or same_peak,
+            "tie": (not same_loc) and same_peak,
+            "exhaustive_ms": round(t_ex * 1000, 3),
+            "pyramid_ms": round(t_py * 1000, 3),
+            "speedup": round(t_ex / t_py, 2) if t_py > 0 else None,
+        })
+    return rows
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Vergelijk pyramid (coarse-to-fine) matching met exhaustive matchTemplate")
+    ap.add_argument("--templates", nargs="*", default=None, help="default: alle templates met pyramid_levels > 0")
+    ap.add_argument("--area", default=DEFAULT_AREA)
+    ap.add_argument("--bot", type=int, default=1)
+    ap.add_argument("--replay", type=Path, default=None, help="map/bestand met screenshots i.p.v. live scherm")
+    ap.add_argument("--frames", type=int, default=1, help="aantal frames om te valideren")
+    ap.add_argument("--levels", type=int, default=None, help="override pyramid_levels uit meta")
+    ap.add_argument("--candidates", type=int, default=None, help="override pyramid_candidates uit meta")
+    ap.add_argument("--tolerance", type=int, default=DEFAULT_TOLERANCE_PX)
+    ap.add_argument("--repeat", type=int, default=20, help="herhalingen voor timing")
+    ap.add_argument("--json", type=Path, default=None)
+    args = ap.parse_args()
+
+    templates = args.templates or _pyramid_templates()
+    if not templates:
+        print("⚠️ geen templates met pyramid_levels > 0 in", META_FILE)
+        return 1
+
+    areas = load_areas()
+    if args.area not in areas:
+        raise KeyError(f"Area niet gevonden: {args.area}")
+    x1, y1, x2, y2 = apply_offset(areas[args.area], args.bot)
+
+    grabber = ReplayGrabber(args.replay, loop=False) if args.replay else get_grabber()
+    n_frames = min(args.frames, grabber.frame_count) if args.replay else args.frames
+
+    rows = []
+    for _ in range(n_frames):
+        rgb = grabber.grab((x1, y1, x2 - x1, y2 - y1))
+        gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
+        for t in templates:
+            rows.extend(validate(t, gray, args.levels, args.candidates, args.tolerance, args.repeat))
+
+    bad = 0
+    for r in rows:
+        if "reason" in r:
+            print(f"⚠️ {r['template']} {r['method']}: {r['reason']}")
+            bad += 1
+            continue
+        icon = ("🟡" if r["tie"] else "🟢") if r["ok"] else "🔴"
+        bad += 0 if r["ok"] else 1
+        print(
+            f"{icon} {r['template']} {r['method']} L{r['levels']} | "
+            f"exh={r['exhaustive_xy']} pyr={r['pyramid_xy']} | "
+            f"{r['exhaustive_ms']}ms -> {r['pyramid_ms']}ms (x{r['speedup']})"
+        )
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -12,11 +12,15 @@ if str(ROOT) not in sys.path:
 # IMPORTS
 # ============================================================
 import json
-import cv2
-import numpy as np
-import pyautogui
+from core.lazy_import import lazy_module
+cv2 = lazy_module("cv2")
+np = lazy_module("numpy")
 
+from core.area_registry import get_area_registry
 from core.bot_offsets import apply_offset
+from vision.frame_capture import Frame
+from vision.grabbers import grab_rgb
+from vision.vision_pool import active_pool, area_frame
 
 # ============================================================
 
@@ -86,36 +90,93 @@ def load_areas():
     return out
 
 
-def grab_area_rgb(area, bot_id=1, areas=None):
-    if areas is None:
-        areas = load_areas()
-
+def grab_area_rgb(area, bot_id=1, areas=None, frame: Frame = None):
+    # frame meegegeven => zero-copy view uit gedeeld desktop-frame, geen eigen screenshot
     if area.lower() in FULLSCREEN:
-        return np.array(pyautogui.screenshot())
+        if frame is not None:
+            return frame.rgb
+        return grab_rgb()
 
-    key = None
-    for k in areas:
-        if k.lower() == area.lower():
-            key = k
-            break
-
-    if key is None:
-        raise Exception(f"Area niet gevonden: {area}")
+    if areas is None:
+        # gedeelde registry: case-insensitive index + vooraf berekende boxen per bot
+        registry = get_area_registry()
+        if area not in registry:
+            raise Exception(f"Area niet gevonden: {area}")
+        x1, y1, x2, y2 = registry.box(area, bot_id)
+    else:
+        key = None
+        for k in areas:
+            if k.lower() == area.lower():
+                key = k
+                break
+
+        if key is None:
+            raise Exception(f"Area niet gevonden: {area}")
+
+        x1, y1, x2, y2 = apply_offset(areas[key], bot_id)
+    if frame is not None:
+        return frame.view((x1, y1, x2, y2))
 
-    x1, y1, x2, y2 = apply_offset(areas[key], bot_id)
     w = x2 - x1
     h = y2 - y1
 
-    return np.array(pyautogui.screenshot(region=(x1, y1, w, h)))
+    return grab_rgb((x1, y1, w, h))
 
 
 # ============================================================
-# CORE
+# LUT
 # ============================================================
-def detect_colour(colour, area, percentage, bot_id=1, verbose=False, blur=3, areas=None):
-    colour = COLOR_ALIASES.get(colour.lower(), colour.lower())
+# elke HSV range uit COLOR_RANGES krijgt 1 bit; per kanaal een 256-entry LUT met de bits
+# van de ranges waar die waarde binnen valt. h & s & v => bitmask van alle ranges die matchen.
+# (scheidbaar per kanaal => 3x cv2.LUT i.p.v. een 180x256x256 tabel met cache misses)
+_LUT_COLOURS = list(COLOR_RANGES)
+_LUTS = None
+
+
+def _colour_luts():
+    global _LUTS
+    if _LUTS is None:
+        ranges = [(name, lo, hi) for name, rs in COLOR_RANGES.items() for lo, hi in rs]
+        if len(ranges) > 8:
+            raise ValueError("max 8 HSV ranges in COLOR_RANGES (1 byte bitmask)")
+
+        h_lut = np.zeros(256, dtype=np.uint8)
+        s_lut = np.zeros(256, dtype=np.uint8)
+        v_lut = np.zeros(256, dtype=np.uint8)
+        colour_bits = {name: 0 for name in COLOR_RANGES}
+        for i, (name, (h0, s0, v0), (h1, s1, v1)) in enumerate(ranges):
+            bit = 1 << i
+            h_lut[h0:h1 + 1] |= bit
+            s_lut[s0:s1 + 1] |= bit
+            v_lut[v0:v1 + 1] |= bit
+            colour_bits[name] |= bit
+
+        # per kleur: welke van de 256 mogelijke maskers tellen mee
+        codes = np.arange(256)
+        selectors = {name: (codes & bits) != 0 for name, bits in colour_bits.items()}
+        _LUTS = (h_lut, s_lut, v_lut, selectors)
+    return _LUTS
+
+
+def _normalize_colour(colour):
+    colour = colour.lower()
+    return COLOR_ALIASES.get(colour, colour)
+
 
-    rgb = grab_area_rgb(area, bot_id=bot_id, areas=areas)
+# ============================================================
+# CORE
+# ============================================================
+def colour_fractions(rgb, colours=None, blur=3):
+    """
+    Percentage (0..100) per kleur in 1 pass:
+    1x blur + 1x HSV, daarna range-bitmask per pixel (3x LUT) en 1 histogram over de 256 mogelijke maskers.
+    colours=None => alle COLOR_RANGES.
+    """
+    h_lut, s_lut, v_lut, selectors = _colour_luts()
+    names = _LUT_COLOURS if colours is None else [_normalize_colour(c) for c in colours]
+    for name in names:
+        if name not in selectors:
+            raise KeyError(f"onbekende kleur: {name}")
 
     if blur >= 3:
         if blur % 2 == 0:
@@ -123,38 +184,91 @@ def detect_colour(colour, area, percentage, bot_id=1, verbose=False, blur=3, are
         rgb = cv2.GaussianBlur(rgb, (blur, blur), 0)
 
     hsv = cv2.cvtColor(rgb, cv2.COLOR_RGB2HSV)
+    total = hsv.shape[0] * hsv.shape[1]
+    if total == 0:
+        return {name: 0.0 for name in names}
+
+    h, s, v = cv2.split(hsv)
+    mask = cv2.bitwise_and(cv2.LUT(h, h_lut), cv2.LUT(s, s_lut))
+    cv2.bitwise_and(mask, cv2.LUT(v, v_lut), dst=mask)
+    hist = cv2.calcHist([mask], [0], None, [256], [0, 256]).ravel()
+
+    return {name: float(hist[selectors[name]].sum()) * 100.0 / total for name in names}
+
+
+def colour_percentages(area, colours=None, bot_id=1, blur=3, areas=None, frame: Frame = None):
+    """1 grab van de area => {kleur: percentage} voor alle gevraagde kleuren."""
+    rgb = grab_area_rgb(area, bot_id=bot_id, areas=areas, frame=frame)
+    pool = active_pool()
+    if pool is not None:
+        return pool.run("colour_fractions", area_frame(rgb, frame=frame), bot_id, colours=colours, blur=blur)
+    return colour_fractions(rgb, colours, blur=blur)
+
+
+def _print_result(colour, area, percent, percentage, ok, bot_id):
+    kleur_label = colour.capitalize()
+    pct = f"{percent:.2f}".replace(".", ",")
+    min_pct = f"{percentage}".replace(".", ",")
+    status = "found" if ok else "not found"
+    icon = "🟢" if ok else "🔴"
+
+    kleur_ansi = ANSI.get(colour, "")
+    area_ansi = ANSI["area"]
+    reset = ANSI["reset"]
+
+    print(
+        f"{icon} "
+        f"{kleur_ansi}{kleur_label}{reset} {status} in "
+        f"{area_ansi}{area}{reset} | "
+        f"{pct}% | Min {min_pct}% | Bot = {bot_id}"
+    )
+
+
+def _split_known(percentages, verbose=False):
+    wanted = {_normalize_colour(c): p for c, p in percentages.items()}
+    unknown = [c for c in wanted if c not in COLOR_RANGES]
+    if unknown:
+        if verbose:
+            print(f"❌ onbekende kleur: {', '.join(unknown)}")
+        wanted = {c: p for c, p in wanted.items() if c in COLOR_RANGES}
+    return wanted, unknown
+
+
+def judge_colours(percentages, found, area, bot_id=1, verbose=False):
+    """
+    Drempels {kleur: min%} tegen al gemeten percentages (colour_percentages) => {kleur: True/False}.
+    Voor callers die de meting zelf cachen (states engine).
+    """
+    wanted, unknown = _split_known(percentages, verbose)
+
+    out = {c: False for c in unknown}
+    for colour, percentage in wanted.items():
+        ok = found[colour] >= percentage
+        out[colour] = ok
+        if verbose:
+            _print_result(colour, area, found[colour], percentage, ok, bot_id)
+    return out
+
+
+def detect_colours(percentages, area, bot_id=1, verbose=False, blur=3, areas=None, frame: Frame = None):
+    """
+    detect_colours({"green": 2, "red": 2}, "Skilling_Area")
+    => {"groen": True/False, "rood": True/False} met 1 grab + 1 HSV conversie.
+    """
+    wanted, _ = _split_known(percentages)
+    found = colour_percentages(area, list(wanted), bot_id=bot_id, blur=blur, areas=areas, frame=frame) if wanted else {}
+    return judge_colours(percentages, found, area, bot_id=bot_id, verbose=verbose)
+
+
+def detect_colour(colour, area, percentage, bot_id=1, verbose=False, blur=3, areas=None, frame: Frame = None):
+    colour = _normalize_colour(colour)
 
-    ranges = COLOR_RANGES.get(colour)
-    if not ranges:
+    if colour not in COLOR_RANGES:
         if verbose:
             print(f"❌ onbekende kleur: {colour}")
         return False
 
-    mask = None
-    for lo, hi in ranges:
-        m = cv2.inRange(hsv, np.array(lo), np.array(hi))
-        mask = m if mask is None else cv2.bitwise_or(mask, m)
-
-    percent = (mask > 0).mean() * 100
-    ok = percent >= percentage
-
-    if verbose:
-        kleur_label = colour.capitalize()
-        pct = f"{percent:.2f}".replace(".", ",")
-        min_pct = f"{percentage}".replace(".", ",")
-        status = "found" if ok else "not found"
-        icon = "🟢" if ok else "🔴"
-
-        kleur_ansi = ANSI.get(colour, "")
-        area_ansi = ANSI["area"]
-        reset = ANSI["reset"]
-
-        print(
-            f"{icon} "
-            f"{kleur_ansi}{kleur_label}{reset} {status} in "
-            f"{area_ansi}{area}{reset} | "
-            f"{pct}% | Min {min_pct}% | Bot = {bot_id}"
-        )
+    return detect_colours({colour: percentage}, area, bot_id=bot_id, verbose=verbose, blur=blur, areas=areas, frame=frame)[colour]
 
 
 # ============================================================
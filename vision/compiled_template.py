@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: centraal en voorspelbaar, voorkomt verborgen dependencies.
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import threading
+
+from core.lazy_import import lazy_module
+cv2 = lazy_module("cv2")
+np = lazy_module("numpy")
+
+from core.paths import IMAGES_DIR
+from vision.template_store import get_template_store
+# === END IMPORTS ===
+
+
+# === START CONSTANTS ===
+# • WAT: grootte van de LRU cache.
+# • WAAROM: begrensd geheugen, ook als tools honderden varianten inladen.
+TEMPLATE_CACHE_SIZE = 128
+# === END CONSTANTS ===
+
+
+# === START MODELS ===
+# • WAT: template + alles wat per match anders opnieuw berekend wordt.
+# • WAAROM: hot path (elke ~100 ms) doet geen template statistiek of buffer allocaties meer.
+class CompiledTemplate:
+    """
+    bgr/rgb/gray        = zelfde arrays als de oude _TEMPLATE_CACHE tuple
+    gray_sum / gray_sq  = som en kwadratensom (voor de afgeleide "ALL" maps)
+    mean / norm / std   = gray statistiek; zero_mean = gray - mean (float32)
+    pyramid(levels)     = pyrDown versie, 1x berekend per level
+    spectrum(shape)     = optionele DFT van het gepadde template (lazy)
+    color_score(patch)  = 100 - mean absdiff, met per-thread scratch buffer
+    """
+
+    def __init__(
+        self,
+        name: str,
+        path: Path,
+        bgr: np.ndarray,
+        rgb: Optional[np.ndarray] = None,
+        gray: Optional[np.ndarray] = None,
+        stats: Optional[Tuple[float, float]] = None,
+    ):
+        self.name = name
+        self.path = path
+        self.bgr = bgr
+        self.rgb = rgb if rgb is not None else cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+        self.gray = gray if gray is not None else cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+        for arr in (self.bgr, self.rgb, self.gray):
+            arr.setflags(write=False)
+
+        self.height, self.width = self.gray.shape[:2]
+        self.size = self.height * self.width
+
+        g = self.gray.astype(np.float64)
+        if stats is not None:
+            self.gray_sum, self.gray_sq = float(stats[0]), float(stats[1])
+        else:
+            self.gray_sum = float(g.sum())
+            self.gray_sq = float((g * g).sum())
+        self.mean = self.gray_sum / self.size
+        self.norm = float(np.sqrt(self.gray_sq))
+        self.var = max(self.gray_sq - self.gray_sum * self.gray_sum / self.size, 0.0)
+        self.std = float(np.sqrt(self.var / self.size))
+        self.zero_mean = (g - self.mean).astype(np.float32)
+
+        self._pyramids: Dict[int, np.ndarray] = {0: self.gray}
+        self._spectra: Dict[Tuple[int, int], np.ndarray] = {}
+        self._lock = threading.Lock()
+        self._scratch = threading.local()
+
+    @property
+    def stats(self) -> Tuple[float, float]:
+        """(som, kwadratensom) van gray; input voor vision.match_all."""
+        return self.gray_sum, self.gray_sq
+
+    def pyramid(self, levels: int) -> np.ndarray:
+        levels = max(0, int(levels))
+        small = self._pyramids.get(levels)
+        if small is None:
+            small = self.gray
+            for _ in range(levels):
+                small = cv2.pyrDown(small)
+            with self._lock:
+                self._pyramids[levels] = small
+        return small
+
+    def spectrum(self, dft_shape: Tuple[int, int]) -> np.ndarray:
+        """
+        DFT (complex, 2 kanalen) van gray, zero-padded tot dft_shape.
+        Optioneel: matchTemplate is bij onze icoon-groottes sneller dan FFT correlatie,
+        dit is voor grote templates/areas of externe tools.
+        """
+        key = (int(dft_shape[0]), int(dft_shape[1]))
+        spec = self._spectra.get(key)
+        if spec is None:
+            padded = np.zeros(key, dtype=np.float32)
+            padded[:self.height, :self.width] = self.gray
+            spec = cv2.dft(padded, flags=cv2.DFT_COMPLEX_OUTPUT)
+            with self._lock:
+                self._spectra[key] = spec
+        return spec
+
+    def ccorr_fft(self, gray: np.ndarray) -> np.ndarray:
+        """TM_CCORR map via het gecachete spectrum (zelfde shape als matchTemplate output)."""
+        H, W = gray.shape[:2]
+        shape = (cv2.getOptimalDFTSize(H), cv2.getOptimalDFTSize(W))
+        padded = np.zeros(shape, dtype=np.float32)
+        padded[:H, :W] = gray
+        img = cv2.dft(padded, flags=cv2.DFT_COMPLEX_OUTPUT, nonzeroRows=H)
+        prod = cv2.mulSpectrums(img, self.spectrum(shape), 0, conjB=True)
+        res = cv2.idft(prod, flags=cv2.DFT_REAL_OUTPUT | cv2.DFT_SCALE)
+        return res[:H - self.height + 1, :W - self.width + 1]
+
+    def _buffer(self, attr: str, shape: Tuple[int, ...]) -> np.ndarray:
+        buf = getattr(self._scratch, attr, None)
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, dtype=np.uint8)
+            setattr(self._scratch, attr, buf)
+        return buf
+
+    def color_score(self, patch_rgb: np.ndarray) -> float:
+        """Zelfde score als de oude _color_score, zonder nieuwe buffers per call."""
+        if patch_rgb.shape[:2] != self.rgb.shape[:2]:
+            patch_rgb = cv2.resize(patch_rgb, (self.width, self.height), dst=self._buffer("resized", self.rgb.shape))
+        diff = cv2.absdiff(self.rgb, patch_rgb, dst=self._buffer("diff", self.rgb.shape))
+        mean = sum(cv2.sumElems(diff)) / diff.size
+        return float(min(max(100.0 - mean, 0.0), 100.0))
+# === END MODELS ===
+
+
+# === START CORE LOGIC ===
+# • WAT: begrensde LRU cache van CompiledTemplates, thread-safe.
+# • WAAROM: scheduler threads delen dezelfde templates; oudste valt eruit bij overloop.
+class TemplateCache:
+    def __init__(self, maxsize: int = TEMPLATE_CACHE_SIZE):
+        self.maxsize = max(1, int(maxsize))
+        self._items: "OrderedDict[str, CompiledTemplate]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def resolve(image_name: str) -> Path:
+        p = Path(image_name)
+        return p if p.is_absolute() else Path(IMAGES_DIR) / image_name
+
+    def get(self, image_name: str) -> CompiledTemplate:
+        path = self.resolve(image_name)
+        key = str(path.resolve())
+
+        with self._lock:
+            tpl = self._items.get(key)
+            if tpl is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return tpl
+            self.misses += 1
+
+        # eerst de gecompileerde store (mmap, geen PNG decode); gewijzigde/nieuwe PNG => imread
+        stored = get_template_store().get(image_name) if not Path(image_name).is_absolute() else None
+        if stored is not None:
+            tpl = CompiledTemplate(image_name, path, stored.bgr, stored.rgb, stored.gray, (stored.gray_sum, stored.gray_sq))
+        else:
+            bgr = cv2.imread(str(path))
+            if bgr is None:
+                raise FileNotFoundError(f"Template niet gevonden: {path}")
+            tpl = CompiledTemplate(image_name, path, bgr)
+
+        with self._lock:
+            self._items[key] = tpl
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return tpl
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+_CACHE = TemplateCache()
+
+
+def get_template_cache() -> TemplateCache:
+    return _CACHE
+
+
+def get_compiled_template(image_name: str) -> CompiledTemplate:
+    return _CACHE.get(image_name)
+# === END CORE LOGIC ===
+
+
+# === START CLI TEST ===
+# • WAT: veilige handmatige test.
+# • WAAROM: laat zien dat de kleurscore gelijk blijft en hoeveel een call kost.
+if __name__ == "__main__":
+    import time
+
+    tpl = get_compiled_template("Raw_Trout.png")
+    rng = np.random.default_rng(0)
+    patch = np.clip(tpl.rgb.astype(np.int16) + rng.integers(-20, 21, tpl.rgb.shape), 0, 255).astype(np.uint8)
+
+    old = float(np.clip(100 - np.mean(cv2.absdiff(tpl.rgb, patch)), 0, 100))
+    new = tpl.color_score(patch)
+    print(f"{'🟢' if abs(old - new) < 1e-9 else '🔴'} kleur oud={old:.4f} nieuw={new:.4f}")
+
+    t0 = time.perf_counter()
+    for _ in range(10000):
+        tpl.color_score(patch)
+    print(f"⏱️ color_score: {(time.perf_counter() - t0) / 10000 * 1e6:.2f} µs | cache={len(get_template_cache())}")
+# === END CLI TEST ===
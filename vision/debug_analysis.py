@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: centraal en voorspelbaar, voorkomt verborgen dependencies.
+from typing import Any, Dict, Optional
+
+import cv2
+import numpy as np
+
+from vision.peaks import peaks_radius
+# === END IMPORTS ===
+
+
+# === START CONSTANTS ===
+# • WAT: method mapping zoals in de image_debugger UI.
+# • WAAROM: analyse moet zonder tkinter/PIL draaien (benchmarks, headless).
+METHODS: Dict[str, int] = {
+    "TM_CCOEFF": cv2.TM_CCOEFF,
+    "TM_CCOEFF_NORMED": cv2.TM_CCOEFF_NORMED,
+    "TM_CCORR": cv2.TM_CCORR,
+    "TM_CCORR_NORMED": cv2.TM_CCORR_NORMED,
+    "TM_SQDIFF": cv2.TM_SQDIFF,
+    "TM_SQDIFF_NORMED": cv2.TM_SQDIFF_NORMED,
+}
+# === END CONSTANTS ===
+
+
+# === START SCORING ===
+# • WAT: score helpers van tools/image_debugger (ongewijzigd gedrag).
+# • WAAROM: UI en benchmark meten precies dezelfde analyse.
+def color_score_0_100(template_rgb: np.ndarray, patch_rgb: np.ndarray) -> float:
+    if patch_rgb.shape[:2] != template_rgb.shape[:2]:
+        patch_rgb = cv2.resize(patch_rgb, (template_rgb.shape[1], template_rgb.shape[0]))
+    diff = cv2.absdiff(template_rgb, patch_rgb)
+    mae = float(np.mean(diff))
+    return float(np.clip(100.0 - mae, 0.0, 100.0))
+
+
+def scoremap_0_1(match_result: np.ndarray, method_name: str) -> np.ndarray:
+    normalized = cv2.normalize(match_result, None, 0.0, 1.0, cv2.NORM_MINMAX)
+    if method_name in ("TM_SQDIFF", "TM_SQDIFF_NORMED"):
+        normalized = 1.0 - normalized
+    return normalized
+
+
+def find_all_matches_with_nms(
+    scores_0_1: np.ndarray,
+    template_width: int,
+    template_height: int,
+    minimum_score_0_1: float,
+    maximum_hits: int = 50,
+    nms_radius_pixels: int | None = None,
+):
+    if nms_radius_pixels is None:
+        nms_radius_pixels = max(5, int(min(template_width, template_height) * 0.50))
+
+    # lokale maxima + grid NMS i.p.v. elke kandidaat tegen elke gekozen hit
+    return peaks_radius(scores_0_1, float(minimum_score_0_1), nms_radius_pixels, max_hits=int(maximum_hits))
+# === END SCORING ===
+
+
+# === START API ===
+# • WAT: analyse van één methode op één screenshot (zonder tekenen).
+# • WAAROM: image_debugger tekent de resultaten; benchmarks gebruiken alleen de cijfers.
+def analyze_method(
+    screenshot_rgb: np.ndarray,
+    screenshot_gray: np.ndarray,
+    template_rgb: np.ndarray,
+    template_gray: np.ndarray,
+    method_name: str,
+    min_shape: float,
+    min_colour: float,
+    max_hits: int = 50,
+    nms_radius_pixels: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Returns dict met hits [(x, y, score_0_1)], per hit shape/colour/ok, en de beste hit.
+    Coördinaten zijn relatief aan de screenshot.
+    """
+    th, tw = template_gray.shape[:2]
+    match_result = cv2.matchTemplate(screenshot_gray, template_gray, METHODS[method_name])
+    scores_0_1 = scoremap_0_1(match_result, method_name)
+
+    hits = find_all_matches_with_nms(
+        scores_0_1=scores_0_1,
+        template_width=tw,
+        template_height=th,
+        minimum_score_0_1=float(min_shape) / 100.0,
+        maximum_hits=max_hits,
+        nms_radius_pixels=nms_radius_pixels,
+    )
+
+    rows = []
+    ok_count = 0
+    best_shape, best_colour, best_xy = 0.0, 0.0, None
+    for x, y, score_0_1 in hits:
+        shape = float(score_0_1 * 100.0)
+        patch = screenshot_rgb[y:y + th, x:x + tw]
+        colour = color_score_0_100(template_rgb, patch) if patch.shape[:2] == template_rgb.shape[:2] else 0.0
+
+        is_ok = (shape >= min_shape) and (colour >= min_colour)
+        ok_count += 1 if is_ok else 0
+        rows.append((x, y, shape, colour, is_ok))
+
+        if shape > best_shape:
+            best_shape, best_colour, best_xy = shape, colour, (x, y)
+
+    return {
+        "hits": hits,
+        "rows": rows,
+        "ok": ok_count,
+        "best_xy": best_xy,
+        "best_shape": best_shape,
+        "best_colour": best_colour,
+    }
+# === END API ===
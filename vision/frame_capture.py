@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: centraal en voorspelbaar, voorkomt verborgen dependencies.
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+import threading
+import time
+
+from core.lazy_import import lazy_module
+np = lazy_module("numpy")
+
+from core.area_registry import area_box
+from vision.grabbers import grab_rgb
+# === END IMPORTS ===
+
+
+# === START CONSTANTS ===
+# • WAT: default maximale leeftijd van een frame + capture thread defaults.
+# • WAAROM: binnen één tick (±100 ms) willen alle detectors hetzelfde frame zien.
+DEFAULT_MAX_AGE_SEC = 0.1
+
+DEFAULT_CAPTURE_FPS = 30.0
+DEFAULT_RING_SIZE = 8        # 8 frames @ 30 fps: een frame blijft ±266 ms ongewijzigd na publicatie
+# === END CONSTANTS ===
+
+
+# === START MODELS ===
+# • WAT: één volledig desktop-frame + metadata.
+# • WAAROM: detectors krijgen een handle i.p.v. zelf te screenshotten.
+@dataclass(frozen=True)
+class Frame:
+    rgb: np.ndarray
+    ts: float
+    seq: int
+    origin: Tuple[int, int] = (0, 0)
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.ts
+
+    def _clip(self, box: Sequence[int]) -> Tuple[int, int, int, int]:
+        """[x1,y1,x2,y2] in schermcoördinaten -> geclipte [x1,y1,x2,y2] in frame-pixels."""
+        ox, oy = self.origin
+        h, w = self.rgb.shape[:2]
+        x1 = min(max(int(box[0]) - ox, 0), w)
+        y1 = min(max(int(box[1]) - oy, 0), h)
+        x2 = min(max(int(box[2]) - ox, x1), w)
+        y2 = min(max(int(box[3]) - oy, y1), h)
+        return x1, y1, x2, y2
+
+    def view(self, box: Sequence[int]) -> np.ndarray:
+        """
+        Zero-copy view op [x1,y1,x2,y2] in schermcoördinaten.
+        Valt de box (deels) buiten het frame, dan wordt er geclipt.
+        """
+        x1, y1, x2, y2 = self._clip(box)
+        return self.rgb[y1:y2, x1:x2]
+
+    def view_origin(self, box: Sequence[int]) -> Tuple[int, int]:
+        """Schermpositie van view(box)[0, 0]: na clippen niet altijd (box[0], box[1])."""
+        x1, y1, _, _ = self._clip(box)
+        return self.origin[0] + x1, self.origin[1] + y1
+
+    def area(
+        self,
+        area_name: str,
+        bot_id: int = 1,
+        areas: Optional[Dict[str, List[int]]] = None,
+    ) -> np.ndarray:
+        """Zero-copy view voor een area uit config/areas.json, met bot offset."""
+        return self.view(area_box(area_name, bot_id, areas or None))
+# === END MODELS ===
+
+
+# === START HELPERS ===
+# • WAT: low-level grab van de volledige desktop (of een vaste region).
+# • WAAROM: één plek waar het scherm daadwerkelijk gelezen wordt.
+def _grab_desktop_rgb(region: Optional[Tuple[int, int, int, int]] = None) -> np.ndarray:
+    return grab_rgb(region)
+# === END HELPERS ===
+
+
+# === START CORE LOGIC ===
+# • WAT: capture service die per tick maximaal één desktop-frame maakt.
+# • WAAROM: XP check, skilling kleur en inventory delen hetzelfde screenshot.
+class FrameCapture:
+    """
+    region=None         => volledige desktop (default, gedeeld tussen detectors)
+    region=(x, y, w, h) => alleen dat stuk; Frame.origin = (x, y) zodat view() in schermcoördinaten blijft
+    """
+
+    def __init__(self, max_age: float = DEFAULT_MAX_AGE_SEC, region: Optional[Tuple[int, int, int, int]] = None):
+        self.max_age = float(max_age)
+        self.region = tuple(int(v) for v in region) if region is not None else None
+        self._lock = threading.Lock()
+        self._frame: Optional[Frame] = None
+        self._seq = 0
+
+    def grab(self) -> Frame:
+        """Forceert een nieuw frame."""
+        with self._lock:
+            return self._grab_locked()
+
+    def get(self, max_age: Optional[float] = None) -> Frame:
+        """Geeft het huidige frame terug zolang het niet ouder is dan max_age."""
+        limit = self.max_age if max_age is None else float(max_age)
+        with self._lock:
+            f = self._frame
+            if f is not None and (time.monotonic() - f.ts) <= limit:
+                return f
+            return self._grab_locked()
+
+    def invalidate(self) -> None:
+        """Volgende get() maakt gegarandeerd een vers frame (bv. na een klik)."""
+        with self._lock:
+            self._frame = None
+
+    def _grab_locked(self) -> Frame:
+        rgb = _grab_desktop_rgb(self.region)
+        origin = (self.region[0], self.region[1]) if self.region is not None else (0, 0)
+        self._seq += 1
+        self._frame = Frame(rgb=rgb, ts=time.monotonic(), seq=self._seq, origin=origin)
+        return self._frame
+
+
+_DEFAULT_CAPTURE = FrameCapture()
+# === END CORE LOGIC ===
+
+
+# === START CAPTURE THREAD ===
+# • WAT: producer thread die op vaste fps grabt in een ring van voorgealloceerde frames.
+# • WAAROM: grab overlapt met matching; pollende loops zien een verandering binnen ±1 frame periode.
+class ThreadedCapture(FrameCapture):
+    """
+    Zelfde API als FrameCapture (get/grab/invalidate), plus:
+      latest()                 => nieuwste frame zonder wachten (None voor het eerste frame)
+      wait_next(after_seq, t)  => blokkeer tot er een frame met seq > after_seq is
+      valid(frame)             => False als de ring het slot van dit frame al overschreven heeft
+
+    Frames zijn views op de ring: een consumer mag een frame maximaal ±(ring-1)/fps sec vasthouden.
+    Langer nodig (bv. over een klik + sleep heen)? Neem frame.rgb.copy().
+    """
+
+    def __init__(
+        self,
+        fps: float = DEFAULT_CAPTURE_FPS,
+        ring: int = DEFAULT_RING_SIZE,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        max_age: float = DEFAULT_MAX_AGE_SEC,
+    ):
+        super().__init__(max_age=max_age, region=region)
+        self.period = 1.0 / max(float(fps), 0.1)
+        self._ring: List[np.ndarray] = []
+        self._ring_size = max(2, int(ring))
+        self._slot_seq: List[int] = [0] * self._ring_size
+        self._cond = threading.Condition(self._lock)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._not_before = 0.0      # invalidate(): frames moeten ná dit moment gestart zijn
+        self.error: Optional[BaseException] = None
+        self.dropped = 0            # periodes waarin de grab langer duurde dan de frame periode
+
+    # --- lifecycle ---
+    def start(self) -> "ThreadedCapture":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="frame-capture", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, wait: bool = True) -> None:
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if wait and self._thread is not None:
+            self._thread.join()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def __enter__(self) -> "ThreadedCapture":
+        return self.start()
+
+    def __exit__(self, *_exc) -> None:
+        self.stop()
+
+    # --- producer ---
+    def _slot(self, seq: int) -> int:
+        return seq % self._ring_size
+
+    def _run(self) -> None:
+        origin = (self.region[0], self.region[1]) if self.region is not None else (0, 0)
+        next_t = time.monotonic()
+        while not self._stop.is_set():
+            ts = time.monotonic()
+            seq = self._seq + 1
+            slot = self._slot(seq)
+            with self._lock:
+                self._slot_seq[slot] = 0    # slot wordt overschreven: oude frame is vanaf nu ongeldig
+            try:
+                if not self._ring:
+                    first = _grab_desktop_rgb(self.region)
+                    self._ring = [np.empty_like(first) for _ in range(self._ring_size)]
+                    np.copyto(self._ring[slot], first)
+                else:
+                    grab_rgb(self.region, self._ring[slot])
+            except BaseException as e:  # doorgeven aan wachtende consumers i.p.v. stil sterven
+                with self._cond:
+                    self.error = e
+                    self._cond.notify_all()
+                return
+
+            with self._cond:
+                self._seq = seq
+                self._slot_seq[slot] = seq
+                self._frame = Frame(rgb=self._ring[slot], ts=ts, seq=seq, origin=origin)
+                self._cond.notify_all()
+
+            next_t += self.period
+            now = time.monotonic()
+            if next_t < now:
+                self.dropped += int((now - next_t) / self.period) + 1
+                next_t = now
+            self._stop.wait(next_t - now)
+
+    # --- consumers ---
+    def _fresh(self, f: Optional[Frame], after_seq: int) -> bool:
+        return f is not None and f.seq > after_seq and f.ts >= self._not_before
+
+    def wait_next(self, after_seq: int = 0, timeout: Optional[float] = None) -> Optional[Frame]:
+        """
+        Eerste frame met seq > after_seq (en na de laatste invalidate). None bij timeout/stop.
+        Start de thread niet zelf: een gestopte capture blijft gestopt (stop_capture_thread ziet geen verweesde producer).
+        """
+        if self.error is not None:
+            raise RuntimeError("capture thread gestopt") from self.error
+        if not self.running:
+            return None
+        with self._cond:
+            ok = self._cond.wait_for(
+                lambda: self._fresh(self._frame, after_seq) or self.error is not None or self._stop.is_set(),
+                timeout,
+            )
+            if self.error is not None:
+                raise RuntimeError("capture thread gestopt") from self.error
+            return self._frame if ok and self._fresh(self._frame, after_seq) else None
+
+    def latest(self) -> Optional[Frame]:
+        with self._lock:
+            f = self._frame
+            return f if f is not None and f.ts >= self._not_before else None
+
+    def get(self, max_age: Optional[float] = None) -> Frame:
+        """Nieuwste frame; is dat ouder dan max_age (of van vóór invalidate), dan wachten op het volgende."""
+        limit = self.max_age if max_age is None else float(max_age)
+        f = self.latest()
+        if f is not None and (time.monotonic() - f.ts) <= max(limit, self.period):
+            return f
+        return self.grab()
+
+    def grab(self) -> Frame:
+        """Eerste frame waarvan de grab ná deze call start."""
+        with self._lock:
+            self._not_before = max(self._not_before, time.monotonic())
+            after = self._seq
+        f = self.wait_next(after, timeout=max(1.0, self.period * 4))
+        if f is None:
+            if not self.running:
+                raise RuntimeError("capture thread draait niet (start() of start_capture_thread() eerst)")
+            raise TimeoutError("capture thread levert geen frames")
+        return f
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._not_before = time.monotonic()
+
+    def valid(self, frame: Frame) -> bool:
+        return self._slot_seq[self._slot(frame.seq)] == frame.seq
+
+
+_THREAD: Optional[ThreadedCapture] = None
+# === END CAPTURE THREAD ===
+
+
+# === START API ===
+# • WAT: module-level shortcuts op de gedeelde capture service.
+# • WAAROM: flows hoeven geen eigen FrameCapture te beheren.
+def get_capture() -> FrameCapture:
+    return _DEFAULT_CAPTURE
+
+
+def capture_frame(max_age: Optional[float] = None) -> Frame:
+    return _DEFAULT_CAPTURE.get(max_age)
+
+
+def invalidate_frame() -> None:
+    _DEFAULT_CAPTURE.invalidate()
+
+
+def start_capture_thread(
+    fps: float = DEFAULT_CAPTURE_FPS,
+    ring: int = DEFAULT_RING_SIZE,
+    region: Optional[Tuple[int, int, int, int]] = None,
+) -> ThreadedCapture:
+    """
+    Start de gedeelde capture thread; capture_frame(), detect_image(frame=None),
+    FrameWaiter en detect_image_timeout lezen daarna uit de ring i.p.v. zelf te grabben.
+    """
+    global _DEFAULT_CAPTURE, _THREAD
+    stop_capture_thread()
+    _THREAD = ThreadedCapture(fps=fps, ring=ring, region=region).start()
+    _DEFAULT_CAPTURE = _THREAD
+    return _THREAD
+
+
+def stop_capture_thread() -> None:
+    global _DEFAULT_CAPTURE, _THREAD
+    if _THREAD is not None:
+        _THREAD.stop()
+        _THREAD = None
+        _DEFAULT_CAPTURE = FrameCapture()
+
+
+def running_capture() -> Optional[ThreadedCapture]:
+    """De gedeelde capture thread als die draait, anders None."""
+    t = _THREAD
+    return t if t is not None and t.running else None
+
+
+def live_frame() -> Optional[Frame]:
+    """Frame uit de draaiende capture thread als die de volledige desktop grabt, anders None (=> zelf grabben)."""
+    t = running_capture()
+    return t.get() if t is not None and t.region is None else None
+# === END API ===
+
+
+# === START CLI TEST ===
+# • WAT: veilige handmatige test.
+# • WAAROM: snel zien dat views geen kopie zijn.
+if __name__ == "__main__":
+    f1 = capture_frame()
+    f2 = capture_frame()
+    print(f"frame seq={f1.seq} shape={f1.rgb.shape} hergebruikt={f1 is f2}")
+
+    for bot in (1, 2, 3, 4):
+        v = f1.area("Info_Area", bot_id=bot)
+        print(f"bot {bot} Info_Area view={v.shape} zero_copy={np.shares_memory(v, f1.rgb)}")
+# === END CLI TEST ===
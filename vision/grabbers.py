@@ -0,0 +1,568 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: centraal en voorspelbaar; optionele backends (mss, X11) worden lazy geladen.
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+import ctypes
+import os
+import threading
+
+from core.lazy_import import lazy_module
+cv2 = lazy_module("cv2")
+np = lazy_module("numpy")
+
+from core import tracing
+# === END IMPORTS ===
+
+
+# === START CONSTANTS ===
+# • WAT: kleurvolgordes, env var voor backend keuze, replay extensies.
+# • WAAROM: backend is per host te kiezen zonder code-aanpassing.
+COLOR_RGB = "RGB"
+COLOR_BGR = "BGR"
+
+GRABBER_ENV = "BOT_GRABBER"
+
+IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".bmp"}
+VIDEO_EXTS = {".mp4", ".avi", ".mkv", ".mov"}
+
+Region = Tuple[int, int, int, int]  # (x, y, w, h) zoals pyautogui
+# === END CONSTANTS ===
+
+
+# === START BASE ===
+# • WAT: gemeenschappelijke grabber API.
+# • WAAROM: detectors/tools praten tegen één interface, backend is inwisselbaar.
+class Grabber:
+    """
+    grab(region=None, out=None) -> HxWx3 uint8 in self.color (RGB of BGR).
+
+    region=None  => volledige desktop
+    out          => voorgealloceerde buffer (h, w, 3) die gevuld wordt;
+                    zonder out wordt één nieuwe array gemaakt (geen PIL ertussen).
+    """
+
+    name = "base"
+
+    def __init__(self, color: str = COLOR_RGB):
+        if color not in (COLOR_RGB, COLOR_BGR):
+            raise ValueError(f"Ongeldige kleurvolgorde: {color}")
+        self.color = color
+        self._lock = threading.Lock()
+
+    def screen_size(self) -> Tuple[int, int]:
+        raise NotImplementedError
+
+    def grab(self, region: Optional[Region] = None, out: Optional[np.ndarray] = None) -> np.ndarray:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        self.close()
+
+    # --- helpers voor subclasses ---
+    def _full_region(self) -> Region:
+        w, h = self.screen_size()
+        return 0, 0, w, h
+
+    def _clip(self, region: Optional[Region]) -> Region:
+        sw, sh = self.screen_size()
+        if region is None:
+            return 0, 0, sw, sh
+        x, y, w, h = (int(v) for v in region)
+        x1, y1 = min(max(x, 0), sw), min(max(y, 0), sh)
+        x2, y2 = min(max(x + w, x1), sw), min(max(y + h, y1), sh)
+        return x1, y1, x2 - x1, y2 - y1
+
+    def _out(self, h: int, w: int, out: Optional[np.ndarray]) -> np.ndarray:
+        if out is None:
+            return np.empty((h, w, 3), dtype=np.uint8)
+        if out.shape != (h, w, 3) or out.dtype != np.uint8:
+            raise ValueError(f"out buffer moet ({h}, {w}, 3) uint8 zijn, kreeg {out.shape} {out.dtype}")
+        return out
+
+    def _from_bgra(self, bgra: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+        h, w = bgra.shape[:2]
+        dst = self._out(h, w, out)
+        code = cv2.COLOR_BGRA2RGB if self.color == COLOR_RGB else cv2.COLOR_BGRA2BGR
+        cv2.cvtColor(bgra, code, dst=dst)
+        return dst
+
+    def _from_rgb(self, rgb: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+        h, w = rgb.shape[:2]
+        dst = self._out(h, w, out)
+        if self.color == COLOR_RGB:
+            np.copyto(dst, rgb)
+        else:
+            cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR, dst=dst)
+        return dst
+# === END BASE ===
+
+
+# === START PYAUTOGUI BACKEND ===
+# • WAT: fallback via pyautogui (PIL).
+# • WAAROM: werkt overal (Windows/macOS/Linux), maar is de traagste route.
+class PyAutoGuiGrabber(Grabber):
+    name = "pyautogui"
+
+    def __init__(self, color: str = COLOR_RGB):
+        super().__init__(color)
+        import pyautogui
+        self._pyautogui = pyautogui
+
+    def screen_size(self) -> Tuple[int, int]:
+        w, h = self._pyautogui.size()
+        return int(w), int(h)
+
+    def grab(self, region: Optional[Region] = None, out: Optional[np.ndarray] = None) -> np.ndarray:
+        if region is None:
+            img = self._pyautogui.screenshot()
+        else:
+            img = self._pyautogui.screenshot(region=tuple(int(v) for v in region))
+        return self._from_rgb(np.asarray(img), out)
+# === END PYAUTOGUI BACKEND ===
+
+
+# === START MSS BACKEND ===
+# • WAT: backend via de optionele 'mss' package (raw BGRA bytes).
+# • WAAROM: snel en cross-platform, zonder PIL conversie.
+class MssGrabber(Grabber):
+    name = "mss"
+
+    def __init__(self, color: str = COLOR_RGB):
+        super().__init__(color)
+        import mss  # optioneel: pip install mss
+        self._sct = mss.mss()
+        mon = self._sct.monitors[0]  # alle monitoren samen
+        self._origin = (int(mon["left"]), int(mon["top"]))
+        self._size = (int(mon["width"]), int(mon["height"]))
+
+    def screen_size(self) -> Tuple[int, int]:
+        return self._size
+
+    def grab(self, region: Optional[Region] = None, out: Optional[np.ndarray] = None) -> np.ndarray:
+        x, y, w, h = self._clip(region)
+        ox, oy = self._origin
+        with self._lock:
+            shot = self._sct.grab({"left": x + ox, "top": y + oy, "width": w, "height": h})
+            bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+            return self._from_bgra(bgra, out)
+
+    def close(self) -> None:
+        self._sct.close()
+# === END MSS BACKEND ===
+
+
+# === START X11 SHM BACKEND ===
+# • WAT: directe X11 capture via MIT-SHM (XShmGetImage), met XGetImage als fallback.
+# • WAAROM: op onze Linux hosts de snelste route: X server schrijft direct in shared memory.
+class _XImage(ctypes.Structure):
+    _fields_ = [
+        ("width", ctypes.c_int),
+        ("height", ctypes.c_int),
+        ("xoffset", ctypes.c_int),
+        ("format", ctypes.c_int),
+        ("data", ctypes.c_void_p),
+        ("byte_order", ctypes.c_int),
+        ("bitmap_unit", ctypes.c_int),
+        ("bitmap_bit_order", ctypes.c_int),
+        ("bitmap_pad", ctypes.c_int),
+        ("depth", ctypes.c_int),
+        ("bytes_per_line", ctypes.c_int),
+        ("bits_per_pixel", ctypes.c_int),
+        ("red_mask", ctypes.c_ulong),
+        ("green_mask", ctypes.c_ulong),
+        ("blue_mask", ctypes.c_ulong),
+        ("obdata", ctypes.c_void_p),
+        ("funcs", ctypes.c_void_p * 6),
+    ]
+
+
+class _XShmSegmentInfo(ctypes.Structure):
+    _fields_ = [
+        ("shmseg", ctypes.c_ulong),
+        ("shmid", ctypes.c_int),
+        ("shmaddr", ctypes.c_void_p),
+        ("readOnly", ctypes.c_int),
+    ]
+
+
+_ZPIXMAP = 2
+_ALL_PLANES = ctypes.c_ulong(~0 & 0xFFFFFFFFFFFFFFFF)
+_IPC_PRIVATE = 0
+_IPC_CREAT = 0o1000
+_IPC_RMID = 0
+
+
+def _load_lib(name: str):
+    import ctypes.util  # pas bij de xshm backend (trekt subprocess + shutil mee)
+
+    path = ctypes.util.find_library(name)
+    if not path:
+        raise OSError(f"lib{name} niet gevonden")
+    return ctypes.CDLL(path)
+
+
+class XShmGrabber(Grabber):
+    name = "xshm"
+
+    def __init__(self, color: str = COLOR_RGB, display: Optional[str] = None):
+        super().__init__(color)
+        if not sys.platform.startswith("linux"):
+            raise OSError("XShmGrabber werkt alleen op Linux/X11")
+
+        self._x = _load_lib("X11")
+        self._libc = _load_lib("c")
+        self._setup_prototypes()
+
+        disp_name = display or os.getenv("DISPLAY")
+        self._dpy = self._x.XOpenDisplay(disp_name.encode() if disp_name else None)
+        if not self._dpy:
+            raise OSError(f"Kan X display niet openen: {disp_name!r}")
+
+        screen = self._x.XDefaultScreen(self._dpy)
+        self._root = self._x.XDefaultRootWindow(self._dpy)
+        self._visual = self._x.XDefaultVisual(self._dpy, screen)
+        self._depth = self._x.XDefaultDepth(self._dpy, screen)
+        self._size = (int(self._x.XDisplayWidth(self._dpy, screen)), int(self._x.XDisplayHeight(self._dpy, screen)))
+
+        # per (w, h) één shm image; regions in een polling loop zijn vrijwel altijd gelijk
+        self._shm_images: Dict[Tuple[int, int], tuple] = {}
+        self._xext = None
+        try:
+            self._xext = _load_lib("Xext")
+            self._setup_shm_prototypes()
+            if not self._xext.XShmQueryExtension(self._dpy):
+                self._xext = None
+        except OSError:
+            self._xext = None
+
+    @property
+    def uses_shm(self) -> bool:
+        return self._xext is not None
+
+    def _setup_prototypes(self) -> None:
+        x, c = self._x, self._libc
+        x.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x.XOpenDisplay.restype = ctypes.c_void_p
+        x.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        x.XDefaultScreen.argtypes = [ctypes.c_void_p]
+        x.XDefaultScreen.restype = ctypes.c_int
+        x.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+        x.XDefaultRootWindow.restype = ctypes.c_ulong
+        x.XDefaultVisual.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x.XDefaultVisual.restype = ctypes.c_void_p
+        x.XDefaultDepth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x.XDefaultDepth.restype = ctypes.c_int
+        x.XDisplayWidth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x.XDisplayHeight.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x.XGetImage.argtypes = [
+            ctypes.c_void_p, ctypes.c_ulong, ctypes.c_int, ctypes.c_int,
+            ctypes.c_uint, ctypes.c_uint, ctypes.c_ulong, ctypes.c_int,
+        ]
+        x.XGetImage.restype = ctypes.POINTER(_XImage)
+        x.XDestroyImage.argtypes = [ctypes.POINTER(_XImage)]
+        x.XSync.argtypes = [ctypes.c_void_p, ctypes.c_int]
+
+        c.shmget.argtypes = [ctypes.c_int, ctypes.c_size_t, ctypes.c_int]
+        c.shmget.restype = ctypes.c_int
+        c.shmat.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_int]
+        c.shmat.restype = ctypes.c_void_p
+        c.shmdt.argtypes = [ctypes.c_void_p]
+        c.shmctl.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p]
+
+    def _setup_shm_prototypes(self) -> None:
+        e = self._xext
+        e.XShmQueryExtension.argtypes = [ctypes.c_void_p]
+        e.XShmQueryExtension.restype = ctypes.c_int
+        e.XShmCreateImage.argtypes = [
+            ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int,
+            ctypes.c_void_p, ctypes.POINTER(_XShmSegmentInfo), ctypes.c_uint, ctypes.c_uint,
+        ]
+        e.XShmCreateImage.restype = ctypes.POINTER(_XImage)
+        e.XShmAttach.argtypes = [ctypes.c_void_p, ctypes.POINTER(_XShmSegmentInfo)]
+        e.XShmDetach.argtypes = [ctypes.c_void_p, ctypes.POINTER(_XShmSegmentInfo)]
+        e.XShmGetImage.argtypes = [
+            ctypes.c_void_p, ctypes.c_ulong, ctypes.POINTER(_XImage),
+            ctypes.c_int, ctypes.c_int, ctypes.c_ulong,
+        ]
+        e.XShmGetImage.restype = ctypes.c_int
+
+    def screen_size(self) -> Tuple[int, int]:
+        return self._size
+
+    def _shm_image(self, w: int, h: int):
+        key = (w, h)
+        if key in self._shm_images:
+            return self._shm_images[key]
+
+        info = _XShmSegmentInfo()
+        img = self._xext.XShmCreateImage(self._dpy, self._visual, self._depth, _ZPIXMAP, None, ctypes.byref(info), w, h)
+        if not img:
+            raise OSError("XShmCreateImage faalde")
+
+        size = img.contents.bytes_per_line * img.contents.height
+        info.shmid = self._libc.shmget(_IPC_PRIVATE, size, _IPC_CREAT | 0o600)
+        if info.shmid < 0:
+            self._x.XDestroyImage(img)
+            raise OSError("shmget faalde")
+
+        addr = self._libc.shmat(info.shmid, None, 0)
+        if addr in (None, ctypes.c_void_p(-1).value):
+            self._libc.shmctl(info.shmid, _IPC_RMID, None)
+            self._x.XDestroyImage(img)
+            raise OSError("shmat faalde")
+
+        info.shmaddr = addr
+        info.readOnly = 0
+        img.contents.data = addr
+        self._xext.XShmAttach(self._dpy, ctypes.byref(info))
+        self._x.XSync(self._dpy, 0)
+        # segment wordt opgeruimd zodra beide kanten detachen (ook bij crash)
+        self._libc.shmctl(info.shmid, _IPC_RMID, None)
+
+        self._shm_images[key] = (img, info)
+        return img, info
+
+    @staticmethod
+    def _as_bgra(img, w: int, h: int) -> np.ndarray:
+        im = img.contents
+        if im.bits_per_pixel != 32:
+            raise OSError(f"Alleen 32bpp X visuals worden ondersteund (kreeg {im.bits_per_pixel})")
+        buf = (ctypes.c_ubyte * (im.bytes_per_line * h)).from_address(im.data)
+        rows = np.frombuffer(buf, dtype=np.uint8).reshape(h, im.bytes_per_line)
+        return rows[:, : w * 4].reshape(h, w, 4)
+
+    def grab(self, region: Optional[Region] = None, out: Optional[np.ndarray] = None) -> np.ndarray:
+        x, y, w, h = self._clip(region)
+        with self._lock:
+            if self._xext is not None:
+                img, _ = self._shm_image(w, h)
+                if not self._xext.XShmGetImage(self._dpy, self._root, img, x, y, _ALL_PLANES):
+                    raise OSError("XShmGetImage faalde")
+                return self._from_bgra(self._as_bgra(img, w, h), out)
+
+            img = self._x.XGetImage(self._dpy, self._root, x, y, w, h, _ALL_PLANES, _ZPIXMAP)
+            if not img:
+                raise OSError("XGetImage faalde")
+            try:
+                return self._from_bgra(self._as_bgra(img, w, h), out)
+            finally:
+                self._x.XDestroyImage(img)
+
+    def close(self) -> None:
+        with self._lock:
+            for img, info in self._shm_images.values():
+                self._xext.XShmDetach(self._dpy, ctypes.byref(info))
+                self._x.XDestroyImage(img)  # shm image: data wordt hier niet gefreed, dat doet shmdt
+                self._libc.shmdt(info.shmaddr)
+            self._shm_images.clear()
+            if self._dpy:
+                self._x.XCloseDisplay(self._dpy)
+                self._dpy = None
+# === END X11 SHM BACKEND ===
+
+
+# === START REPLAY BACKEND ===
+# • WAT: speelt opgenomen screenshots/video af als "scherm".
+# • WAAROM: detectors en flows testen zonder live game venster of display.
+class ReplayGrabber(Grabber):
+    """
+    source: map met screenshots, lijst met paden, losse afbeelding, video of lijst met RGB arrays.
+    Elke grab() schuift één frame op; loop=True begint daarna weer vooraan.
+    """
+
+    name = "replay"
+
+    def __init__(
+        self,
+        source: Union[str, Path, Sequence[Union[str, Path]], Sequence[np.ndarray]],
+        color: str = COLOR_RGB,
+        loop: bool = True,
+    ):
+        super().__init__(color)
+        self.loop = bool(loop)
+        self._frames: List[np.ndarray] = self._load(source)
+        if not self._frames:
+            raise FileNotFoundError(f"Geen replay frames gevonden in: {source}")
+        self._idx = 0
+        h, w = self._frames[0].shape[:2]
+        self._size = (int(w), int(h))
+
+    @staticmethod
+    def _read_rgb(path: Path) -> np.ndarray:
+        bgr = cv2.imread(str(path), cv2.IMREAD_COLOR)
+        if bgr is None:
+            raise FileNotFoundError(f"Replay frame niet leesbaar: {path}")
+        return cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+
+    @classmethod
+    def _read_video(cls, path: Path) -> List[np.ndarray]:
+        cap = cv2.VideoCapture(str(path))
+        frames: List[np.ndarray] = []
+        try:
+            while True:
+                ok, bgr = cap.read()
+                if not ok:
+                    break
+                frames.append(cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB))
+        finally:
+            cap.release()
+        return frames
+
+    @classmethod
+    def _load(cls, source) -> List[np.ndarray]:
+        if isinstance(source, np.ndarray):
+            return [source]
+        if isinstance(source, (str, Path)):
+            p = Path(source)
+            if p.is_dir():
+                paths = sorted(q for q in p.iterdir() if q.suffix.lower() in IMAGE_EXTS)
+                return [cls._read_rgb(q) for q in paths]
+            if p.suffix.lower() in VIDEO_EXTS:
+                return cls._read_video(p)
+            return [cls._read_rgb(p)]
+
+        frames: List[np.ndarray] = []
+        for item in source:
+            if isinstance(item, np.ndarray):
+                frames.append(item)
+            else:
+                frames.extend(cls._load(item))
+        return frames
+
+    @property
+    def frame_count(self) -> int:
+        return len(self._frames)
+
+    @property
+    def position(self) -> int:
+        return self._idx
+
+    def seek(self, idx: int) -> None:
+        self._idx = max(0, min(int(idx), len(self._frames) - 1))
+
+    def screen_size(self) -> Tuple[int, int]:
+        return self._size
+
+    def grab(self, region: Optional[Region] = None, out: Optional[np.ndarray] = None) -> np.ndarray:
+        with self._lock:
+            frame = self._frames[self._idx]
+            if self._idx + 1 < len(self._frames):
+                self._idx += 1
+            elif self.loop:
+                self._idx = 0
+
+        x, y, w, h = self._clip(region)
+        return self._from_rgb(frame[y:y + h, x:x + w], out)
+# === END REPLAY BACKEND ===
+
+
+# === START REGISTRY ===
+# • WAT: backend registry + proces-brede actieve grabber.
+# • WAAROM: één regel (env var of set_grabber) bepaalt hoe het hele project screenshot.
+BACKENDS: Dict[str, Callable[..., Grabber]] = {
+    "xshm": XShmGrabber,
+    "mss": MssGrabber,
+    "pyautogui": PyAutoGuiGrabber,
+}
+
+# volgorde voor "auto": snelste eerst, pyautogui altijd als laatste redmiddel
+AUTO_ORDER = ("xshm", "mss", "pyautogui")
+
+_ACTIVE: Optional[Grabber] = None
+_ACTIVE_LOCK = threading.Lock()
+
+
+def create_grabber(name: str = "auto", color: str = COLOR_RGB) -> Grabber:
+    name = (name or "auto").strip().lower()
+    if name != "auto":
+        if name not in BACKENDS:
+            raise KeyError(f"Onbekende grabber backend: {name} (kies uit {', '.join(BACKENDS)})")
+        return BACKENDS[name](color=color)
+
+    errors = []
+    for candidate in AUTO_ORDER:
+        try:
+            return BACKENDS[candidate](color=color)
+        except Exception as e:
+            errors.append(f"{candidate}: {type(e).__name__}: {e}")
+    raise RuntimeError("Geen enkele grabber backend beschikbaar:\n  " + "\n  ".join(errors))
+
+
+def available_backends() -> List[str]:
+    out = []
+    for name in BACKENDS:
+        try:
+            g = BACKENDS[name]()
+        except Exception:
+            continue
+        g.close()
+        out.append(name)
+    return out
+
+
+def get_grabber() -> Grabber:
+    global _ACTIVE
+    with _ACTIVE_LOCK:
+        if _ACTIVE is None:
+            _ACTIVE = create_grabber(os.getenv(GRABBER_ENV, "auto"))
+        return _ACTIVE
+
+
+def set_grabber(grabber: Optional[Grabber]) -> Optional[Grabber]:
+    """Zet de actieve grabber (bv. ReplayGrabber in tests). Returns de vorige."""
+    global _ACTIVE
+    with _ACTIVE_LOCK:
+        prev, _ACTIVE = _ACTIVE, grabber
+        return prev
+# === END REGISTRY ===
+
+
+# === START API ===
+# • WAT: convenience grabs in RGB voor bestaande callers.
+# • WAAROM: vervangt np.array(pyautogui.screenshot(...)) één-op-één.
+def grab_rgb(region: Optional[Region] = None, out: Optional[np.ndarray] = None) -> np.ndarray:
+    g = get_grabber()
+    with tracing.span(tracing.STAGE_GRAB):
+        img = g.grab(region, out)
+    if g.color == COLOR_BGR:
+        with tracing.span(tracing.STAGE_CONVERT):
+            # met out: in dezelfde buffer omzetten (ring slots van de capture thread blijven RGB)
+            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=out) if out is not None else cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    return img
+
+
+def grab_box_rgb(box_xyxy: Sequence[int]) -> np.ndarray:
+    x1, y1, x2, y2 = (int(v) for v in box_xyxy)
+    return grab_rgb((x1, y1, x2 - x1, y2 - y1))
+# === END API ===
+
+
+# === START CLI TEST ===
+# • WAT: toont welke backends op deze host werken.
+# • WAAROM: snelle check vóór je tools/bench_grabbers.py draait.
+if __name__ == "__main__":
+    print("🔎 beschikbare grabbers:", available_backends())
+    g = get_grabber()
+    img = g.grab((0, 0, 200, 100))
+    print(f"🟢 actief={g.name} shape={img.shape} color={g.color}")
+# === END CLI TEST ===
@@ -16,32 +16,42 @@ if str(ROOT) not in sys.path:
 # • WAT: alle externe/standaard imports die deze module nodig heeft.
 # • WAAROM: centraal en voorspelbaar, voorkomt verborgen dependencies.
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 import time
 
-import cv2
-import numpy as np
-import pyautogui
-
-from core.paths import IMAGES_DIR, CONFIG_DIR
-from core.bot_offsets import load_areas, apply_offset
+from core.lazy_import import lazy_module
+cv2 = lazy_module("cv2")
+np = lazy_module("numpy")
+
+from core import tracing
+from core.area_registry import area_box
+from vision.compiled_template import CompiledTemplate, TemplateCache, get_compiled_template
+from vision.frame_capture import Frame, FrameCapture, live_frame
+from vision.grabbers import grab_rgb
+from vision.match_all import ALL_METHODS, MODE_DERIVED, match_all_methods
+from vision import roi_tracker
+from vision.roi_tracker import RoiEntry, get_roi_tracker
+from vision.vision_pool import active_pool, area_frame
+from vision.template_meta import (
+    DEFAULT_PYRAMID_CANDIDATES,
+    META_FILE,
+    TemplateSettings,
+    get_template_settings,
+)
+from vision.wait_for import MIN_POLL_SEC, Backoff, FrameWaiter
 # === END IMPORTS ===
 
 
 # === START CONSTANTS ===
-# • WAT: template matching method mapping + template meta/config + cache.
+# • WAT: template matching method mapping + template meta/config.
 # • WAAROM: voorkomt magic values en maakt gedrag configureerbaar.
-METHODS: Dict[str, int] = {
-    "TM_CCOEFF": cv2.TM_CCOEFF,
-    "TM_CCOEFF_NORMED": cv2.TM_CCOEFF_NORMED,
-    "TM_CCORR": cv2.TM_CCORR,
-    "TM_CCORR_NORMED": cv2.TM_CCORR_NORMED,
-    "TM_SQDIFF": cv2.TM_SQDIFF,
-    "TM_SQDIFF_NORMED": cv2.TM_SQDIFF_NORMED,
-}
-
-META_FILE = Path(CONFIG_DIR) / "templates_meta.json"
-_TEMPLATE_CACHE: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+METHODS: Tuple[str, ...] = ALL_METHODS  # namen; cv2.TM_* pas bij gebruik via getattr(cv2, naam)
+
+# coarse-to-fine: zoek eerst op 1/2**levels schaal, verfijn daarna rond de top kandidaten
+MIN_PYRAMID_TEMPLATE_PX = 6
+
+# "ALL": 1x TM_CCORR + integral images i.p.v. 6 losse matchTemplate passes (zie vision.match_all)
+ALL_ENGINE_MODE = MODE_DERIVED
 
 VERBOSE_OFF = "off"
 VERBOSE_SHORT = "short"
@@ -65,53 +75,27 @@ class Match:
 
 
 # === START SETTINGS ===
-# • WAT: lezen van template meta instellingen (method/drempels).
-# • WAAROM: defaults per template zonder code-aanpassingen.
-def _safe_read_json(path: Path) -> dict:
-    if not path.exists():
-        return {}
-    try:
-        import json
-        return json.loads(path.read_text(encoding="utf-8-sig"))
-    except Exception:
-        return {}
-
-
-def _load_template_settings(image_name: str) -> dict:
-    meta = _safe_read_json(META_FILE)
-    d = meta.get(image_name, {})
-    return {
-        "method": d.get("method", "TM_CCOEFF"),
-        "min_shape": float(d.get("min_shape", 85)),
-        "min_color": float(d.get("min_color", 60)),
-    }
+# • WAT: template meta instellingen (method/drempels/pyramid) via de gedeelde registry.
+# • WAAROM: geen json parse per call; registry checkt mtime hooguit 1x per interval.
+def _load_template_settings(image_name: str) -> TemplateSettings:
+    return get_template_settings(image_name)
 # === END SETTINGS ===
 
 
 # === START TEMPLATE CACHE ===
-# • WAT: resolve + cached inlezen van templates (bgr/rgb/gray).
-# • WAAROM: sneller herhaald detecteren en minder disk IO.
+# • WAT: resolve + cached inlezen van templates via de CompiledTemplate LRU.
+# • WAAROM: sneller herhaald detecteren, minder disk IO en geen template statistiek per match.
 def _resolve_template_path(image_name: str) -> Path:
-    p = Path(image_name)
-    return p if p.is_absolute() else Path(IMAGES_DIR) / image_name
-
-
-def _read_template(image_name: str):
-    path = _resolve_template_path(image_name)
-    key = str(path.resolve())
+    return TemplateCache.resolve(image_name)
 
-    if key in _TEMPLATE_CACHE:
-        return _TEMPLATE_CACHE[key]
 
-    bgr = cv2.imread(str(path))
-    if bgr is None:
-        raise FileNotFoundError(f"Template niet gevonden: {path}")
+def _compiled(image_name: str) -> CompiledTemplate:
+    return get_compiled_template(image_name)
 
-    rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
-    gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
 
-    _TEMPLATE_CACHE[key] = (bgr, rgb, gray)
-    return bgr, rgb, gray
+def _read_template(image_name: str):
+    tpl = get_compiled_template(image_name)
+    return tpl.bgr, tpl.rgb, tpl.gray
 # === END TEMPLATE CACHE ===
 
 
@@ -137,7 +121,101 @@ def _color_score(template_rgb: np.ndarray, patch_rgb: np.ndarray) -> float:
 # • WAT: low-level helpers voor 1 detectie-run binnen één screenshot.
 # • WAAROM: hergebruik tussen detect_image en detect_image_timeout, zonder duplicatie.
 def _grab_area_rgb(x1: int, y1: int, w: int, h: int) -> np.ndarray:
-    return np.array(pyautogui.screenshot(region=(x1, y1, w, h)))
+    return grab_rgb((x1, y1, w, h))
+
+
+def _locate_in_result(res: np.ndarray, mname: str) -> Tuple[Tuple[int, int], float]:
+    """
+    Zelfde (loc, score) als minMaxLoc(_scoremap_0_1(res)), zonder de genormaliseerde kopie:
+    min-max normalisatie is monotoon, dus de piek ligt op dezelfde plek en scoort 1.0
+    (een vlakke map normaliseert naar 0, bij SQDIFF dus 1 - 0).
+    """
+    lo, hi, min_loc, max_loc = cv2.minMaxLoc(res)
+    sqdiff = mname.startswith("TM_SQDIFF")
+    loc = min_loc if sqdiff else max_loc
+    score = 1.0 if (hi > lo or sqdiff) else 0.0
+    return (int(loc[0]), int(loc[1])), score
+
+
+def _exhaustive_locate(gray: np.ndarray, tpl_gray: np.ndarray, mname: str) -> Tuple[Tuple[int, int], float]:
+    return _locate_in_result(cv2.matchTemplate(gray, tpl_gray, getattr(cv2, mname)), mname)
+
+
+def _pyramid_locate(
+    gray: np.ndarray,
+    tpl_gray: np.ndarray,
+    mname: str,
+    levels: int,
+    candidates: int,
+    small_tpl: Optional[np.ndarray] = None,
+) -> Optional[Tuple[Tuple[int, int], float]]:
+    """
+    Coarse-to-fine: matchTemplate op verkleinde schaal, daarna full-res alleen
+    in kleine vensters rond de top kandidaten. Score = min-max over de verfijnde
+    vensters, net als _scoremap_0_1 over de hele area.
+
+    small_tpl: optioneel al verkleind template (CompiledTemplate.pyramid), anders hier berekend.
+
+    Returns None als het template op lage schaal te klein wordt (=> exhaustive).
+    """
+    scale = 2 ** int(levels)
+    th, tw = tpl_gray.shape[:2]
+    H, W = gray.shape[:2]
+    if th // scale < MIN_PYRAMID_TEMPLATE_PX or tw // scale < MIN_PYRAMID_TEMPLATE_PX:
+        return None
+
+    small = gray
+    for _ in range(int(levels)):
+        small = cv2.pyrDown(small)
+    if small_tpl is None:
+        small_tpl = tpl_gray
+        for _ in range(int(levels)):
+            small_tpl = cv2.pyrDown(small_tpl)
+
+    if small.shape[0] < small_tpl.shape[0] or small.shape[1] < small_tpl.shape[1]:
+        return None
+
+    sign = -1.0 if mname.startswith("TM_SQDIFF") else 1.0
+    mval = getattr(cv2, mname)
+
+    coarse = cv2.matchTemplate(small, small_tpl, mval)
+    if sign < 0:
+        coarse = -coarse
+
+    # top-k kandidaten met simpele onderdrukking rond elke gekozen piek
+    sth, stw = small_tpl.shape[:2]
+    peaks: List[Tuple[int, int]] = []
+    for _ in range(max(1, int(candidates))):
+        _, _, _, (cx, cy) = cv2.minMaxLoc(coarse)
+        peaks.append((cx, cy))
+        coarse[max(0, cy - sth // 2):cy + sth // 2 + 1, max(0, cx - stw // 2):cx + stw // 2 + 1] = -np.inf
+
+    pad = 2 * scale
+    best_loc: Optional[Tuple[int, int]] = None
+    best, lo = -np.inf, np.inf
+    for cx, cy in peaks:
+        x0 = max(0, cx * scale - pad)
+        y0 = max(0, cy * scale - pad)
+        x1 = min(W, cx * scale + pad + tw)
+        y1 = min(H, cy * scale + pad + th)
+        if x1 - x0 < tw or y1 - y0 < th:
+            continue
+
+        res = cv2.matchTemplate(gray[y0:y1, x0:x1], tpl_gray, mval)
+        if sign < 0:
+            res = -res
+        rmin, rmax, _, (rx, ry) = cv2.minMaxLoc(res)
+        lo = min(lo, rmin)
+        if rmax > best:
+            best = rmax
+            best_loc = (x0 + rx, y0 + ry)
+
+    if best_loc is None:
+        return None
+
+    # min-max over de verfijnde vensters: de beste piek is daar per definitie het maximum
+    score = 1.0 if best > lo else 0.0
+    return best_loc, score
 
 
 def _best_match_in_shot(
@@ -145,23 +223,49 @@ def _best_match_in_shot(
     tpl_rgb: np.ndarray,
     tpl_gray: np.ndarray,
     method_name: str,
+    shot_gray: Optional[np.ndarray] = None,
+    pyramid: Tuple[int, int] = (0, DEFAULT_PYRAMID_CANDIDATES),
+    compiled: Optional[CompiledTemplate] = None,
 ) -> Tuple[Optional[Tuple[int, int]], float, float, str]:
     """
+    shot_gray: optioneel al geconverteerde gray versie van shot_rgb (batch matching).
+    pyramid:   (levels, candidates); levels=0 => exhaustive matchTemplate.
+    compiled:  CompiledTemplate van tpl_rgb/tpl_gray => gecachete stats/pyramid + kleur zonder allocaties.
+
     Returns:
       (loc_xy, vorm_score_0_100, kleur_score_0_100, method_used)
     """
-    gray = cv2.cvtColor(shot_rgb, cv2.COLOR_RGB2GRAY)
+    if shot_gray is not None:
+        gray = shot_gray
+    else:
+        with tracing.span(tracing.STAGE_CONVERT):
+            gray = cv2.cvtColor(shot_rgb, cv2.COLOR_RGB2GRAY)
     th, tw = tpl_gray.shape[:2]
 
     candidates: List[Tuple[Optional[Tuple[int, int]], float, float, str]] = []
 
-    for mname, mval in METHODS.items():
+    levels, n_candidates = pyramid
+
+    # "ALL" zonder pyramid: alle 6 maps in 1 keer uit de gedeelde engine
+    all_maps = None
+    if method_name == "ALL" and levels <= 0:
+        stats = compiled.stats if compiled is not None else None
+        with tracing.span(tracing.STAGE_MATCH):
+            all_maps = match_all_methods(gray, tpl_gray, mode=ALL_ENGINE_MODE, tpl_stats=stats)
+
+    for mname in METHODS:
         if method_name != "ALL" and mname != method_name:
             continue
 
-        res = cv2.matchTemplate(gray, tpl_gray, mval)
-        scoremap = _scoremap_0_1(res, mname)
-        _, score, _, loc = cv2.minMaxLoc(scoremap)
+        with tracing.span(tracing.STAGE_MATCH):
+            if all_maps is not None:
+                located = _locate_in_result(all_maps[mname], mname)
+            elif levels > 0:
+                small_tpl = compiled.pyramid(levels) if compiled is not None else None
+                located = _pyramid_locate(gray, tpl_gray, mname, levels, n_candidates, small_tpl)
+            else:
+                located = None
+            loc, score = located if located is not None else _exhaustive_locate(gray, tpl_gray, mname)
 
         vorm = float(score * 100)
         rx, ry = map(int, loc)
@@ -172,7 +276,8 @@ def _best_match_in_shot(
             candidates.append((None, vorm, 0.0, mname))
             continue
 
-        kleur = _color_score(tpl_rgb, patch)
+        with tracing.span(tracing.STAGE_SCORE):
+            kleur = compiled.color_score(patch) if compiled is not None else _color_score(tpl_rgb, patch)
         candidates.append(((rx, ry), vorm, float(kleur), mname))
 
     if not candidates:
@@ -181,6 +286,55 @@ def _best_match_in_shot(
     # kies hoogste vormscore als "beste" (zelfde als je huidige detect_image selectie)
     best = max(candidates, key=lambda t: t[1])
     return best[0], round(best[1], 2), round(best[2], 2), best[3]
+
+
+def _tracked_match(
+    key: Tuple[str, str, int],
+    shot_rgb: np.ndarray,
+    origin: Tuple[int, int],
+    tpl: CompiledTemplate,
+    method_name: str,
+    min_shape: float,
+    min_color: float,
+    shot_gray: Optional[np.ndarray] = None,
+    pyramid: Tuple[int, int] = (0, DEFAULT_PYRAMID_CANDIDATES),
+) -> Tuple[Optional[Match], float, float, str]:
+    """
+    Eerst een klein venster rond de vorige hit (vision.roi_tracker), pas bij een
+    mislukte/zwakkere match de volledige shot. origin = schermpositie van shot[0, 0].
+
+    Returns:
+      (Match of None, vorm, kleur, method_used) van de laatst uitgevoerde match
+    """
+    ox, oy = origin
+    th, tw = tpl.height, tpl.width
+    tracker = get_roi_tracker()
+    entry = tracker.get(key) if roi_tracker.ROI_TRACKING else None
+
+    if entry is not None:
+        H, W = shot_rgb.shape[:2]
+        x1, y1, x2, y2 = entry.window(tracker.pad)
+        x1, y1 = max(0, x1 - ox), max(0, y1 - oy)
+        x2, y2 = min(W, x2 - ox), min(H, y2 - oy)
+        if x2 - x1 >= tw and y2 - y1 >= th:
+            gray = shot_gray[y1:y2, x1:x2] if shot_gray is not None else None
+            loc, vorm, kleur, used = _best_match_in_shot(
+                shot_rgb[y1:y2, x1:x2], tpl.rgb, tpl.gray, method_name, gray, compiled=tpl
+            )
+            if loc is not None and vorm >= min_shape and kleur >= min_color and tracker.accepts(entry, kleur):
+                hit = Match(ox + x1 + loc[0], oy + y1 + loc[1], tw, th, vorm, kleur, used)
+                tracker.hit(key, RoiEntry(hit.x, hit.y, tw, th, kleur))
+                return hit, vorm, kleur, used
+        tracker.miss()
+
+    loc, vorm, kleur, used = _best_match_in_shot(shot_rgb, tpl.rgb, tpl.gray, method_name, shot_gray, pyramid, tpl)
+    hit: Optional[Match] = None
+    if loc is not None and vorm >= min_shape and kleur >= min_color:
+        hit = Match(ox + loc[0], oy + loc[1], tw, th, vorm, kleur, used)
+
+    if roi_tracker.ROI_TRACKING:
+        tracker.full_scan(key, RoiEntry(hit.x, hit.y, tw, th, kleur) if hit is not None else None)
+    return hit, vorm, kleur, used
 # === END HELPERS ===
 
 
@@ -213,17 +367,19 @@ def _resolve_detection_params(
     method_name: Optional[str],
     vorm_drempel: Optional[float],
     kleur_drempel: Optional[float],
-) -> Tuple[str, float, float]:
+) -> Tuple[str, float, float, Tuple[int, int]]:
+    """Returns (method, min_shape, min_color, (pyramid_levels, pyramid_candidates))."""
     cfg = _load_template_settings(image_name)
 
-    method = method_name or cfg["method"]
-    min_shape = float(vorm_drempel if vorm_drempel is not None else cfg["min_shape"])
-    min_color = float(kleur_drempel if kleur_drempel is not None else cfg["min_color"])
+    method = method_name or cfg.method
+    min_shape = float(vorm_drempel if vorm_drempel is not None else cfg.min_shape)
+    min_color = float(kleur_drempel if kleur_drempel is not None else cfg.min_color)
 
     if method != "ALL" and method not in METHODS:
         raise KeyError(f"Ongeldige methode: {method}")
 
-    return method, min_shape, min_color
+    pyramid = (max(0, cfg.pyramid_levels), max(1, cfg.pyramid_candidates))
+    return method, min_shape, min_color, pyramid
 # === END CORE LOGIC ===
 
 
@@ -236,37 +392,143 @@ def detect_image(
     bot_id: int = 1,
     areas: Optional[Dict[str, List[int]]] = None,
     verbose: str = "short",
+    frame: Optional[Frame] = None,
 ) -> Optional[Match]:
+    """
+    frame=None  => frame uit de capture thread als die draait, anders eigen screenshot van de area
+    frame=Frame => zero-copy view uit een gedeeld desktop-frame (zie vision.frame_capture)
+    """
 
-    method, min_shape, min_color = _resolve_detection_params(
+    method, min_shape, min_color, pyramid = _resolve_detection_params(
         image_name=image_name,
         method_name=None,
         vorm_drempel=None,
         kleur_drempel=None,
     )
 
-    areas = areas or load_areas()
-    if area_name not in areas:
-        raise KeyError(f"Area niet gevonden: {area_name}")
-
-    _, tpl_rgb, tpl_gray = _read_template(image_name)
-    th, tw = tpl_gray.shape[:2]
-
-    x1, y1, x2, y2 = map(int, apply_offset(areas[area_name], bot_id))
+    x1, y1, x2, y2 = area_box(area_name, bot_id, areas or None)
     w, h = x2 - x1, y2 - y1
 
-    shot = _grab_area_rgb(x1, y1, w, h)
-    loc, vorm, kleur, used_method = _best_match_in_shot(shot, tpl_rgb, tpl_gray, method)
-
-    best: Optional[Match] = None
-    if loc is not None and vorm >= min_shape and kleur >= min_color:
-        rx, ry = loc
-        best = Match(x1 + rx, y1 + ry, tw, th, vorm, kleur, used_method)
+    tpl = _compiled(image_name)
+
+    if frame is None:
+        frame = live_frame()
+
+    with tracing.trace_context(image_name, area_name, bot_id):
+        if frame is not None:
+            shot = frame.view((x1, y1, x2, y2))
+            origin = frame.view_origin((x1, y1, x2, y2))  # geclipt zoals Frame.view
+        else:
+            shot = _grab_area_rgb(x1, y1, w, h)
+            origin = (x1, y1)
+        pool = active_pool()
+        if pool is not None:
+            # alleen de area-pixels naar de worker
+            sub = area_frame(shot, origin, frame)
+            best = pool.run("detect_image", sub, bot_id, image_name=image_name, area_name=area_name, areas=areas)
+        else:
+            best, _, _, _ = _tracked_match(
+                (image_name, area_name, bot_id), shot, origin, tpl, method, min_shape, min_color, pyramid=pyramid
+            )
 
     _log(image_name, bool(best), area_name, bot_id, best, verbose)
     return best
 
 
+def detect_many(
+    templates: Union[Sequence[str], Dict[str, str]],
+    area_name: Optional[str] = None,
+    bot_id: int = 1,
+    areas: Optional[Dict[str, List[int]]] = None,
+    verbose: str = "off",
+    frame: Optional[Frame] = None,
+) -> Dict[str, Optional[Match]]:
+    """
+    Batch-variant van detect_image: 1 grab + 1 gray conversie voor alle templates.
+
+    templates:
+      - lijst met namen  => allemaal in area_name
+      - dict naam->area  => per template een eigen area (None/"" = area_name)
+
+    Returns:
+      {template_naam: Match of None}
+    """
+    if isinstance(templates, dict):
+        wanted = {name: (a or area_name) for name, a in templates.items()}
+    else:
+        wanted = {name: area_name for name in templates}
+
+    if not wanted:
+        return {}
+
+    # groepeer per area zodat elke area maar 1x gesneden wordt
+    groups: Dict[str, List[str]] = {}
+    for name, a in wanted.items():
+        if not a:
+            raise KeyError(f"Area niet gevonden: {a}")
+        groups.setdefault(a, []).append(name)
+
+    boxes = {a: area_box(a, bot_id, areas or None) for a in groups}
+
+    # 1 grab over de omhullende van alle areas
+    ux1 = min(b[0] for b in boxes.values())
+    uy1 = min(b[1] for b in boxes.values())
+    ux2 = max(b[2] for b in boxes.values())
+    uy2 = max(b[3] for b in boxes.values())
+
+    if frame is None:
+        frame = live_frame()
+
+    with tracing.trace_context(bot=bot_id):
+        if frame is None:
+            union_rgb = grab_rgb((ux1, uy1, ux2 - ux1, uy2 - uy1))
+            origin = (ux1, uy1)
+        else:
+            union_rgb = frame.view((ux1, uy1, ux2, uy2))
+            origin = frame.view_origin((ux1, uy1, ux2, uy2))
+
+        pool = active_pool()
+        if pool is not None:
+            out = pool.run("detect_many", area_frame(union_rgb, origin, frame), bot_id, templates=wanted, areas=areas)
+            for name, hit in out.items():
+                _log(name, bool(hit), wanted[name], bot_id, hit, verbose)
+            return out
+
+        with tracing.span(tracing.STAGE_CONVERT):
+            union_gray = cv2.cvtColor(union_rgb, cv2.COLOR_RGB2GRAY)
+
+    out: Dict[str, Optional[Match]] = {}
+    for a, names in groups.items():
+        x1, y1, x2, y2 = boxes[a]
+        sx1, sy1 = max(x1 - origin[0], 0), max(y1 - origin[1], 0)
+        sx2, sy2 = max(x2 - origin[0], sx1), max(y2 - origin[1], sy1)
+        shot = union_rgb[sy1:sy2, sx1:sx2]
+        gray = union_gray[sy1:sy2, sx1:sx2]
+        ax, ay = origin[0] + sx1, origin[1] + sy1
+
+        for name in names:
+            method, min_shape, min_color, pyramid = _resolve_detection_params(
+                image_name=name,
+                method_name=None,
+                vorm_drempel=None,
+                kleur_drempel=None,
+            )
+            tpl = _compiled(name)
+            th, tw = tpl.height, tpl.width
+
+            hit: Optional[Match] = None
+            if gray.shape[0] >= th and gray.shape[1] >= tw:
+                with tracing.trace_context(name, a, bot_id):
+                    hit, _, _, _ = _tracked_match(
+                        (name, a, bot_id), shot, (ax, ay), tpl, method, min_shape, min_color, gray, pyramid
+                    )
+
+            _log(name, bool(hit), a, bot_id, hit, verbose)
+            out[name] = hit
+
+    return out
+
+
 def detect_image_timeout(
     image_name: str,
     area_name: str,
@@ -278,32 +540,28 @@ def detect_image_timeout(
     sleep_sec: float = 0.1,
     areas: Optional[Dict[str, List[int]]] = None,
     verbose: str = "short",
+    capture: Optional[FrameCapture] = None,
 ) -> Optional[Match]:
     """
     Timeout-variant op basis van jouw originele werkwijze:
     - timeout_sec <= 0  => 1 directe check
-    - timeout_sec > 0   => blijf proberen tot deadline
+    - timeout_sec > 0   => blijf proberen tot deadline; matchen alleen als de area-pixels veranderen
+    - capture           => frames uit een gedeelde FrameCapture i.p.v. eigen screenshots
     """
 
-    method, min_shape, min_color = _resolve_detection_params(
+    method, min_shape, min_color, pyramid = _resolve_detection_params(
         image_name=image_name,
         method_name=method_name,
         vorm_drempel=vorm_drempel,
         kleur_drempel=kleur_drempel,
     )
 
-    areas = areas or load_areas()
-    if area_name not in areas:
-        raise KeyError(f"Area niet gevonden: {area_name}")
+    x1, y1, x2, y2 = area_box(area_name, bot_id, areas or None)
 
-    _, tpl_rgb, tpl_gray = _read_template(image_name)
-    th, tw = tpl_gray.shape[:2]
-
-    x1, y1, x2, y2 = map(int, apply_offset(areas[area_name], bot_id))
-    w, h = x2 - x1, y2 - y1
+    tpl = _compiled(image_name)
 
     start_ts = time.time()
-    deadline = (start_ts + float(timeout_sec)) if timeout_sec and timeout_sec > 0 else None
+    box = (x1, y1, x2, y2)
 
     if verbose != VERBOSE_OFF:
         print(
@@ -311,49 +569,45 @@ def detect_image_timeout(
             f"timeout={timeout_sec}s drempels vorm={min_shape} kleur={min_color}"
         )
 
-    last_vorm = 0.0
-    last_kleur = 0.0
-    last_method = method
-
-    while True:
-        shot = _grab_area_rgb(x1, y1, w, h)
-        loc, vorm, kleur, used_method = _best_match_in_shot(shot, tpl_rgb, tpl_gray, method)
-
-        last_vorm, last_kleur, last_method = vorm, kleur, used_method
-
-        if loc is not None and vorm >= min_shape and kleur >= min_color:
-            rx, ry = loc
-            hit = Match(x1 + rx, y1 + ry, tw, th, vorm, kleur, used_method)
-
-            if verbose != VERBOSE_OFF:
-                elapsed = time.time() - start_ts
-                print(
-                    f"✅ Gevonden binnen {elapsed:.2f}s op ({hit.x}, {hit.y}) "
-                    f"vorm={hit.vorm} kleur={hit.kleur} w={hit.width} h={hit.height}"
-                )
-            _log(image_name, True, area_name, bot_id, hit, verbose)
-            return hit
-
-        # directe check (timeout_sec <= 0)
-        if deadline is None:
-            if verbose != VERBOSE_OFF:
-                print(
-                    f"❌ Niet gevonden bij directe check. Laatste scores vorm={last_vorm} kleur={last_kleur} method={last_method}"
-                )
-            _log(image_name, False, area_name, bot_id, None, verbose)
-            return None
-
-        # timeout check
-        if time.time() >= deadline:
-            if verbose != VERBOSE_OFF:
-                elapsed = time.time() - start_ts
-                print(
-                    f"⏱️ Timeout na {elapsed:.2f}s. Niet gevonden. Laatste scores vorm={last_vorm} kleur={last_kleur} method={last_method}"
-                )
-            _log(image_name, False, area_name, bot_id, None, verbose)
-            return None
-
-        time.sleep(float(max(0.0, sleep_sec)))
+    last = {"vorm": 0.0, "kleur": 0.0, "method": method}
+
+    def _check(frame: Frame) -> Optional[Match]:
+        shot, origin = frame.view(box), frame.view_origin(box)
+        hit, vorm, kleur, used_method = _tracked_match(
+            (image_name, area_name, bot_id), shot, origin, tpl, method, min_shape, min_color, pyramid=pyramid
+        )
+        last.update(vorm=vorm, kleur=kleur, method=used_method)
+        return hit
+
+    # matching alleen als de area-pixels veranderd zijn; sleep_sec = poll plafond op statisch scherm
+    sleep_sec = float(max(0.0, sleep_sec))
+    waiter = FrameWaiter(
+        watch=[box],
+        capture=capture,
+        backoff=Backoff(min_sec=min(MIN_POLL_SEC, sleep_sec), max_sec=sleep_sec),
+    )
+    with tracing.trace_context(image_name, area_name, bot_id):
+        hit = waiter.run(_check, timeout=float(timeout_sec or 0))
+
+    if verbose != VERBOSE_OFF:
+        elapsed = time.time() - start_ts
+        if hit:
+            print(
+                f"✅ Gevonden binnen {elapsed:.2f}s op ({hit.x}, {hit.y}) "
+                f"vorm={hit.vorm} kleur={hit.kleur} w={hit.width} h={hit.height}"
+            )
+        elif not timeout_sec or timeout_sec <= 0:
+            print(
+                f"❌ Niet gevonden bij directe check. Laatste scores vorm={last['vorm']} kleur={last['kleur']} method={last['method']}"
+            )
+        else:
+            print(
+                f"⏱️ Timeout na {elapsed:.2f}s. Niet gevonden. Laatste scores vorm={last['vorm']} kleur={last['kleur']} method={last['method']} "
+                f"(matches={waiter.evaluated} overgeslagen={waiter.skipped})"
+            )
+
+    _log(image_name, bool(hit), area_name, bot_id, hit, verbose)
+    return hit
 # === END API ===
 
 
@@ -3,11 +3,11 @@ from pathlib import Path
 
 import cv2
 import numpy as np
-import pyautogui
 
 from core.paths import IMAGES_DIR
-from core.bot_offsets import load_areas, apply_offset
+from core.area_registry import area_box
 from core.template_presets_store import load_preset
+from vision.grabbers import grab_box_rgb
 
 METHODS = {
     "TM_CCOEFF": cv2.TM_CCOEFF,
@@ -47,23 +47,17 @@ def _color_score(template_rgb, matched_rgb):
     return round(max(0.0, 100.0 - mae), 2)
 
 def _grab_area_rgb(box):
-    x1, y1, x2, y2 = box
-    w = x2 - x1
-    h = y2 - y1
-    return np.array(pyautogui.screenshot(region=(x1, y1, w, h)))
+    return grab_box_rgb(box)
 
 def detect_image(image_path, area_name, method_name="TM_CCOEFF_NORMED", vorm_drempel=90, kleur_drempel=60, bot_id=1, areas=None):
     method = METHODS.get(method_name)
     if method is None:
         raise ValueError(f"Onbekende methode: {method_name}")
 
-    areas = areas or load_areas()
-    if area_name not in areas:
-        raise KeyError(f"Area niet gevonden: {area_name}")
+    box = area_box(area_name, bot_id, areas or None)
 
     template_rgb, template_gray = _load_template(image_path)
 
-    box = apply_offset(areas[area_name], bot_id)
     shot_rgb = _grab_area_rgb(box)
     shot_gray = cv2.cvtColor(shot_rgb, cv2.COLOR_RGB2GRAY)
 
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: centraal en voorspelbaar, voorkomt verborgen dependencies.
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
+import threading
+
+from core.lazy_import import lazy_module
+cv2 = lazy_module("cv2")
+np = lazy_module("numpy")
+futures = lazy_module("concurrent.futures")
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+# === END IMPORTS ===
+
+
+# === START CONSTANTS ===
+# • WAT: engine modes + methode volgorde (zelfde als METHODS in image_detection).
+# • WAAROM: "ALL" moet dezelfde kandidaat-volgorde houden als de oude loop.
+MODE_DERIVED = "derived"        # 1x TM_CCORR + integral images, rest afgeleid
+MODE_THREADS = "threads"        # 6x matchTemplate parallel (OpenCV laat de GIL los)
+MODE_SEQUENTIAL = "sequential"  # oude gedrag: 6x matchTemplate na elkaar
+
+ALL_METHODS = (
+    "TM_CCOEFF",
+    "TM_CCOEFF_NORMED",
+    "TM_CCORR",
+    "TM_CCORR_NORMED",
+    "TM_SQDIFF",
+    "TM_SQDIFF_NORMED",
+)
+
+# onder deze noemer is een venster/template "vlak" (zelfde regel als OpenCV)
+_EPS = 1e-9
+# === END CONSTANTS ===
+
+
+# === START HELPERS ===
+# • WAT: gedeelde thread pool + venster-sommen uit integral images.
+# • WAAROM: pool wordt hergebruikt i.p.v. per call opgestart.
+_POOL: Optional[ThreadPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = futures.ThreadPoolExecutor(max_workers=len(ALL_METHODS), thread_name_prefix="match_all")
+        return _POOL
+
+
+def _window_sums(gray: np.ndarray, th: int, tw: int):
+    """Som en kwadratensom per template-venster, shape = matchTemplate output."""
+    s, sq = cv2.integral2(gray, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+    ws = s[th:, tw:] - s[:-th, tw:] - s[th:, :-tw] + s[:-th, :-tw]
+    wsq = sq[th:, tw:] - sq[:-th, tw:] - sq[th:, :-tw] + sq[:-th, :-tw]
+    return ws, wsq
+
+
+def _safe_div(num: np.ndarray, den: np.ndarray, flat_value: float) -> np.ndarray:
+    out = np.full(num.shape, flat_value, dtype=np.float64)
+    ok = den > _EPS
+    np.divide(num, den, out=out, where=ok)
+    return out
+# === END HELPERS ===
+
+
+# === START CORE LOGIC ===
+# • WAT: drie engines die dezelfde {methode: result map} teruggeven.
+# • WAAROM: "ALL" kost nu 1 matchTemplate i.p.v. 6; threads/sequential blijven als referentie.
+def _run_derived(gray: np.ndarray, tpl_gray: np.ndarray, methods: Iterable[str], tpl_stats=None) -> Dict[str, np.ndarray]:
+    th, tw = tpl_gray.shape[:2]
+    n = float(th * tw)
+
+    if tpl_stats is not None:
+        t_sum, t_sq = tpl_stats
+    else:
+        tpl = tpl_gray.astype(np.float64)
+        t_sum = float(tpl.sum())
+        t_sq = float((tpl * tpl).sum())
+    t_var = max(t_sq - t_sum * t_sum / n, 0.0)
+
+    ccorr = cv2.matchTemplate(gray, tpl_gray, cv2.TM_CCORR).astype(np.float64)
+    ws, wsq = _window_sums(gray, th, tw)
+    w_var = np.maximum(wsq - ws * ws / n, 0.0)
+
+    out: Dict[str, np.ndarray] = {}
+    for m in methods:
+        if m == "TM_CCORR":
+            out[m] = ccorr
+        elif m == "TM_CCORR_NORMED":
+            out[m] = np.clip(_safe_div(ccorr, np.sqrt(wsq * t_sq), 0.0), -1.0, 1.0)
+        elif m == "TM_SQDIFF":
+            out[m] = np.maximum(wsq - 2.0 * ccorr + t_sq, 0.0)
+        elif m == "TM_SQDIFF_NORMED":
+            sqdiff = np.maximum(wsq - 2.0 * ccorr + t_sq, 0.0)
+            out[m] = np.clip(_safe_div(sqdiff, np.sqrt(wsq * t_sq), 1.0), 0.0, 1.0)
+        elif m == "TM_CCOEFF":
+            out[m] = ccorr - ws * (t_sum / n)
+        elif m == "TM_CCOEFF_NORMED":
+            ccoeff = ccorr - ws * (t_sum / n)
+            out[m] = np.clip(_safe_div(ccoeff, np.sqrt(w_var * t_var), 0.0), -1.0, 1.0)
+        else:
+            raise KeyError(f"Ongeldige methode: {m}")
+    return out
+
+
+def _run_threaded(gray: np.ndarray, tpl_gray: np.ndarray, methods: Iterable[str], tpl_stats=None) -> Dict[str, np.ndarray]:
+    futures = {m: _pool().submit(cv2.matchTemplate, gray, tpl_gray, getattr(cv2, m)) for m in methods}
+    return {m: f.result() for m, f in futures.items()}
+
+
+def _run_sequential(gray: np.ndarray, tpl_gray: np.ndarray, methods: Iterable[str], tpl_stats=None) -> Dict[str, np.ndarray]:
+    return {m: cv2.matchTemplate(gray, tpl_gray, getattr(cv2, m)) for m in methods}
+
+
+_ENGINES = {
+    MODE_DERIVED: _run_derived,
+    MODE_THREADS: _run_threaded,
+    MODE_SEQUENTIAL: _run_sequential,
+}
+# === END CORE LOGIC ===
+
+
+# === START API ===
+# • WAT: publieke entry voor "ALL" evaluatie.
+# • WAAROM: image_detection en tools gebruiken dezelfde engine.
+def match_all_methods(
+    gray: np.ndarray,
+    tpl_gray: np.ndarray,
+    methods: Optional[Iterable[str]] = None,
+    mode: str = MODE_DERIVED,
+    tpl_stats: Optional[Tuple[float, float]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Returns {methode: ruwe matchTemplate map} voor alle (of de gegeven) methodes,
+    in ALL_METHODS volgorde.
+    tpl_stats = (som, kwadratensom) van tpl_gray, bv. CompiledTemplate.stats (alleen derived).
+    """
+    if mode not in _ENGINES:
+        raise KeyError(f"Onbekende match_all mode: {mode}")
+    want = None if methods is None else set(methods)  # 1x: generator zou na de eerste check leeg zijn
+    wanted = [m for m in ALL_METHODS if want is None or m in want]
+    return _ENGINES[mode](gray, tpl_gray, wanted, tpl_stats)
+# === END API ===
+
+
+# === START CLI TEST ===
+# • WAT: controle dat afgeleide maps dezelfde beste locatie geven als OpenCV.
+# • WAAROM: snel verifiëren zonder scherm (tools/bench_match_all.py voor timings).
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    img = cv2.GaussianBlur(rng.integers(0, 255, (502, 763), dtype=np.uint8), (5, 5), 0)
+    tpl = img[200:226, 300:330].copy()
+
+    ref = match_all_methods(img, tpl, mode=MODE_SEQUENTIAL)
+    der = match_all_methods(img, tpl, mode=MODE_DERIVED)
+    for m in ALL_METHODS:
+        pick = cv2.minMaxLoc(ref[m])[2 if m.startswith("TM_SQDIFF") else 3]
+        got = cv2.minMaxLoc(der[m].astype(np.float32))[2 if m.startswith("TM_SQDIFF") else 3]
+        print(f"{'🟢' if pick == got else '🔴'} {m:<18} opencv={pick} derived={got}")
+# === END CLI TEST ===
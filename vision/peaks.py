@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: centraal en voorspelbaar, voorkomt verborgen dependencies.
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.lazy_import import lazy_module
+cv2 = lazy_module("cv2")
+np = lazy_module("numpy")
+# === END IMPORTS ===
+
+
+# === START CONSTANTS ===
+# • WAT: defaults voor lokale maxima.
+# • WAAROM: 3x3 is genoeg om plateaus/buren weg te halen; de NMS doet de rest.
+DEFAULT_PEAK_RADIUS = 1
+
+Peak = Tuple[int, int, float]  # (x, y, score) in score-map coördinaten
+# === END CONSTANTS ===
+
+
+# === START HELPERS ===
+# • WAT: lokale maxima via dilate-compare + spatial grid voor de suppressie.
+# • WAAROM: duizenden drempel-pixels worden eerst een handvol pieken; NMS checkt alleen buurcellen.
+def local_maxima(
+    scores: np.ndarray,
+    min_score: float,
+    peak_radius: int = DEFAULT_PEAK_RADIUS,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pixels >= min_score die ook het maximum van hun (2r+1)x(2r+1) omgeving zijn.
+    Returns (xs, ys, values) gesorteerd op score, hoogste eerst.
+    """
+    s = np.asarray(scores, dtype=np.float32)
+    if s.size == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty, np.empty(0, dtype=np.float32)
+
+    r = max(0, int(peak_radius))
+    if r > 0:
+        kernel = np.ones((2 * r + 1, 2 * r + 1), dtype=np.uint8)
+        dil = cv2.dilate(s, kernel)
+        mask = (s >= dil) & (s >= float(min_score))
+    else:
+        mask = s >= float(min_score)
+
+    ys, xs = np.nonzero(mask)
+    values = s[ys, xs]
+    order = np.argsort(-values, kind="stable")
+    return xs[order], ys[order], values[order]
+
+
+def _grid_suppress(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    values: np.ndarray,
+    cell_w: int,
+    cell_h: int,
+    conflicts: Callable[[int, int], bool],
+    max_hits: Optional[int],
+) -> List[Peak]:
+    """
+    Greedy NMS (hoogste score eerst) met een spatial grid: een kandidaat wordt alleen
+    vergeleken met gekozen pieken in de 3x3 buurcellen. conflicts(dx, dy) => onderdrukken.
+    """
+    cell_w = max(1, int(cell_w))
+    cell_h = max(1, int(cell_h))
+    grid: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+    picked: List[Peak] = []
+    limit = int(max_hits) if max_hits is not None else None
+
+    for x, y, v in zip(xs.tolist(), ys.tolist(), values.tolist()):
+        cx, cy = x // cell_w, y // cell_h
+        hit = False
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                for px, py in grid.get((gx, gy), ()):
+                    if conflicts(x - px, y - py):
+                        hit = True
+                        break
+                if hit:
+                    break
+            if hit:
+                break
+        if hit:
+            continue
+
+        grid.setdefault((cx, cy), []).append((x, y))
+        picked.append((x, y, v))
+        if limit is not None and len(picked) >= limit:
+            break
+
+    return picked
+# === END HELPERS ===
+
+
+# === START API ===
+# • WAT: twee suppressie-varianten met dezelfde piek-extractie.
+# • WAAROM: image_debugger werkt met een radius, click_images met IoU op template-boxen.
+def peaks_radius(
+    scores: np.ndarray,
+    min_score: float,
+    radius: int,
+    max_hits: Optional[int] = None,
+    peak_radius: int = DEFAULT_PEAK_RADIUS,
+) -> List[Peak]:
+    """Pieken waarbij geen twee gekozen pieken binnen `radius` px (euclidisch) van elkaar liggen."""
+    xs, ys, values = local_maxima(scores, min_score, peak_radius)
+    r = max(0, int(radius))
+    r2 = r * r
+    return _grid_suppress(xs, ys, values, r, r, lambda dx, dy: dx * dx + dy * dy <= r2, max_hits)
+
+
+def peaks_iou(
+    scores: np.ndarray,
+    min_score: float,
+    box_w: int,
+    box_h: int,
+    iou_thr: float,
+    max_hits: Optional[int] = None,
+    peak_radius: int = DEFAULT_PEAK_RADIUS,
+) -> List[Peak]:
+    """
+    Pieken voor boxen van box_w x box_h (matchTemplate: alle boxen even groot).
+    Onderdrukt bij IoU > iou_thr (zelfde +1 pixel conventie als de oude click_images._nms).
+    """
+    xs, ys, values = local_maxima(scores, min_score, peak_radius)
+    bw, bh = int(box_w) + 1, int(box_h) + 1
+    area = float(bw * bh)
+    thr = float(iou_thr)
+
+    def conflicts(dx: int, dy: int) -> bool:
+        iw, ih = bw - abs(dx), bh - abs(dy)
+        if iw <= 0 or ih <= 0:
+            return False
+        inter = float(iw * ih)
+        return inter / (2.0 * area - inter + 1e-9) > thr
+
+    # overlap kan alleen binnen (bw, bh) => buurcellen van die grootte zijn genoeg
+    return _grid_suppress(xs, ys, values, bw, bh, conflicts, max_hits)
+# === END API ===
+
+
+# === START CLI TEST ===
+# • WAT: synthetische "volle inventory" (4x7 slots) met ruisige pieken.
+# • WAAROM: snel timing + aantal hits controleren zonder scherm.
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    slot_w, slot_h, tw, th = 42, 36, 30, 26
+    res = (rng.random((7 * slot_h, 4 * slot_w)) * 0.6).astype(np.float32)
+    for row in range(7):
+        for col in range(4):
+            cx, cy = col * slot_w + 6, row * slot_h + 5
+            res[cy - 2:cy + 3, cx - 2:cx + 3] = np.maximum(res[cy - 2:cy + 3, cx - 2:cx + 3], 0.85 + rng.random((5, 5)) * 0.1)
+            res[cy, cx] = 0.99
+
+    n_above = int((res >= 0.8).sum())
+    for name, fn in (
+        ("radius", lambda: peaks_radius(res, 0.8, radius=max(5, min(tw, th) // 2))),
+        ("iou", lambda: peaks_iou(res, 0.8, tw, th, iou_thr=0.25)),
+    ):
+        hits = fn()
+        t0 = time.perf_counter()
+        for _ in range(200):
+            fn()
+        ms = (time.perf_counter() - t0) / 200 * 1000
+        print(f"{'🟢' if len(hits) == 28 else '🔴'} {name:<6} hits={len(hits)} (uit {n_above} drempel-pixels) {ms:.3f} ms")
+# === END CLI TEST ===
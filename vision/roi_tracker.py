@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: centraal en voorspelbaar, voorkomt verborgen dependencies.
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+import threading
+# === END IMPORTS ===
+
+
+# === START CONSTANTS ===
+# • WAT: venstergrootte rond de vorige hit + toegestane kleurdaling.
+# • WAAROM: HUD iconen staan stil; een paar px marge vangt kleine verschuivingen op.
+ROI_PAD_PX = 6            # zoekvenster = vorige match box + 6 px rondom
+ROI_KLEUR_DROP = 5.0      # kleur mag max 5 punten onder de vorige hit zakken, anders volledige area
+ROI_TRACKING = True       # globale schakelaar (bv. uit voor vergelijkingen in benchmarks)
+
+RoiKey = Tuple[str, str, int]  # (template, area, bot_id)
+# === END CONSTANTS ===
+
+
+# === START MODELS ===
+# • WAT: laatst bekende hit (schermcoördinaten) per key.
+# • WAAROM: genoeg om een venster te snijden en de score te vergelijken.
+@dataclass(frozen=True)
+class RoiEntry:
+    x: int
+    y: int
+    width: int
+    height: int
+    kleur: float
+
+    def window(self, pad: int = ROI_PAD_PX) -> Tuple[int, int, int, int]:
+        """(x1, y1, x2, y2) zoekvenster in schermcoördinaten."""
+        return self.x - pad, self.y - pad, self.x + self.width + pad, self.y + self.height + pad
+# === END MODELS ===
+
+
+# === START CORE LOGIC ===
+# • WAT: match-locatie geheugen + hit/miss tellers, thread-safe.
+# • WAAROM: scheduler threads detecteren tegelijk; tellers laten zien hoeveel full scans we uitsparen.
+class RoiTracker:
+    """
+    hits       = ROI venster gaf een geldige match (geen full scan nodig)
+    misses     = ROI venster faalde of kleur zakte => full scan als fallback
+    full_scans = alle full scans (misses + keys zonder geheugen)
+    """
+
+    def __init__(self, pad: int = ROI_PAD_PX, kleur_drop: float = ROI_KLEUR_DROP):
+        self.pad = max(0, int(pad))
+        self.kleur_drop = float(kleur_drop)
+        self._entries: Dict[RoiKey, RoiEntry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.full_scans = 0
+
+    def get(self, key: RoiKey) -> Optional[RoiEntry]:
+        return self._entries.get(key)
+
+    def accepts(self, entry: RoiEntry, kleur: float) -> bool:
+        return kleur >= entry.kleur - self.kleur_drop
+
+    def hit(self, key: RoiKey, entry: RoiEntry) -> None:
+        with self._lock:
+            self.hits += 1
+            self._entries[key] = entry
+
+    def miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def full_scan(self, key: RoiKey, entry: Optional[RoiEntry]) -> None:
+        """Resultaat van een full scan: onthouden bij hit, vergeten bij geen hit."""
+        with self._lock:
+            self.full_scans += 1
+            if entry is None:
+                self._entries.pop(key, None)
+            else:
+                self._entries[key] = entry
+
+    def forget(self, template: Optional[str] = None) -> None:
+        with self._lock:
+            if template is None:
+                self._entries.clear()
+            else:
+                for k in [k for k in self._entries if k[0] == template]:
+                    del self._entries[k]
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.full_scans = 0
+
+    def stats(self) -> Dict[str, float]:
+        checks = self.hits + self.full_scans
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "full_scans": self.full_scans,
+            "entries": len(self._entries),
+            "hit_rate": round(self.hits / checks, 3) if checks else 0.0,
+        }
+
+
+_TRACKER = RoiTracker()
+
+
+def get_roi_tracker() -> RoiTracker:
+    return _TRACKER
+# === END CORE LOGIC ===
+
+
+# === START CLI TEST ===
+# • WAT: veilige handmatige test.
+# • WAAROM: laat zien hoeveel checks op een statisch HUD icoon het kleine venster gebruiken.
+if __name__ == "__main__":
+    import time
+
+    from vision import roi_tracker as rt  # __main__ is een losse kopie; image_detection gebruikt deze
+    from vision.image_detection import detect_image
+
+    tracker = rt.get_roi_tracker()
+    for label, enabled in (("full area", False), ("roi", True)):
+        rt.ROI_TRACKING = enabled
+        tracker.forget()
+        tracker.reset_stats()
+        t0 = time.perf_counter()
+        for _ in range(20):
+            detect_image("XP.png", "Info_Area", bot_id=1, verbose="off")
+        ms = (time.perf_counter() - t0) / 20 * 1000
+        print(f"⏱️ {label:<9} {ms:.2f} ms/check | {tracker.stats()}")
+# === END CLI TEST ===
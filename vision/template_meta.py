@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: centraal en voorspelbaar, voorkomt verborgen dependencies.
+from dataclasses import dataclass
+from typing import Any, Dict
+
+from core.json_cache import DEFAULT_CHECK_INTERVAL_SEC, JsonFileCache
+from core.paths import CONFIG_DIR
+# === END IMPORTS ===
+
+
+# === START CONSTANTS ===
+# • WAT: meta bestand + defaults per veld.
+# • WAAROM: één plek voor defaults i.p.v. verspreid over d.get(...) calls.
+META_FILE = Path(CONFIG_DIR) / "templates_meta.json"
+
+DEFAULT_METHOD = "TM_CCOEFF"
+DEFAULT_MIN_SHAPE = 85.0
+DEFAULT_MIN_COLOR = 60.0
+DEFAULT_PYRAMID_LEVELS = 0
+DEFAULT_PYRAMID_CANDIDATES = 3
+# === END CONSTANTS ===
+
+
+# === START MODELS ===
+# • WAT: getypte instellingen van één template uit templates_meta.json.
+# • WAAROM: callers krijgen attributen i.p.v. losse dict keys + casts.
+@dataclass(frozen=True)
+class TemplateSettings:
+    method: str = DEFAULT_METHOD
+    min_shape: float = DEFAULT_MIN_SHAPE
+    min_color: float = DEFAULT_MIN_COLOR
+    pyramid_levels: int = DEFAULT_PYRAMID_LEVELS
+    pyramid_candidates: int = DEFAULT_PYRAMID_CANDIDATES
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "TemplateSettings":
+        return cls(
+            method=str(d.get("method", DEFAULT_METHOD)),
+            min_shape=float(d.get("min_shape", DEFAULT_MIN_SHAPE)),
+            min_color=float(d.get("min_color", DEFAULT_MIN_COLOR)),
+            pyramid_levels=int(d.get("pyramid_levels", DEFAULT_PYRAMID_LEVELS)),
+            pyramid_candidates=int(d.get("pyramid_candidates", DEFAULT_PYRAMID_CANDIDATES)),
+        )
+# === END MODELS ===
+
+
+# === START CORE LOGIC ===
+# • WAT: registry: JSON 1x parsen, mtime check max 1x per interval, settings per template cachen.
+# • WAAROM: polling loops (tientallen calls/sec) betalen geen disk IO + json parse meer.
+class TemplateMetaRegistry:
+    def __init__(self, path: Path = META_FILE, check_interval: float = DEFAULT_CHECK_INTERVAL_SEC):
+        self._file = JsonFileCache(path, check_interval)
+        self._settings: Dict[str, TemplateSettings] = {}
+        self._version = -1
+
+    @property
+    def path(self) -> Path:
+        return self._file.path
+
+    def raw(self) -> Dict[str, Any]:
+        """Volledige meta dict (gedeeld, niet muteren)."""
+        return self._file.data()
+
+    def get(self, image_name: str) -> TemplateSettings:
+        raw = self._file.data()
+        if self._version != self._file.version:
+            self._settings = {}
+            self._version = self._file.version
+
+        s = self._settings.get(image_name)
+        if s is None:
+            d = raw.get(image_name, {})
+            s = TemplateSettings.from_dict(d if isinstance(d, dict) else {})
+            self._settings[image_name] = s
+        return s
+
+    def invalidate(self) -> None:
+        self._file.invalidate()
+
+
+_REGISTRY = TemplateMetaRegistry()
+# === END CORE LOGIC ===
+
+
+# === START API ===
+# • WAT: module-level shortcuts op de gedeelde registry.
+# • WAAROM: image_detection en tools hoeven geen eigen registry te beheren.
+def get_template_settings(image_name: str) -> TemplateSettings:
+    return _REGISTRY.get(image_name)
+
+
+def load_template_meta() -> Dict[str, Any]:
+    return _REGISTRY.raw()
+
+
+def invalidate_template_meta() -> None:
+    _REGISTRY.invalidate()
+# === END API ===
+
+
+# === START CLI TEST ===
+# • WAT: veilige handmatige test.
+# • WAAROM: snel zien wat er per template geladen wordt.
+if __name__ == "__main__":
+    print("📄", META_FILE)
+    for name in load_template_meta():
+        print(f"  {name}: {get_template_settings(name)}")
+# === END CLI TEST ===
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: centraal en voorspelbaar, voorkomt verborgen dependencies.
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+import hashlib
+import json
+import math
+import os
+import threading
+
+from core.lazy_import import lazy_module
+np = lazy_module("numpy")
+
+from core.paths import IMAGES_DIR, PROJECT_ROOT
+# === END IMPORTS ===
+
+
+# === START CONSTANTS ===
+# • WAT: locatie + versie van de gecompileerde template store.
+# • WAAROM: 1 blob (np.load mmap) + 1 kleine index i.p.v. N x PNG decode bij elke start.
+STORE_DIR = PROJECT_ROOT / "cache"
+STORE_BLOB = STORE_DIR / "templates_store.npy"     # uint8 blob, alle arrays achter elkaar
+STORE_INDEX = STORE_DIR / "templates_store.json"   # naam -> offsets/shapes/hash/stats
+STORE_VERSION = 2                                  # 2: geen meta meer in de index (template_meta leest de JSON zelf)
+
+_ARRAYS = ("bgr", "rgb", "gray")
+# === END CONSTANTS ===
+
+
+# === START MODELS ===
+# • WAT: één template uit de store (views op de memmap, read-only).
+# • WAAROM: CompiledTemplate kan hier direct mee gebouwd worden zonder cv2.imread.
+@dataclass(frozen=True)
+class StoredTemplate:
+    name: str
+    sha1: str
+    bgr: np.ndarray
+    rgb: np.ndarray
+    gray: np.ndarray
+    gray_sum: float
+    gray_sq: float
+# === END MODELS ===
+
+
+# === START HELPERS ===
+# • WAT: content hash + stat stempel van een PNG.
+# • WAAROM: stat is gratis; hash alleen als stat afwijkt (bv. na git checkout/touch).
+def _sha1(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def _stamp(path: Path) -> List[int]:
+    st = path.stat()
+    return [int(st.st_mtime_ns), int(st.st_size)]
+# === END HELPERS ===
+
+
+# === START CORE LOGIC ===
+# • WAT: runtime loader: index 1x lezen, blob mmap'en, entries per naam valideren.
+# • WAAROM: een gewijzigde PNG valt terug op cv2.imread; de rest blijft uit de store komen.
+class TemplateStore:
+    def __init__(self, blob: Path = STORE_BLOB, index: Path = STORE_INDEX, images_dir: Path = IMAGES_DIR):
+        self.blob_path = Path(blob)
+        self.index_path = Path(index)
+        self.images_dir = Path(images_dir)
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._blob: Optional[np.ndarray] = None
+        self._valid: Dict[str, StoredTemplate] = {}
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            try:
+                doc = json.loads(self.index_path.read_text(encoding="utf-8-sig"))
+                if int(doc.get("version", 0)) != STORE_VERSION:
+                    return
+                # plain ndarray view op de memmap: slices zonder memmap subclass overhead
+                self._blob = np.asarray(np.load(self.blob_path, mmap_mode="r"))
+                self._index = dict(doc.get("templates") or {})
+            except (OSError, ValueError):
+                self._index, self._blob = {}, None
+
+    def names(self) -> List[str]:
+        self._load()
+        return sorted(self._index)
+
+    def __contains__(self, name: str) -> bool:
+        self._load()
+        return name in self._index
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._index)
+
+    def _check(self, name: str, entry: Dict[str, Any]) -> bool:
+        path = self.images_dir / name
+        try:
+            if _stamp(path) == list(entry["stamp"]):
+                return True
+            return _sha1(path) == entry["sha1"]
+        except OSError:
+            return False
+
+    def get(self, name: str) -> Optional[StoredTemplate]:
+        """
+        Gevalideerde entry, of None (niet in store / PNG gewijzigd => caller decodeert zelf).
+        Elke call 1 stat: tools die PNGs overschrijven krijgen nooit een verouderde entry.
+        """
+        self._load()
+        entry = self._index.get(name)
+        if entry is None or self._blob is None or not self._check(name, entry):
+            return None
+
+        tpl = self._valid.get(name)
+        if tpl is None:
+            arrays = {}
+            for key in _ARRAYS:
+                off, shape = int(entry[key]["offset"]), tuple(entry[key]["shape"])
+                arrays[key] = self._blob[off:off + math.prod(shape)].reshape(shape)
+            tpl = StoredTemplate(
+                name=name,
+                sha1=str(entry["sha1"]),
+                bgr=arrays["bgr"],
+                rgb=arrays["rgb"],
+                gray=arrays["gray"],
+                gray_sum=float(entry["gray_sum"]),
+                gray_sq=float(entry["gray_sq"]),
+            )
+            self._valid[name] = tpl
+        return tpl
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded = False
+            self._index, self._blob = {}, None
+            self._valid = {}
+
+
+def build_template_store(
+    images_dir: Path = IMAGES_DIR,
+    blob: Path = STORE_BLOB,
+    index: Path = STORE_INDEX,
+) -> Dict[str, Any]:
+    """
+    Decodeert alle PNGs 1x en schrijft blob + index. Ongewijzigde bron (zelfde hashes)
+    => niets herschrijven. Returns korte info dict voor de build tool.
+    """
+    import cv2
+
+    images_dir, blob, index = Path(images_dir), Path(blob), Path(index)
+
+    pngs = sorted(images_dir.glob("*.png"))
+    hashes = {p.name: _sha1(p) for p in pngs}
+
+    # ongewijzigd? dan alleen de stat stempels bijwerken
+    try:
+        old = json.loads(index.read_text(encoding="utf-8-sig"))
+        same = (
+            int(old.get("version", 0)) == STORE_VERSION
+            and {n: e["sha1"] for n, e in (old.get("templates") or {}).items()} == hashes
+            and blob.exists()
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        old, same = None, False
+
+    if same:
+        for p in pngs:
+            old["templates"][p.name]["stamp"] = _stamp(p)
+        index.write_text(json.dumps(old, indent=1), encoding="utf-8")
+        _STORE.invalidate()
+        return {"templates": len(pngs), "bytes": blob.stat().st_size, "rebuilt": False}
+
+    chunks: List[np.ndarray] = []
+    entries: Dict[str, Dict[str, Any]] = {}
+    offset = 0
+    for p in pngs:
+        bgr = cv2.imread(str(p), cv2.IMREAD_COLOR)
+        if bgr is None:
+            print(f"⚠️ overgeslagen (niet leesbaar): {p.name}")
+            continue
+        arrays = {
+            "bgr": bgr,
+            "rgb": cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB),
+            "gray": cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY),
+        }
+        g = arrays["gray"].astype(np.float64)
+        entry: Dict[str, Any] = {
+            "sha1": hashes[p.name],
+            "stamp": _stamp(p),
+            "gray_sum": float(g.sum()),
+            "gray_sq": float((g * g).sum()),
+        }
+        for key in _ARRAYS:
+            arr = np.ascontiguousarray(arrays[key])
+            entry[key] = {"offset": offset, "shape": list(arr.shape)}
+            chunks.append(arr.reshape(-1))
+            offset += arr.size
+        entries[p.name] = entry
+
+    blob.parent.mkdir(parents=True, exist_ok=True)
+    index.parent.mkdir(parents=True, exist_ok=True)
+    data = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.uint8)
+
+    # eerst naar tmp + replace: een lopende bot die de oude blob gemapt heeft blijft werken
+    tmp_blob = blob.with_name(blob.name + ".tmp")
+    with open(tmp_blob, "wb") as f:
+        np.save(f, data)
+    os.replace(tmp_blob, blob)
+
+    doc = {"version": STORE_VERSION, "templates": entries}
+    tmp_index = index.with_name(index.name + ".tmp")
+    tmp_index.write_text(json.dumps(doc, indent=1), encoding="utf-8")
+    os.replace(tmp_index, index)
+
+    _STORE.invalidate()
+    return {"templates": len(entries), "bytes": int(data.nbytes), "rebuilt": True}
+
+
+_STORE = TemplateStore()
+
+
+def get_template_store() -> TemplateStore:
+    return _STORE
+# === END CORE LOGIC ===
+
+
+# === START CLI TEST ===
+# • WAT: veilige handmatige test.
+# • WAAROM: laat zien welke templates uit de store komen (bouwen: tools/build_template_store.py).
+if __name__ == "__main__":
+    store = get_template_store()
+    names = store.names()
+    print(f"📦 {store.blob_path} | {len(names)} templates")
+    for n in names:
+        t = store.get(n)
+        print(f"   {'🟢' if t is not None else '🔴'} {n} {tuple(t.gray.shape) if t is not None else '(gewijzigd/ontbreekt)'}")
+# === END CLI TEST ===
@@ -0,0 +1,392 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: centraal en voorspelbaar, voorkomt verborgen dependencies.
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+import itertools
+import os
+import threading
+
+from core.lazy_import import lazy_module
+futures = lazy_module("concurrent.futures")
+mp = lazy_module("multiprocessing")
+shared_memory = lazy_module("multiprocessing.shared_memory")
+np = lazy_module("numpy")
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+from vision.frame_capture import Frame
+# === END IMPORTS ===
+
+
+# === START CONSTANTS ===
+# • WAT: pool defaults.
+# • WAAROM: 1 core vrij voor capture/input threads; de rest voor matching.
+DEFAULT_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+ATTACH_CACHE = 32            # max open shared_memory handles per worker
+# === END CONSTANTS ===
+
+
+# === START SHARED MEMORY ===
+# • WAT: herbruikbare shared_memory blokken voor de pixels van één taak.
+# • WAAROM: frames gaan niet door de pipe (pickle), alleen een naam + shape.
+class _Block:
+    def __init__(self, nbytes: int):
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, int(nbytes)))
+
+    @property
+    def size(self) -> int:
+        return self.shm.size
+
+    def write(self, rgb: np.ndarray) -> Tuple[str, Tuple[int, ...]]:
+        dst = np.ndarray(rgb.shape, dtype=np.uint8, buffer=self.shm.buf)
+        np.copyto(dst, rgb)
+        del dst  # geen export meer open => close() kan later
+        return self.shm.name, tuple(rgb.shape)
+
+    def destroy(self) -> None:
+        self.shm.close()
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class _BlockPool:
+    """Vrije blokken worden hergebruikt; te klein => groter blok. Aantal = max taken tegelijk in de lucht."""
+
+    def __init__(self):
+        self._free: List[_Block] = []
+        self._all: List[_Block] = []
+        self._lock = threading.Lock()
+
+    def acquire(self, nbytes: int) -> _Block:
+        with self._lock:
+            for i, b in enumerate(self._free):
+                if b.size >= nbytes:
+                    return self._free.pop(i)
+            if self._free:
+                # kleinste vrije blok vervangen door een passend blok
+                old = self._free.pop(0)
+                self._all.remove(old)
+                old.destroy()
+            b = _Block(nbytes)
+            self._all.append(b)
+            return b
+
+    def release(self, block: _Block) -> None:
+        with self._lock:
+            self._free.append(block)
+            self._free.sort(key=lambda b: b.size)
+
+    def close(self) -> None:
+        with self._lock:
+            for b in self._all:
+                b.destroy()
+            self._all.clear()
+            self._free.clear()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Open een bestaand blok zonder het bij de resource tracker te registreren (de pool is eigenaar)."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    from multiprocessing import resource_tracker
+
+    register = resource_tracker.register
+    resource_tracker.register = lambda *_a, **_k: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+# === END SHARED MEMORY ===
+
+
+# === START WORKER ===
+# • WAT: taken die een worker kan uitvoeren + de worker loop.
+# • WAAROM: zelfde functies als in-process (frame=...), dus identieke resultaten; imports lazy => geen cycles.
+def _task_detect_image(frame: Frame, bot_id: int, **kw) -> Any:
+    from vision.image_detection import detect_image
+
+    return detect_image(bot_id=bot_id, frame=frame, verbose="off", **kw)
+
+
+def _task_detect_many(frame: Frame, bot_id: int, **kw) -> Any:
+    from vision.image_detection import detect_many
+
+    return detect_many(bot_id=bot_id, frame=frame, verbose="off", **kw)
+
+
+def _task_colour_fractions(frame: Frame, bot_id: int, **kw) -> Any:
+    from vision.colour_detection import colour_fractions
+
+    return colour_fractions(frame.rgb, **kw)
+
+
+def _task_find_all_hits(frame: Frame, bot_id: int, **kw) -> Any:
+    from core.click_images import find_all_hits
+
+    return find_all_hits(bot_id=bot_id, frame=frame, **kw)
+
+
+TASKS: Dict[str, Callable[..., Any]] = {
+    "detect_image": _task_detect_image,
+    "detect_many": _task_detect_many,
+    "colour_fractions": _task_colour_fractions,
+    "find_all_hits": _task_find_all_hits,
+}
+
+
+def _warm(preload: Optional[Iterable[str]]) -> None:
+    from vision import colour_detection, image_detection  # noqa: F401 (import kosten vóór de eerste taak)
+    from vision.compiled_template import TEMPLATE_CACHE_SIZE, get_compiled_template
+    from vision.template_store import get_template_store
+
+    names = list(preload) if preload is not None else get_template_store().names()
+    for name in names[:TEMPLATE_CACHE_SIZE]:
+        try:
+            get_compiled_template(name)
+        except FileNotFoundError:
+            pass
+
+
+def _worker_main(conn, preload: Optional[List[str]]) -> None:
+    _warm(preload)
+    attached: "OrderedDict[str, shared_memory.SharedMemory]" = OrderedDict()
+
+    while True:
+        try:
+            msg = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if msg is None:
+            break
+
+        req_id, kind, (name, shape, ts, seq, origin), bot_id, kwargs = msg
+        try:
+            shm = attached.get(name)
+            if shm is None:
+                shm = attached[name] = _attach(name)
+                while len(attached) > ATTACH_CACHE:
+                    attached.popitem(last=False)[1].close()
+            attached.move_to_end(name)
+
+            rgb = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+            reply = (req_id, True, TASKS[kind](Frame(rgb=rgb, ts=ts, seq=seq, origin=origin), bot_id, **kwargs))
+            del rgb
+        except BaseException as e:
+            reply = (req_id, False, e)
+
+        try:
+            conn.send(reply)
+        except Exception as e:  # exception niet picklebaar
+            conn.send((req_id, False, RuntimeError(f"{type(reply[2]).__name__}: {reply[2]} ({e})")))
+
+    for shm in attached.values():
+        shm.close()
+# === END WORKER ===
+
+
+# === START CORE LOGIC ===
+# • WAT: proces-pool met per worker een pipe + warme template cache.
+# • WAAROM: NMS/kleur/Match code houdt de GIL vast; in aparte processen schalen 4 bots over de cores.
+class _Worker:
+    def __init__(self, ctx, index: int, preload: Optional[List[str]], on_reply: Callable[["_Worker", tuple], None]):
+        self.conn, child = ctx.Pipe()
+        self.proc = ctx.Process(target=_worker_main, args=(child, preload), name=f"vision-{index}", daemon=True)
+        self.proc.start()
+        child.close()
+        self.lock = threading.Lock()
+        self.pending: Dict[int, Tuple[Future, _Block]] = {}
+        self._on_reply = on_reply
+        self.reader = threading.Thread(target=self._read, name=f"vision-{index}-reader", daemon=True)
+        self.reader.start()
+
+    def _read(self) -> None:
+        while True:
+            try:
+                reply = self.conn.recv()
+            except (EOFError, OSError):
+                break
+            self._on_reply(self, reply)
+        # worker weg: alles wat nog openstaat faalt i.p.v. eeuwig te wachten
+        with self.lock:
+            pending, self.pending = self.pending, {}
+        for fut, block in pending.values():
+            self._on_reply(self, None, fut, block)
+
+
+class VisionPool:
+    """
+    pool = VisionPool(workers=4)
+    fut  = pool.submit("detect_image", frame, bot_id=2, image_name="XP.png", area_name="Info_Area")
+    hit  = fut.result()
+
+    - frame.rgb wordt naar een shared_memory blok gekopieerd (geef een area-view mee, niet de hele desktop)
+    - taken van dezelfde bot gaan altijd naar dezelfde worker (warme roi_tracker per bot)
+    - resultaten (Match, dict, lijst) komen gepickled terug over de pipe van die worker
+    """
+
+    def __init__(self, workers: Optional[int] = None, preload: Optional[Iterable[str]] = None):
+        ctx = mp.get_context("spawn")  # fork + threads (capture/input) is onveilig; spawn werkt overal
+        self._blocks = _BlockPool()
+        self._ids = itertools.count(1)
+        names = list(preload) if preload is not None else None
+        self._workers = [_Worker(ctx, i, names, self._reply) for i in range(max(1, int(workers or DEFAULT_WORKERS)))]
+        self._closed = False
+
+    @property
+    def workers(self) -> int:
+        return len(self._workers)
+
+    def submit(self, kind: str, frame: Frame, bot_id: int = 1, **kwargs) -> Future:
+        if self._closed:
+            raise RuntimeError("vision pool is gesloten")
+        if kind not in TASKS:
+            raise KeyError(f"onbekende vision taak: {kind}")
+
+        rgb = frame.rgb
+        block = self._blocks.acquire(rgb.nbytes)
+        # bericht: (req_id, taak, (shm naam, shape, ts, seq, origin), bot_id, kwargs)
+        ref = block.write(rgb) + (frame.ts, frame.seq, tuple(frame.origin))
+
+        fut: Future = futures.Future()
+        fut.set_running_or_notify_cancel()
+        w = self._workers[int(bot_id) % len(self._workers)]
+        req_id = next(self._ids)
+        with w.lock:
+            w.pending[req_id] = (fut, block)
+            try:
+                w.conn.send((req_id, kind, ref, int(bot_id), kwargs))
+            except BaseException:
+                w.pending.pop(req_id, None)
+                self._blocks.release(block)
+                raise
+        return fut
+
+    def run(self, kind: str, frame: Frame, bot_id: int = 1, **kwargs) -> Any:
+        return self.submit(kind, frame, bot_id, **kwargs).result()
+
+    def _reply(self, w: _Worker, reply: Optional[tuple], fut: Optional[Future] = None, block: Optional[_Block] = None) -> None:
+        if reply is not None:
+            req_id, ok, payload = reply
+            with w.lock:
+                item = w.pending.pop(req_id, None)
+            if item is None:
+                return
+            fut, block = item
+        else:
+            ok, payload = False, RuntimeError(f"vision worker {w.proc.name} gestopt (exitcode={w.proc.exitcode})")
+
+        self._blocks.release(block)
+        if ok:
+            fut.set_result(payload)
+        else:
+            fut.set_exception(payload)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        for w in self._workers:
+            try:
+                with w.lock:
+                    w.conn.send(None)
+            except OSError:
+                pass
+        for w in self._workers:
+            w.proc.join(timeout=5)
+            if w.proc.is_alive():
+                w.proc.terminate()
+            w.conn.close()
+            w.reader.join(timeout=1)
+        self._blocks.close()
+
+    def __enter__(self) -> "VisionPool":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+_POOL: Optional[VisionPool] = None
+# === END CORE LOGIC ===
+
+
+# === START API ===
+# • WAT: gedeelde pool aan/uit; detect_image/detect_many/detect_colour(s)/find_all_hits dispatchen zelf.
+# • WAAROM: flows en scheduler hoeven niets te veranderen; zonder pool blijft alles in-process.
+def start_vision_pool(workers: Optional[int] = None, preload: Optional[Iterable[str]] = None) -> VisionPool:
+    """preload=None => alle templates uit de template store warm laden."""
+    global _POOL
+    stop_vision_pool()
+    _POOL = VisionPool(workers=workers, preload=preload)
+    return _POOL
+
+
+def stop_vision_pool() -> None:
+    global _POOL
+    if _POOL is not None:
+        pool, _POOL = _POOL, None
+        pool.close()
+
+
+def active_pool() -> Optional[VisionPool]:
+    return _POOL
+
+
+def area_frame(rgb: np.ndarray, origin: Tuple[int, int] = (0, 0), frame: Optional[Frame] = None) -> Frame:
+    """Losse area-pixels als Frame voor submit(); ts/seq van het bron-frame blijven behouden."""
+    if frame is not None:
+        return Frame(rgb=rgb, ts=frame.ts, seq=frame.seq, origin=origin)
+    return Frame(rgb=rgb, ts=0.0, seq=0, origin=origin)
+# === END API ===
+
+
+# === START CLI TEST ===
+# • WAT: veilige handmatige test.
+# • WAAROM: zelfde Match in-process en via de pool, plus round-trip tijd per taak.
+if __name__ == "__main__":
+    import time
+
+    from core.area_registry import area_box
+    from vision.compiled_template import get_compiled_template
+    from vision.image_detection import detect_image
+
+    # synthetisch frame: ruis met XP.png in de Info_Area van bot 1
+    box = area_box("Info_Area", 1)
+    rng = np.random.default_rng(0)
+    rgb = rng.integers(40, 110, (1080, 1920, 3), dtype=np.uint8)
+    tpl = get_compiled_template("XP.png").rgb
+    rgb[box[1] + 30:box[1] + 30 + tpl.shape[0], box[0] + 100:box[0] + 100 + tpl.shape[1]] = tpl
+    frame = Frame(rgb=rgb, ts=time.monotonic(), seq=1)
+
+    local = detect_image("XP.png", "Info_Area", frame=frame, verbose="off")
+
+    with VisionPool(workers=2, preload=["XP.png"]) as pool:
+        sub = area_frame(frame.view(box), frame.view_origin(box), frame)
+        remote = pool.run("detect_image", sub, 1, image_name="XP.png", area_name="Info_Area")
+
+        t0 = time.perf_counter()
+        n = 200
+        for i in range(n):
+            pool.run("detect_image", sub, 1, image_name="XP.png", area_name="Info_Area")
+        ms = (time.perf_counter() - t0) * 1000 / n
+
+    print(f"{'🟢' if local == remote else '🔴'} in-process={local} pool={remote} | {ms:.2f} ms/taak (round-trip)")
+# === END CLI TEST ===
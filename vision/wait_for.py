@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+# === START BOOTSTRAP ===
+# • WAT: zorgt dat imports vanuit project-root werken bij direct runnen.
+# • WAAROM: maakt module portable voor CLI tests zonder hardcoded paden.
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# === END BOOTSTRAP ===
+
+
+# === START IMPORTS ===
+# • WAT: alle externe/standaard imports die deze module nodig heeft.
+# • WAAROM: centraal en voorspelbaar, voorkomt verborgen dependencies.
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+import time
+
+from core.lazy_import import lazy_module
+asyncio = lazy_module("asyncio")
+cv2 = lazy_module("cv2")
+np = lazy_module("numpy")
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+from helpers.random_sleep import async_sleep
+from vision.frame_capture import Frame, FrameCapture, ThreadedCapture, running_capture
+# === END IMPORTS ===
+
+
+# === START CONSTANTS ===
+# • WAT: defaults voor frame-diff en backoff.
+# • WAAROM: statische schermen zo goedkoop mogelijk, veranderingen zo snel mogelijk zien.
+DIFF_DOWNSAMPLE = 4          # blok-gemiddelde van 4x4 px (INTER_AREA)
+DIFF_THRESHOLD = 6           # max abs verschil (0..255) per blok dat nog als "gelijk" telt
+MIN_POLL_SEC = 0.03          # poll interval direct na een verandering
+MAX_POLL_SEC = 0.25          # plafond op statisch scherm
+BACKOFF_FACTOR = 1.5
+MAX_SKIP_SEC = 1.0           # vangnet: ook bij statisch scherm minstens zo vaak de conditie draaien
+
+Box = Tuple[int, int, int, int]  # (x1, y1, x2, y2) schermcoördinaten
+T = TypeVar("T")
+# === END CONSTANTS ===
+
+
+# === START HELPERS ===
+# • WAT: adaptieve backoff + goedkope "is de area veranderd" check.
+# • WAAROM: matching alleen draaien als de pixels echt anders zijn.
+class Backoff:
+    """min_sec na een verandering, daarna x factor per statische poll tot max_sec."""
+
+    def __init__(self, min_sec: float = MIN_POLL_SEC, max_sec: float = MAX_POLL_SEC, factor: float = BACKOFF_FACTOR):
+        self.min_sec = float(min_sec)
+        self.max_sec = max(float(max_sec), self.min_sec)
+        self.factor = max(1.0, float(factor))
+        self.current = self.min_sec
+
+    def reset(self) -> float:
+        self.current = self.min_sec
+        return self.current
+
+    def grow(self) -> float:
+        self.current = min(self.max_sec, self.current * self.factor)
+        return self.current
+
+
+class FrameDiff:
+    """
+    Signature per box = downsampled gray (INTER_AREA). Veranderd zodra één blok
+    meer dan threshold afwijkt: 1 pixel die 255 verspringt geeft bij 4x4 nog 16.
+    """
+
+    def __init__(self, boxes: Sequence[Box], downsample: int = DIFF_DOWNSAMPLE, threshold: int = DIFF_THRESHOLD):
+        self.boxes = [tuple(int(v) for v in b) for b in boxes]
+        self.downsample = max(1, int(downsample))
+        self.threshold = int(threshold)
+        self._last: Optional[List[np.ndarray]] = None
+        self._pending: Optional[List[np.ndarray]] = None
+
+    def _signature(self, rgb: np.ndarray) -> np.ndarray:
+        gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY) if rgb.ndim == 3 else rgb
+        h, w = gray.shape[:2]
+        sw, sh = max(1, w // self.downsample), max(1, h // self.downsample)
+        return cv2.resize(gray, (sw, sh), interpolation=cv2.INTER_AREA)
+
+    def changed(self, frame: Frame) -> bool:
+        """
+        True bij eerste frame of als een van de boxen zichtbaar afwijkt van de
+        laatste commit() (= laatste evaluatie), zodat langzame drift ook telt.
+        """
+        views = [frame.view(b) for b in self.boxes] if self.boxes else [frame.rgb]
+        sigs = [self._signature(v) for v in views]
+
+        prev, self._pending = self._last, sigs
+        if prev is None or len(prev) != len(sigs):
+            return True
+        for a, b in zip(prev, sigs):
+            if a.shape != b.shape:
+                return True
+            if int(cv2.absdiff(a, b).max(initial=0)) > self.threshold:
+                return True
+        return False
+
+    def commit(self) -> None:
+        """Laatst geziene signatures worden de nieuwe basis."""
+        if self._pending is not None:
+            self._last = self._pending
+
+    def reset(self) -> None:
+        self._last = None
+        self._pending = None
+
+
+def union_region(boxes: Sequence[Box]) -> Optional[Tuple[int, int, int, int]]:
+    """Omhullende van de boxen als (x, y, w, h); None = volledige desktop."""
+    if not boxes:
+        return None
+    x1 = min(b[0] for b in boxes)
+    y1 = min(b[1] for b in boxes)
+    x2 = max(b[2] for b in boxes)
+    y2 = max(b[3] for b in boxes)
+    return (x1, y1, max(1, x2 - x1), max(1, y2 - y1))
+# === END HELPERS ===
+
+
+# === START CORE LOGIC ===
+# • WAT: wacht-loop: frame -> diff -> (alleen bij verandering) conditie -> backoff sleep (sync + asyncio).
+# • WAAROM: vervangt vaste sleep-polling met volledige re-match per iteratie.
+class FrameWaiter:
+    """
+    condition(frame) -> truthy resultaat = klaar (wordt teruggegeven), anders verder wachten.
+
+    watch      = boxen waar de conditie naar kijkt; zijn die pixels gelijk aan de vorige
+                 evaluatie, dan wordt de conditie overgeslagen (max. max_skip_sec lang)
+    capture    = gedeelde FrameCapture; None => draaiende capture thread, anders eigen capture over de omhullende van watch
+                 ThreadedCapture => geen sleep-polling: wachten op het volgende frame uit de ring
+    """
+
+    def __init__(
+        self,
+        watch: Sequence[Box] = (),
+        capture: Optional[FrameCapture] = None,
+        backoff: Optional[Backoff] = None,
+        diff_threshold: int = DIFF_THRESHOLD,
+        max_skip_sec: float = MAX_SKIP_SEC,
+    ):
+        self.diff = FrameDiff(watch, threshold=diff_threshold)
+        self.capture = capture or running_capture() or FrameCapture(max_age=0.0, region=union_region(self.diff.boxes))
+        self.backoff = backoff or Backoff()
+        self.max_skip_sec = float(max_skip_sec)
+
+        # stats van de laatste run()
+        self.evaluated = 0
+        self.skipped = 0
+        self._last_eval = 0.0
+        self._last_seq: Optional[int] = None
+
+    def run(self, condition: Callable[[Frame], Optional[T]], timeout: float = 0.0) -> Optional[T]:
+        """timeout <= 0 => precies 1 evaluatie (zelfde als een directe check)."""
+        deadline = self._begin(timeout)
+        threaded = isinstance(self.capture, ThreadedCapture)
+
+        while True:
+            if threaded and self._last_seq is not None:
+                # producer bepaalt het tempo: wakker zodra er een nieuw frame in de ring staat
+                frame = self.capture.wait_next(self._last_seq, timeout=max(0.0, deadline - time.monotonic()))
+                if frame is None:
+                    return None
+            else:
+                frame = self.capture.get()
+
+            evaluate, changed = self._observe(frame)
+            if evaluate:
+                result = condition(frame)
+                if result:
+                    return result
+                self._evaluated(changed)
+
+            remaining = self._remaining(deadline)
+            if remaining is None:
+                return None
+            if not threaded:
+                time.sleep(min(self.backoff.current, remaining))
+
+    async def run_async(
+        self,
+        condition: Callable[[Frame], Any],
+        timeout: float = 0.0,
+        executor: Optional[Executor] = None,
+    ) -> Optional[T]:
+        """
+        Zelfde loop voor asyncio: grab + sync conditie in `executor`, wachten met async_sleep.
+        condition mag ook een async functie zijn (draait dan op de event loop, bv. met kliks).
+        Annuleren (task.cancel / asyncio.wait_for) stopt de loop bij de volgende await.
+        """
+        loop = asyncio.get_running_loop()
+        is_async = asyncio.iscoroutinefunction(condition)
+        deadline = self._begin(timeout)
+
+        while True:
+            frame = await loop.run_in_executor(executor, self.capture.get)
+
+            evaluate, changed = self._observe(frame)
+            if evaluate:
+                result = await condition(frame) if is_async else await loop.run_in_executor(executor, condition, frame)
+                if result:
+                    return result
+                self._evaluated(changed)
+
+            remaining = self._remaining(deadline)
+            if remaining is None:
+                return None
+            delay = min(self.backoff.current, remaining)
+            if isinstance(self.capture, ThreadedCapture):
+                delay = min(delay, self.capture.period)
+            await async_sleep(delay)
+
+    # --- gedeelde stappen van run/run_async ---
+    def _begin(self, timeout: float) -> Optional[float]:
+        self.evaluated = 0
+        self.skipped = 0
+        self.diff.reset()
+        self.backoff.reset()
+
+        start = time.monotonic()
+        self._last_eval = start
+        self._last_seq = None
+        return start + float(timeout) if timeout and timeout > 0 else None
+
+    def _observe(self, frame: Frame) -> Tuple[bool, bool]:
+        """Returns (conditie draaien?, pixels veranderd?)."""
+        now = time.monotonic()
+
+        # zelfde frame (gedeelde capture nog niet ververst) of zelfde pixels => skip
+        fresh = frame.seq != self._last_seq
+        changed = fresh and self.diff.changed(frame)
+        forced = (now - self._last_eval) >= self.max_skip_sec
+        self._last_seq = frame.seq
+
+        if self.evaluated == 0 or changed or forced:
+            self.diff.commit()
+            self.evaluated += 1
+            self._last_eval = now
+            return True, changed
+
+        self.skipped += 1
+        self.backoff.grow()
+        return False, changed
+
+    def _evaluated(self, changed: bool) -> None:
+        if changed:
+            self.backoff.reset()
+        else:
+            self.backoff.grow()
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        """Resterende tijd, of None als de loop moet stoppen (geen timeout / deadline voorbij)."""
+        if deadline is None:
+            return None
+        remaining = deadline - time.monotonic()
+        return remaining if remaining > 0 else None
+# === END CORE LOGIC ===
+
+
+# === START API ===
+# • WAT: functie-variant voor losse calls.
+# • WAAROM: callers hoeven geen FrameWaiter te beheren.
+def wait_for(
+    condition: Callable[[Frame], Optional[T]],
+    timeout: float,
+    watch: Sequence[Box] = (),
+    capture: Optional[FrameCapture] = None,
+    min_poll: float = MIN_POLL_SEC,
+    max_poll: float = MAX_POLL_SEC,
+) -> Optional[T]:
+    waiter = FrameWaiter(watch=watch, capture=capture, backoff=Backoff(min_poll, max_poll))
+    return waiter.run(condition, timeout)
+# === END API ===
+
+
+# === START CLI TEST ===
+# • WAT: veilige handmatige test.
+# • WAAROM: laat zien hoeveel evaluaties een statisch scherm kost.
+if __name__ == "__main__":
+    from core.area_registry import area_box
+
+    box = area_box("Info_Area", 1)
+    waiter = FrameWaiter(watch=[box])
+    waiter.run(lambda f: None, timeout=3.0)
+    print(f"⏱️ 3s wachten op statisch scherm: evaluaties={waiter.evaluated} overgeslagen={waiter.skipped}")
+# === END CLI TEST ===